@@ -1,13 +1,21 @@
-from flask import Flask, render_template, request, jsonify
-from backend.embeddings import EmbeddingManager
-from backend.scraper import ContentScraper
-from backend.comparison import ContentComparator
-from backend.cerebras_analyzer import CerebrasAnalyzer
-from backend.dkg_publisher import DKGPublisher
-import threading
-import logging
-from datetime import datetime
-import config
+from backend.startup import startup_timer
+
+with startup_timer.phase('imports'):
+    from flask import Flask, render_template, request, jsonify
+    from backend.corpus_index import SOURCES, CorpusIndex
+    from backend.embeddings import EmbeddingManager
+    from backend.model_registry import model_registry
+    from backend.embedding_pool import embedding_pool
+    from backend.scraper import ContentScraper
+    from backend.comparison import ContentComparator
+    from backend.cerebras_analyzer import CerebrasAnalyzer
+    from backend.dkg_publisher import DKGPublisher
+    from backend.pipeline import ScanPipeline
+    from backend.scan_store import ScanStore
+    import threading
+    import logging
+    from datetime import datetime
+    import config
 
 # Configure logging
 logging.basicConfig(
@@ -19,16 +27,77 @@ logger = logging.getLogger(__name__)
 # Initialize Flask app
 app = Flask(__name__)
 
-# Initialize managers
-embedding_manager = EmbeddingManager()
-scraper = ContentScraper()
-comparator = ContentComparator()
-cerebras = CerebrasAnalyzer()
-dkg = DKGPublisher()
-
-# Store scan results in memory (use Redis for production)
+# Managers and scan state, built by create_app(). Nothing is built at import
+# time: spawned worker processes (EMBEDDING_WORKERS, COMPARISON_WORKERS)
+# re-import the launching script as __mp_main__, and must not rebuild the
+# app or start pools of their own
+corpus_index = None
+embedding_manager = None
+scraper = None
+comparator = None
+cerebras = None
+dkg = None
+scan_store = None
 scan_results = {}
 scan_status = {"status": "idle", "progress": 0, "current_topic": ""}
+pipeline = None
+embedding_backend = None
+
+
+def create_app():
+    """
+    Build the managers and scan state and start background loading
+
+    Safe to call more than once; later calls return the same app.
+
+    Returns:
+        The Flask app
+    """
+    global corpus_index, embedding_manager, scraper, comparator, cerebras, dkg
+    global scan_store, scan_results, pipeline, embedding_backend
+
+    if pipeline is not None:
+        return app
+
+    # Heavy libraries (model, sklearn, wikipedia, Cerebras, Pinecone) are
+    # imported by the code paths that first need them
+    with startup_timer.phase('managers'):
+        corpus_index = CorpusIndex()
+        embedding_manager = EmbeddingManager(corpus=corpus_index)
+        scraper = ContentScraper()
+        comparator = ContentComparator(embedding_manager)
+        cerebras = CerebrasAnalyzer()
+        dkg = DKGPublisher()
+
+    # Scan results are kept in memory and persisted per topic for incremental rescans
+    with startup_timer.phase('scan_store'):
+        scan_store = ScanStore()
+        scan_results = scan_store.results
+    pipeline = ScanPipeline(scraper, comparator, cerebras, dkg, scan_store)
+
+    # Embeddings and similarity scores from earlier scans are loaded into the
+    # corpus index in the background; scans keep it current as they run
+    threading.Thread(
+        target=corpus_index.load,
+        args=(
+            embedding_manager, list(scan_results),
+            {
+                topic: result['similarity_score'] for topic, result in scan_results.items()
+                if 'similarity_score' in result and 'error' not in result.get('comparison_metadata', {})
+            }
+        ),
+        name='corpus-index-load', daemon=True
+    ).start()
+
+    # Load the embedding model in the background so the server can start
+    # answering requests right away
+    # With EMBEDDING_WORKERS the models live in the worker processes instead
+    embedding_backend = embedding_pool or model_registry
+    if config.EMBEDDING_WARM_UP:
+        embedding_backend.warm_up_async()
+
+    startup_timer.mark_ready()
+    return app
 
 
 @app.route('/')
@@ -43,32 +112,89 @@ def comparison(topic_name):
     return render_template('comparison.html', topic=topic_name)
 
 
+def _topic_row(topic):
+    """Summarize a topic's scan status for the dashboard"""
+    if topic in scan_results:
+        result = scan_results[topic]
+        return {
+            "name": topic,
+            "similarity": result.get('similarity_score', 0),
+            "discrepancies": len(result.get('discrepancies', [])),
+            "status": "completed",
+            "ai_analysis_available": 'ai_analysis' in result
+        }
+    return {
+        "name": topic,
+        "similarity": 0,
+        "discrepancies": 0,
+        "status": "pending",
+        "ai_analysis_available": False
+    }
+
+
+TOPIC_SORT_KEYS = {
+    'catalog': None,
+    'name': str.casefold,
+    'similarity': lambda topic: scan_results[topic].get('similarity_score', 0) if topic in scan_results else 0,
+    'discrepancies': lambda topic: len(scan_results[topic].get('discrepancies', [])) if topic in scan_results else 0,
+}
+
+
 @app.route('/api/topics', methods=['GET'])
 def get_topics():
-    """Get list of all topics with their status"""
+    """
+    Get topics with their status
+    
+    Without paging parameters the full list is returned. With ?page=N the
+    response is one page plus totals, and supports per_page, sort
+    (catalog|name|similarity|discrepancies), order (asc|desc) and status
+    (completed|pending) filters.
+    """
     topics = scraper.get_topics()
-    results = []
-    
-    for topic in topics:
-        if topic in scan_results:
-            result = scan_results[topic]
-            results.append({
-                "name": topic,
-                "similarity": result.get('similarity_score', 0),
-                "discrepancies": len(result.get('discrepancies', [])),
-                "status": "completed",
-                "ai_analysis_available": 'ai_analysis' in result
-            })
-        else:
-            results.append({
-                "name": topic,
-                "similarity": 0,
-                "discrepancies": 0,
-                "status": "pending",
-                "ai_analysis_available": False
-            })
-    
-    return jsonify(results)
+    
+    if 'page' not in request.args and 'per_page' not in request.args:
+        return jsonify([_topic_row(topic) for topic in topics])
+    
+    try:
+        page = max(1, int(request.args.get('page', 1)))
+        per_page = min(500, max(1, int(request.args.get('per_page', 50))))
+    except ValueError:
+        return jsonify({"error": "page and per_page must be integers"}), 400
+    
+    sort = request.args.get('sort', 'catalog')
+    status = request.args.get('status')
+    if sort not in TOPIC_SORT_KEYS or status not in (None, 'completed', 'pending'):
+        return jsonify({"error": "Invalid sort or status filter"}), 400
+    
+    # Completed topics come from the (usually much smaller) results map
+    positions = scraper.catalog.positions
+    completed = sorted((topic for topic in scan_results if topic in positions), key=positions.get)
+    if status == 'completed':
+        topics = completed
+    elif status == 'pending':
+        topics = [topic for topic in topics if topic not in scan_results]
+    
+    descending = request.args.get('order', 'asc') == 'desc'
+    if TOPIC_SORT_KEYS[sort]:
+        topics = sorted(topics, key=TOPIC_SORT_KEYS[sort], reverse=descending)
+    elif descending:
+        topics = topics[::-1]
+    
+    start = (page - 1) * per_page
+    similarities = [scan_results[topic].get('similarity_score', 0) for topic in completed]
+    
+    return jsonify({
+        "topics": [_topic_row(topic) for topic in topics[start:start + per_page]],
+        "page": page,
+        "per_page": per_page,
+        "total": len(topics),
+        "summary": {
+            "total_topics": len(positions),
+            "completed": len(completed),
+            "discrepancies": sum(len(scan_results[topic].get('discrepancies', [])) for topic in completed),
+            "avg_similarity": sum(similarities) / len(similarities) if similarities else 0
+        }
+    })
 
 
 @app.route('/api/scan', methods=['POST'])
@@ -77,60 +203,12 @@ def start_scan():
     if scan_status["status"] == "processing":
         return jsonify({"error": "Scan already in progress"}), 409
     
+    # Incremental by default; POST {"full": true} to recompute every stage
+    options = request.get_json(silent=True) or {}
+    incremental = config.INCREMENTAL_SCAN and not options.get('full')
+    
     def run_scan():
-        scan_status["status"] = "processing"
-        topics = scraper.get_topics()
-        
-        for i, topic in enumerate(topics):
-            scan_status["current_topic"] = topic
-            scan_status["progress"] = int((i / len(topics)) * 100)
-            
-            try:
-                # Fetch content
-                wiki = scraper.fetch_wikipedia(topic)
-                grok = scraper.fetch_grokipedia(topic)
-                
-                if not wiki or not grok:
-                    logger.warning(f"⚠ Skipping {topic}: content fetch failed")
-                    continue
-                
-                # Vector comparison
-                comparison = comparator.compare_topics(topic, wiki['content'], grok['content'])
-                
-                # Store content for AI analysis
-                comparison['wiki_content'] = wiki['content']
-                comparison['grok_content'] = grok['content']
-                comparison['topic'] = topic
-                
-                # AI-powered analysis with Cerebras
-                ai_analysis = cerebras.analyze_discrepancies(
-                    topic, wiki['content'], grok['content'], comparison['discrepancies']
-                )
-                comparison['ai_analysis'] = ai_analysis['ai_analysis']
-                
-                # Generate Community Note
-                community_note = cerebras.generate_community_note(
-                    topic, comparison['similarity_score'],
-                    comparison['discrepancies'], ai_analysis['ai_analysis']
-                )
-                comparison['community_note'] = community_note
-                
-                # Publish to DKG
-                ual = dkg.publish_community_note(
-                    topic, comparison['discrepancies'],
-                    comparison['similarity_score'], comparison['ai_analysis']
-                )
-                comparison['ual'] = ual
-                
-                scan_results[topic] = comparison
-                logger.info(f"✓ Completed: {topic}")
-                
-            except Exception as e:
-                logger.error(f"✗ Error scanning {topic}: {str(e)}")
-                continue
-        
-        scan_status["status"] = "completed"
-        scan_status["progress"] = 100
+        pipeline.run(scraper.get_topics(), scan_status, incremental=incremental)
     
     # Run scan in background thread
     thread = threading.Thread(target=run_scan)
@@ -140,6 +218,88 @@ def start_scan():
     return jsonify({"status": "scanning", "job_id": "scan_001"})
 
 
+@app.route('/api/ready', methods=['GET'])
+def get_readiness():
+    """Report whether the embedding model is loaded (503 until it is)"""
+    status = embedding_backend.status()
+    return jsonify(status), 200 if status["ready"] else 503
+
+
+@app.route('/api/startup', methods=['GET'])
+def get_startup_report():
+    """Report startup phase timings and the embedding model load time"""
+    return jsonify(startup_timer.report(embedding_backend))
+
+
+@app.route('/api/similar/<topic_name>', methods=['GET'])
+def get_similar_topics(topic_name):
+    """
+    Find topics whose articles are nearest to a topic's article
+    
+    ?source= picks which of the topic's articles to search with and
+    ?against= which source to search (both default to grokipedia);
+    ?limit= caps the number of results (default 10).
+    """
+    source = request.args.get('source', 'grokipedia')
+    against = request.args.get('against', source)
+    if source not in SOURCES or against not in SOURCES:
+        return jsonify({"error": f"source and against must be one of {', '.join(SOURCES)}"}), 400
+    try:
+        limit = min(100, max(1, int(request.args.get('limit', 10))))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    
+    matches = corpus_index.nearest(topic_name, source, against, limit)
+    if matches is None:
+        return jsonify({"error": "No embedding for topic"}), 404
+    
+    return jsonify({
+        "topic": topic_name,
+        "source": source,
+        "against": against,
+        "similar": [{"name": topic, "similarity": score} for topic, score in matches]
+    })
+
+
+@app.route('/api/divergent', methods=['GET'])
+def get_divergent_topics():
+    """Topics whose Wikipedia and Grokipedia articles diverge most (?limit=, default 10)"""
+    try:
+        limit = min(100, max(1, int(request.args.get('limit', 10))))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    
+    return jsonify([
+        {"name": topic, "similarity": score, "divergence": 1 - score}
+        for topic, score in corpus_index.divergent(limit)
+    ])
+
+
+@app.route('/api/duplicates/<topic_name>', methods=['GET'])
+def get_duplicate_topics(topic_name):
+    """
+    Find other topics' articles sharing near-duplicate passages with a topic
+
+    ?source= picks which of the topic's articles to search with (default
+    grokipedia); ?limit= caps the number of results (default 10).
+    """
+    if comparator.signatures is None:
+        return jsonify({"error": "Near-duplicate detection is disabled"}), 404
+    source = request.args.get('source', 'grokipedia')
+    if source not in SOURCES:
+        return jsonify({"error": f"source must be one of {', '.join(SOURCES)}"}), 400
+    try:
+        limit = min(100, max(1, int(request.args.get('limit', 10))))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    matches = comparator.signatures.find_duplicates(topic_name, source, limit=limit)
+    if matches is None:
+        return jsonify({"error": "No signatures for topic"}), 404
+
+    return jsonify({"topic": topic_name, "source": source, "duplicates": matches})
+
+
 @app.route('/api/scan-status', methods=['GET'])
 def get_scan_status():
     """Get current scan status"""
@@ -172,4 +332,5 @@ def publish_to_dkg():
 
 if __name__ == '__main__':
     logger.info("🚀 Starting Wikipedia vs Grokipedia Comparison System")
+    create_app()
     app.run(debug=config.FLASK_DEBUG, port=config.FLASK_PORT, host='0.0.0.0')
@@ -0,0 +1,175 @@
+import logging
+import re
+import numpy as np
+from backend.document import as_document
+import config
+
+logger = logging.getLogger(__name__)
+
+# A sentence runs to terminal punctuation (plus closing quotes/brackets) that
+# is followed by a capitalized word, or to the end of its line; "U.S. was" and
+# "e.g. more" do not end sentences
+SENTENCE_PATTERN = re.compile(
+    r'\S[^\n]*?(?:[.!?]+["\')\]]*(?=[ \t]+["\'(\[]?[A-Z0-9])|(?=[ \t]*(?:\n|$)))'
+)
+
+# Rows of the similarity matrix computed at once (bounds memory to BLOCK × n)
+BLOCK_SIZE = 1024
+
+SOURCE_NAMES = {'wikipedia': 'Wikipedia', 'grokipedia': 'Grokipedia'}
+
+
+def split_sentences(text, min_words=None):
+    """
+    Segment text into sentences with character offsets
+
+    Args:
+        text: Article text
+        min_words: Skip fragments shorter than this (headings, captions);
+            defaults to config.ALIGNMENT_MIN_WORDS
+
+    Returns:
+        list of (start, end) offsets into text
+    """
+    min_words = config.ALIGNMENT_MIN_WORDS if min_words is None else min_words
+    spans = []
+    for match in SENTENCE_PATTERN.finditer(text):
+        start, end = match.span()
+        if len(text[start:end].split()) >= min_words:
+            spans.append((start, end))
+    return spans
+
+
+def top_k_matches(queries, candidates, k):
+    """
+    Best k candidates for every query row, by cosine similarity
+
+    The similarity matrix is computed BLOCK_SIZE query rows at a time and
+    reduced with argpartition, so memory stays bounded and no Python loop
+    runs per sentence.
+
+    Args:
+        queries: (m, d) L2-normalized matrix
+        candidates: (n, d) L2-normalized matrix
+        k: Matches per query (capped at n)
+
+    Returns:
+        (scores, indices): (m, k) arrays, best match first in each row
+    """
+    k = min(k, len(candidates))
+    scores = np.empty((len(queries), k), dtype=np.float32)
+    indices = np.empty((len(queries), k), dtype=np.int64)
+
+    for start in range(0, len(queries), BLOCK_SIZE):
+        block = queries[start:start + BLOCK_SIZE] @ candidates.T
+        best = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(block, best, axis=1)
+        order = np.argsort(-best_scores, axis=1)
+        scores[start:start + len(block)] = np.take_along_axis(best_scores, order, axis=1)
+        indices[start:start + len(block)] = np.take_along_axis(best, order, axis=1)
+
+    return scores, indices
+
+
+def _normalize(vectors):
+    return vectors / np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+
+
+class SentenceAligner:
+    """
+    Locates claims one article makes that the other does not
+
+    Both articles are split into sentences and every sentence of every
+    topic in a batch is embedded in one call. Each sentence is matched to
+    its most similar sentences in the other article; sentences whose best
+    match stays under the threshold are reported as 'claim' discrepancies,
+    with character offsets into their article.
+    """
+
+    def __init__(self, embedding_manager, threshold=None, top_k=None, max_claims=None):
+        self.embedding_manager = embedding_manager
+        self.threshold = threshold if threshold is not None else config.ALIGNMENT_THRESHOLD
+        self.top_k = top_k or config.ALIGNMENT_TOP_K
+        self.max_claims = max_claims or config.ALIGNMENT_MAX_CLAIMS
+
+    def align_batch(self, items):
+        """
+        Find unmatched sentences for many topics
+
+        Args:
+            items: List of (topic, wiki_content, grok_content) tuples of
+                Documents (or texts)
+
+        Returns:
+            list (in input order) of claim discrepancy lists, or None for a
+            topic whose sentences could not be embedded
+        """
+        items = [(topic, as_document(wiki), as_document(grok)) for topic, wiki, grok in items]
+        spans = [(wiki.sentences, grok.sentences) for _, wiki, grok in items]
+        texts = [
+            document.text[start:end]
+            for (_, wiki, grok), (wiki_spans, grok_spans) in zip(items, spans)
+            for document, side in ((wiki, wiki_spans), (grok, grok_spans))
+            for start, end in side
+        ]
+        embeddings = self.embedding_manager.generate_embeddings(texts) if texts else None
+
+        results = []
+        offset = 0
+        for (topic, wiki, grok), (wiki_spans, grok_spans) in zip(items, spans):
+            wiki_end = offset + len(wiki_spans)
+            grok_end = wiki_end + len(grok_spans)
+
+            if not wiki_spans or not grok_spans:
+                results.append([])
+            elif embeddings is None:
+                logger.error(f"✗ Failed to embed sentences for {topic}")
+                results.append(None)
+            else:
+                wiki_vectors = _normalize(embeddings[offset:wiki_end])
+                grok_vectors = _normalize(embeddings[wiki_end:grok_end])
+                claims = (
+                    self._unmatched('wikipedia', wiki.text, wiki_spans, wiki_vectors, grok_spans, grok_vectors)
+                    + self._unmatched('grokipedia', grok.text, grok_spans, grok_vectors, wiki_spans, wiki_vectors)
+                )
+                claims.sort(key=lambda claim: claim['similarity'])
+                results.append(claims[:self.max_claims])
+            offset = grok_end
+        return results
+
+    def _unmatched(self, source, content, spans, vectors, other_spans, other_vectors):
+        """Claim discrepancies for one side's sentences lacking a close match"""
+        scores, indices = top_k_matches(vectors, other_vectors, self.top_k)
+        other = 'grokipedia' if source == 'wikipedia' else 'wikipedia'
+
+        # Only the worst max_claims per side can make the final cut
+        unmatched = np.flatnonzero(scores[:, 0] < self.threshold)
+        unmatched = unmatched[np.argsort(scores[unmatched, 0])[:self.max_claims]]
+
+        claims = []
+        for i in unmatched:
+            start, end = spans[i]
+            best = float(scores[i, 0])
+            sentence = content[start:end]
+            preview = sentence if len(sentence) <= 160 else sentence[:157] + '...'
+            claims.append({
+                'type': 'claim',
+                'severity': 'high' if best < self.threshold / 2 else 'medium',
+                'description': (
+                    f'{SOURCE_NAMES[source]} states something with no close match in '
+                    f'{SOURCE_NAMES[other]} (best similarity {best:.2f}): "{preview}"'
+                ),
+                'source': source,
+                'start': start,
+                'end': end,
+                'similarity': best,
+                'matches': [
+                    {
+                        'start': other_spans[j][0],
+                        'end': other_spans[j][1],
+                        'similarity': float(score)
+                    }
+                    for score, j in zip(scores[i], indices[i])
+                ]
+            })
+        return claims
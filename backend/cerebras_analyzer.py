@@ -1,5 +1,5 @@
-from cerebras.cloud.sdk import Cerebras
 from data.api_keys import key_rotator
+from backend.document import as_document
 import config
 import re
 import logging
@@ -18,6 +18,8 @@ class CerebrasAnalyzer:
     
     def _get_client(self):
         """Get Cerebras client with load-balanced API key"""
+        from cerebras.cloud.sdk import Cerebras
+        
         api_key = key_rotator.get_next_key()
         return Cerebras(api_key=api_key)
     
@@ -33,8 +35,8 @@ class CerebrasAnalyzer:
         
         Args:
             topic: Topic name
-            wiki_content: Wikipedia article text
-            grok_content: Grokipedia article text
+            wiki_content: Wikipedia article Document (or text)
+            grok_content: Grokipedia article Document (or text)
             discrepancies: List of detected discrepancies from comparison.py
             
         Returns:
@@ -44,8 +46,8 @@ class CerebrasAnalyzer:
             client = self._get_client()
             
             # Truncate long texts for efficiency
-            wiki_snippet = wiki_content[:1500] if len(wiki_content) > 1500 else wiki_content
-            grok_snippet = grok_content[:1500] if len(grok_content) > 1500 else grok_content
+            wiki_snippet = as_document(wiki_content).excerpt
+            grok_snippet = as_document(grok_content).excerpt
             
             prompt = f"""You are a fact-checking expert analyzing content for accuracy and bias.
 
@@ -0,0 +1,53 @@
+import config
+
+
+def split_passages(text, max_words=None, overlap=None):
+    """
+    Split an article into passages short enough to embed without truncation
+
+    Paragraphs (lines) are packed together up to max_words words; a
+    paragraph longer than that is cut into windows of max_words words
+    that overlap by `overlap` words, so no sentence is lost at a cut.
+
+    Args:
+        text: Article text
+        max_words: Maximum words per passage (defaults to config.CHUNK_WORDS)
+        overlap: Words shared by consecutive windows of one long paragraph
+            (defaults to config.CHUNK_OVERLAP_WORDS)
+
+    Returns:
+        list of passage strings (empty for empty text)
+    """
+    max_words = max_words or config.CHUNK_WORDS
+    overlap = config.CHUNK_OVERLAP_WORDS if overlap is None else overlap
+    step = max(1, max_words - overlap)
+
+    passages = []
+    current = []
+    for line in text.split('\n'):
+        words = line.split()
+        if not words:
+            continue
+
+        if len(current) + len(words) <= max_words:
+            current.extend(words)
+            continue
+
+        if current:
+            passages.append(' '.join(current))
+            current = []
+
+        if len(words) <= max_words:
+            current = words
+        else:
+            for start in range(0, len(words) - overlap, step):
+                window = words[start:start + max_words]
+                if len(window) == max_words or start == 0:
+                    passages.append(' '.join(window))
+                else:
+                    # Short tail: carry it over to pack with the next paragraph
+                    current = window
+
+    if current:
+        passages.append(' '.join(current))
+    return passages
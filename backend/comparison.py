@@ -1,34 +1,533 @@
 import logging
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import TfidfVectorizer
+from backend.alignment import SentenceAligner
+from backend.comparison_pool import analyze_texts, comparison_pool
+from backend.document import as_document
 from backend.embeddings import EmbeddingManager
+from backend.keyword_model import KeywordModel
+from backend.minhash import SignatureStore, best_matches
+from backend.sections import diff_sections
+import config
 
 logger = logging.getLogger(__name__)
 
+# Rule thresholds shared by the batch and single-topic paths
+LENGTH_DIFF_RATIO = 0.3
+KEYWORD_OVERLAP_RATIO = 0.6
+STRUCTURE_DIFF_RATIO = 0.5
+
+# Section changes: severity, description, and how each section is listed
+SECTION_CHANGES = {
+    'removed': ('medium', 'Grokipedia has no counterpart for {count} Wikipedia section(s)', '"{title}" ({words} words)'),
+    'added': ('low', 'Grokipedia adds {count} section(s) not in Wikipedia', '"{title}" ({words} words)'),
+    'rewritten': (
+        'medium', '{count} matching section(s) are largely rewritten',
+        '"{title}" ({similarity:.0%} shared, {words_removed} words removed, {words_added} added)'
+    )
+}
+# Section titles listed in a section discrepancy's description
+LISTED_SECTIONS = 5
+
+# Passage overlap classes, with the severity and wording of their discrepancy
+OVERLAP_CLASSES = {
+    'copied': ('low', 'is near-verbatim Wikipedia text'),
+    'paraphrased': ('low', 'rewords Wikipedia text'),
+    'novel': ('medium', 'has no lexical counterpart in Wikipedia')
+}
+
+
+def document_stats(items):
+    """
+    Per-article statistics the discrepancy rules need, as aligned arrays
+
+    Args:
+        items: List of (topic, wiki_content, grok_content) tuples of
+            Documents (or texts)
+
+    Returns:
+        dict of int64 arrays (one entry per topic): wiki_length, grok_length,
+        wiki_lines, grok_lines
+    """
+    count = len(items)
+    stats = {key: np.empty(count, dtype=np.int64) for key in ('wiki_length', 'grok_length', 'wiki_lines', 'grok_lines')}
+    for i, (_, wiki_content, grok_content) in enumerate(items):
+        wiki, grok = as_document(wiki_content), as_document(grok_content)
+        stats['wiki_length'][i] = wiki.length
+        stats['grok_length'][i] = grok.length
+        stats['wiki_lines'][i] = wiki.line_count
+        stats['grok_lines'][i] = grok.line_count
+    return stats
+
+
+def keyword_overlap(keywords):
+    """
+    Jaccard overlap of each topic's keyword sets
+
+    Args:
+        keywords: List of (wiki_keywords, grok_keywords) sets
+
+    Returns:
+        float64 array, NaN where either side has no keywords
+    """
+    overlap = np.full(len(keywords), np.nan)
+    for i, (wiki_keywords, grok_keywords) in enumerate(keywords):
+        if wiki_keywords and grok_keywords:
+            overlap[i] = len(wiki_keywords & grok_keywords) / len(wiki_keywords | grok_keywords)
+    return overlap
+
+
+def cosine_similarities(wiki_embeddings, grok_embeddings):
+    """
+    Row-wise cosine similarity of two aligned embedding matrices
+
+    Args:
+        wiki_embeddings: (N, d) array
+        grok_embeddings: (N, d) array
+
+    Returns:
+        float64 array of N similarities (0 where a vector is all zeros)
+    """
+    wiki_embeddings = np.asarray(wiki_embeddings, dtype=np.float64)
+    grok_embeddings = np.asarray(grok_embeddings, dtype=np.float64)
+    norms = np.linalg.norm(wiki_embeddings, axis=1) * np.linalg.norm(grok_embeddings, axis=1)
+    dots = np.einsum('ij,ij->i', wiki_embeddings, grok_embeddings)
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+
+def rule_discrepancies(stats, overlap=None, structural=True):
+    """
+    Apply the length, keyword and structural rules to many topics at once
+
+    Every rule is evaluated as one array expression over all topics; dicts
+    are only built for the topics a rule flags.
+
+    Args:
+        stats: document_stats() arrays
+        overlap: keyword_overlap() array (optional; keyword rule skipped if None)
+        structural: Apply the line-break count rule (off when the section
+            diff reports structure instead)
+
+    Returns:
+        list (in input order) of discrepancy lists of {type, severity, description}
+    """
+    wiki_len, grok_len = stats['wiki_length'], stats['grok_length']
+    wiki_lines, grok_lines = stats['wiki_lines'], stats['grok_lines']
+    discrepancies = [[] for _ in range(len(wiki_len))]
+
+    # 1. Length Discrepancy
+    max_len = np.maximum(wiki_len, grok_len)
+    length_ratio = np.divide(
+        np.abs(wiki_len - grok_len), max_len, out=np.zeros(len(max_len)), where=max_len > 0
+    )
+    for i in np.flatnonzero(length_ratio > LENGTH_DIFF_RATIO):
+        discrepancies[i].append({
+            'type': 'length',
+            'severity': 'medium',
+            'description': f'Significant length difference: Wikipedia has {wiki_len[i]} chars, Grokipedia has {grok_len[i]} chars ({length_ratio[i]*100:.1f}% difference)'
+        })
+
+    # 2. Keyword Mismatch (NaN compares False, so topics without keywords pass)
+    if overlap is not None:
+        for i in np.flatnonzero(overlap < KEYWORD_OVERLAP_RATIO):
+            discrepancies[i].append({
+                'type': 'keyword',
+                'severity': 'high',
+                'description': f'Low keyword overlap: only {overlap[i]*100:.1f}% of key terms match between sources'
+            })
+
+    # 3. Structural Differences
+    if not structural:
+        return discrepancies
+    structural = np.abs(wiki_lines - grok_lines) > np.maximum(wiki_lines, grok_lines) * STRUCTURE_DIFF_RATIO
+    for i in np.flatnonzero(structural):
+        discrepancies[i].append({
+            'type': 'structural',
+            'severity': 'low',
+            'description': f'Different content structure: Wikipedia has {wiki_lines[i]} line breaks, Grokipedia has {grok_lines[i]}'
+        })
+
+    return discrepancies
+
+
+def compare_arrays(wiki_embeddings, grok_embeddings, stats, overlap=None, structural=True):
+    """
+    Score N topics in one vectorized pass
+
+    Args:
+        wiki_embeddings: (N, d) Wikipedia article embeddings
+        grok_embeddings: (N, d) Grokipedia article embeddings, aligned by row
+        stats: document_stats() arrays for the same N topics
+        overlap: keyword_overlap() array (optional)
+        structural: Apply the line-break count rule
+
+    Returns:
+        (similarity_scores, discrepancies): float64 array of N cosine
+        similarities and the rule_discrepancies() lists
+    """
+    return cosine_similarities(wiki_embeddings, grok_embeddings), rule_discrepancies(stats, overlap, structural)
+
+
+def passage_overlap(grok_signatures, grok_weights, wiki_signatures, copy_threshold=None, paraphrase_threshold=None):
+    """
+    Classify Grokipedia passages as copied, paraphrased or novel
+
+    Each Grokipedia passage is matched (through banded LSH) to its closest
+    Wikipedia passage by estimated shingle Jaccard similarity.
+
+    Args:
+        grok_signatures: (n, NUM_PERM) MinHash signatures of Grokipedia passages
+        grok_weights: Word count of each Grokipedia passage
+        wiki_signatures: (m, NUM_PERM) MinHash signatures of Wikipedia passages
+        copy_threshold: Jaccard at or above which a passage is copied
+        paraphrase_threshold: Jaccard below which a passage is novel
+
+    Returns:
+        dict mapping each OVERLAP_CLASSES name to {ratio, passages}: the
+        share of Grokipedia words in that class and the passage indices
+    """
+    copy_threshold = config.COPY_THRESHOLD if copy_threshold is None else copy_threshold
+    paraphrase_threshold = config.PARAPHRASE_THRESHOLD if paraphrase_threshold is None else paraphrase_threshold
+
+    scores, _ = best_matches(grok_signatures, wiki_signatures)
+    masks = {
+        'copied': scores >= copy_threshold,
+        'paraphrased': (scores >= paraphrase_threshold) & (scores < copy_threshold),
+        'novel': scores < paraphrase_threshold
+    }
+    total = max(1, int(np.sum(grok_weights)))
+    return {
+        name: {'ratio': float(np.sum(grok_weights[mask])) / total, 'passages': np.flatnonzero(mask).tolist()}
+        for name, mask in masks.items()
+    }
+
 
 class ContentComparator:
     """Compares Wikipedia and Grokipedia content using vector similarity and NLP"""
     
-    def __init__(self):
-        self.embedding_manager = EmbeddingManager()
+    def __init__(self, embedding_manager=None, mode=None, sentence_alignment=None, pool=None):
+        # Share the app's EmbeddingManager rather than building a second one
+        self.embedding_manager = embedding_manager or EmbeddingManager()
+        # ComparisonWorkerPool for CPU-bound text analysis (None: in-process)
+        self.pool = pool or comparison_pool
+        self.mode = mode or config.COMPARISON_MODE
+        if sentence_alignment is None:
+            sentence_alignment = config.SENTENCE_ALIGNMENT
+        self.aligner = SentenceAligner(self.embedding_manager) if sentence_alignment else None
+        self.keywords = KeywordModel()
+        self.signatures = SignatureStore() if config.NEAR_DUPLICATES else None
+        self.section_diff = config.SECTION_DIFF
+    
+    @property
+    def settings(self):
+        """Settings that change comparison output (part of the stage fingerprint)"""
+        return {
+            'mode': self.mode,
+            'sentence_alignment': self.aligner is not None,
+            'near_duplicates': self.signatures is not None,
+            'section_diff': self.section_diff
+        }
+    
+    def compare_topics_batch(self, items):
+        """
+        Compare many topics, embedding all of their articles in one batch
+        
+        Each article is wrapped in a Document once, so every stage below
+        shares its hashes, counts and segmentations.
+        
+        Args:
+            items: List of (topic, wiki_content, grok_content) tuples of
+                Documents (or texts)
+            
+        Returns:
+            list of compare_topics() results in input order
+        """
+        if not items:
+            return []
+        
+        items = [(topic, as_document(wiki), as_document(grok)) for topic, wiki, grok in items]
+        analysis = self._analyze_texts(items)
+        stats = document_stats(items)
+        overlap = keyword_overlap(self._keyword_sets(items, analysis['counts'] if analysis else None))
+        if self.mode == 'chunked':
+            results = self._compare_chunked_batch(items, stats, overlap)
+        else:
+            results = self._compare_document_batch(items, stats, overlap)
+        
+        features = analysis['topics'] if analysis else None
+        self._add_section_discrepancies(items, results, features)
+        self._add_overlap_discrepancies(items, results, features)
+        self._add_claim_discrepancies(items, results)
+        self._index_similarities(items, results)
+        return results
+    
+    def _analyze_texts(self, items):
+        """
+        Run the CPU-bound text analysis of a batch (on the worker pool if any)
+        
+        Returns:
+            analyze_texts() result, or None if it failed (each stage then
+            computes its own features)
+        """
+        signature_sources = None
+        if self.signatures is not None:
+            signature_sources = [
+                [source for source, text in (('wikipedia', wiki_content), ('grokipedia', grok_content))
+                 if text not in self.signatures]
+                for _, wiki_content, grok_content in items
+            ]
+        
+        if self.pool is not None and len(items) > 1:
+            try:
+                return self.pool.analyze(items, self.section_diff, signature_sources)
+            except Exception as e:
+                logger.warning(f"⚠ Comparison workers failed, analyzing in-process: {str(e)}")
+                self.pool = None
+        
+        try:
+            return analyze_texts(items, self.keywords.get_vectorizer(), self.section_diff, signature_sources)
+        except Exception as e:
+            logger.warning(f"⚠ Text analysis failed: {str(e)}")
+            return None
+    
+    def _add_section_discrepancies(self, items, results, features=None):
+        """
+        Add added/removed/rewritten section discrepancies from a section diff to results
+        
+        Args:
+            items: List of (topic, wiki_content, grok_content) Document tuples
+            results: compare_topics() results for items
+            features: analyze_texts() topic features for items (optional)
+        """
+        if not self.section_diff:
+            return
+        
+        for i, ((topic, wiki_content, grok_content), result) in enumerate(zip(items, results)):
+            if 'error' in result['comparison_metadata']:
+                continue
+            try:
+                diff = features[i]['section_diff'] if features else None
+                if diff is None:
+                    diff = diff_sections(wiki_content, grok_content)
+            except Exception as e:
+                logger.warning(f"⚠ Section diff failed for {topic}: {str(e)}")
+                continue
+            
+            # Section lists stay in the metadata; discrepancies go into LLM
+            # prompts and DKG assets, so they only carry counts
+            result['comparison_metadata']['section_diff'] = {
+                'matched': diff['matched'],
+                **{change: len(diff[change]) for change in SECTION_CHANGES},
+                'sections': {change: diff[change] for change in SECTION_CHANGES}
+            }
+            for change, (severity, summary, label) in SECTION_CHANGES.items():
+                sections = diff[change]
+                if not sections:
+                    continue
+                listed = ', '.join(label.format(**section) for section in sections[:LISTED_SECTIONS])
+                if len(sections) > LISTED_SECTIONS:
+                    listed += f' and {len(sections) - LISTED_SECTIONS} more'
+                result['discrepancies'].append({
+                    'type': 'structural',
+                    'severity': severity,
+                    'description': f'{summary.format(count=len(sections))}: {listed}',
+                    'change': change,
+                    'count': len(sections)
+                })
+            result['comparison_metadata']['discrepancy_count'] = len(result['discrepancies'])
+    
+    def _add_overlap_discrepancies(self, items, results, features=None):
+        """
+        Add copied/paraphrased/novel passage ratios from MinHash signatures to results
+        
+        Args:
+            items: List of (topic, wiki_content, grok_content) Document tuples
+            results: compare_topics() results for items
+            features: analyze_texts() topic features for items (optional)
+        """
+        if self.signatures is None:
+            return
+        
+        for i, ((topic, wiki_content, grok_content), result) in enumerate(zip(items, results)):
+            if 'error' in result['comparison_metadata']:
+                continue
+            computed = features[i]['signatures'] if features else {}
+            try:
+                wiki_signatures, _ = self.signatures.get(
+                    topic, 'wikipedia', wiki_content, computed.get('wikipedia')
+                )
+                grok_signatures, grok_weights = self.signatures.get(
+                    topic, 'grokipedia', grok_content, computed.get('grokipedia')
+                )
+                classes = passage_overlap(grok_signatures, grok_weights, wiki_signatures)
+            except Exception as e:
+                logger.warning(f"⚠ Near-duplicate detection failed for {topic}: {str(e)}")
+                continue
+            
+            # Passage indices stay in the metadata; discrepancies go into LLM
+            # prompts and DKG assets, so they only carry counts and ratios
+            result['comparison_metadata']['passage_overlap'] = {name: info['ratio'] for name, info in classes.items()}
+            result['comparison_metadata']['overlap_passages'] = {name: info['passages'] for name, info in classes.items()}
+            for name, info in classes.items():
+                if not info['passages']:
+                    continue
+                severity, wording = OVERLAP_CLASSES[name]
+                result['discrepancies'].append({
+                    'type': name,
+                    'severity': severity,
+                    'description': (
+                        f"{info['ratio']*100:.1f}% of the Grokipedia article {wording} "
+                        f"({len(info['passages'])} of {len(grok_signatures)} passages)"
+                    ),
+                    'ratio': info['ratio'],
+                    'passage_count': len(info['passages'])
+                })
+            result['comparison_metadata']['discrepancy_count'] = len(result['discrepancies'])
+    
+    def _index_similarities(self, items, results):
+        """Record each scored topic's similarity_score in the corpus index, if any"""
+        corpus = self.embedding_manager.corpus
+        if corpus is None:
+            return
+        for (topic, _, _), result in zip(items, results):
+            if 'error' not in result['comparison_metadata']:
+                corpus.set_similarity(topic, result['similarity_score'])
+    
+    def _add_claim_discrepancies(self, items, results):
+        """Run sentence alignment and append its claim discrepancies to results"""
+        if self.aligner is None:
+            return
+        
+        pending = [
+            (item, result) for item, result in zip(items, results)
+            if 'error' not in result['comparison_metadata']
+        ]
+        if not pending:
+            return
+        
+        try:
+            claims = self.aligner.align_batch([item for item, _ in pending])
+        except Exception as e:
+            logger.error(f"✗ Sentence alignment failed: {str(e)}")
+            return
+        
+        for (item, result), topic_claims in zip(pending, claims):
+            if topic_claims is None:
+                result['comparison_metadata']['alignment_error'] = 'Sentence embedding failed'
+                continue
+            result['discrepancies'].extend(topic_claims)
+            result['comparison_metadata']['discrepancy_count'] = len(result['discrepancies'])
+    
+    def flush(self):
+        """Persist embedding, keyword and signature state at the end of a scan"""
+        self.embedding_manager.flush()
+        self.keywords.flush()
+        if self.signatures is not None:
+            self.signatures.flush()
     
-    def compare_topics(self, topic, wiki_content, grok_content):
+    def _keyword_sets(self, items, counts=None):
+        """
+        Keywords of every topic's article pair, from one sparse transform
+        
+        Args:
+            items: List of (topic, wiki_content, grok_content) Document tuples
+            counts: Term counts of the articles from analyze_texts() (optional)
+            
+        Returns:
+            list of (wiki_keywords, grok_keywords) sets of hashed term ids
+        """
+        try:
+            return self.keywords.paired_keywords(
+                [text for _, wiki_content, grok_content in items for text in (wiki_content, grok_content)],
+                counts=counts
+            )
+        except Exception as e:
+            logger.warning(f"⚠ Keyword analysis failed: {str(e)}")
+            return [(set(), set())] * len(items)
+    
+    def _compare_document_batch(self, items, stats, overlap):
+        """
+        Compare topics with one embedding per article, all in one batch
+        
+        Articles are embedded in one call and every topic is then scored in
+        one compare_arrays() pass.
+        
+        Args:
+            items: List of (topic, wiki_content, grok_content) Document tuples
+            stats: document_stats() arrays for items
+            overlap: keyword_overlap() array for items
+            
+        Returns:
+            list of compare_topics() results in input order
+        """
+        texts = [text for _, wiki_content, grok_content in items for text in (wiki_content, grok_content)]
+        embeddings = self.embedding_manager.generate_embeddings(texts) if items else None
+        
+        if embeddings is None:
+            # Batch encode failed, so let each topic try on its own
+            return [
+                self._compare_document(topic, wiki_content, grok_content, discrepancies=discrepancies)
+                for (topic, wiki_content, grok_content), discrepancies in zip(items, rule_discrepancies(stats, overlap, not self.section_diff))
+            ]
+        
+        wiki_embeddings, grok_embeddings = embeddings[0::2], embeddings[1::2]
+        scores, discrepancies = compare_arrays(
+            wiki_embeddings, grok_embeddings, stats, overlap, structural=not self.section_diff
+        )
+        
+        results = []
+        for i, (topic, wiki_content, grok_content) in enumerate(items):
+            self.embedding_manager.store_embedding(
+                topic, 'wikipedia', wiki_embeddings[i], {'content_length': wiki_content.length}
+            )
+            self.embedding_manager.store_embedding(
+                topic, 'grokipedia', grok_embeddings[i], {'content_length': grok_content.length}
+            )
+            results.append({
+                'similarity_score': float(scores[i]),
+                'discrepancies': discrepancies[i],
+                'comparison_metadata': {
+                    'wiki_length': wiki_content.length,
+                    'grok_length': grok_content.length,
+                    'discrepancy_count': len(discrepancies[i])
+                }
+            })
+            logger.info(f"✓ Compared {topic}: similarity={scores[i]:.2f}, discrepancies={len(discrepancies[i])}")
+        return results
+    
+    def compare_topics(self, topic, wiki_content, grok_content, wiki_embedding=None, grok_embedding=None):
         """
         Compare Wikipedia and Grokipedia content
         
         Args:
             topic: Topic name
-            wiki_content: Wikipedia article text
-            grok_content: Grokipedia article text
+            wiki_content: Wikipedia article Document (or text)
+            grok_content: Grokipedia article Document (or text)
+            wiki_embedding: Precomputed Wikipedia embedding (optional)
+            grok_embedding: Precomputed Grokipedia embedding (optional)
             
         Returns:
             dict with similarity_score, discrepancies, and metadata
         """
+        wiki_content, grok_content = as_document(wiki_content), as_document(grok_content)
+        if wiki_embedding is None and grok_embedding is None:
+            return self.compare_topics_batch([(topic, wiki_content, grok_content)])[0]
+        
+        result = self._compare_document(topic, wiki_content, grok_content, wiki_embedding, grok_embedding)
+        self._add_section_discrepancies([(topic, wiki_content, grok_content)], [result])
+        self._add_overlap_discrepancies([(topic, wiki_content, grok_content)], [result])
+        self._add_claim_discrepancies([(topic, wiki_content, grok_content)], [result])
+        self._index_similarities([(topic, wiki_content, grok_content)], [result])
+        return result
+    
+    def _compare_document(self, topic, wiki_content, grok_content, wiki_embedding=None, grok_embedding=None,
+                          discrepancies=None):
+        """Compare one topic by its whole-article embeddings (compare_topics() result)"""
         try:
             # Generate embeddings
-            wiki_embedding = self.embedding_manager.generate_embedding(wiki_content)
-            grok_embedding = self.embedding_manager.generate_embedding(grok_content)
+            if wiki_embedding is None:
+                wiki_embedding = self.embedding_manager.generate_embedding(wiki_content)
+            if grok_embedding is None:
+                grok_embedding = self.embedding_manager.generate_embedding(grok_content)
             
             if wiki_embedding is None or grok_embedding is None:
                 logger.error(f"✗ Failed to generate embeddings for {topic}")
@@ -41,25 +540,26 @@ class ContentComparator:
             # Store embeddings
             self.embedding_manager.store_embedding(
                 topic, 'wikipedia', wiki_embedding,
-                {'content_length': len(wiki_content)}
+                {'content_length': wiki_content.length}
             )
             self.embedding_manager.store_embedding(
                 topic, 'grokipedia', grok_embedding,
-                {'content_length': len(grok_content)}
+                {'content_length': grok_content.length}
             )
             
             # Calculate cosine similarity
             similarity_score = self._calculate_cosine_similarity(wiki_embedding, grok_embedding)
             
             # Detect discrepancies
-            discrepancies = self._detect_discrepancies(wiki_content, grok_content)
+            if discrepancies is None:
+                discrepancies = self._detect_discrepancies(wiki_content, grok_content)
             
             result = {
                 'similarity_score': float(similarity_score),
                 'discrepancies': discrepancies,
                 'comparison_metadata': {
-                    'wiki_length': len(wiki_content),
-                    'grok_length': len(grok_content),
+                    'wiki_length': wiki_content.length,
+                    'grok_length': grok_content.length,
                     'discrepancy_count': len(discrepancies)
                 }
             }
@@ -75,6 +575,151 @@ class ContentComparator:
                 'comparison_metadata': {'error': str(e)}
             }
     
+    def _compare_chunked_batch(self, items, stats, overlap=None):
+        """
+        Compare topics passage by passage, embedding every passage in one batch
+        
+        Each article is split into passages that fit the model's input, so
+        the whole article is compared rather than its first few hundred
+        tokens. Per topic, one normalized matrix multiply gives the full
+        Wikipedia × Grokipedia passage similarity matrix; each passage's
+        best match measures how well the other source covers it.
+        
+        Args:
+            items: List of (topic, wiki_content, grok_content) Document tuples
+            stats: document_stats() arrays for items
+            overlap: keyword_overlap() array for items (optional)
+            
+        Returns:
+            list of compare_topics() results in input order, each with a
+            passage_alignment entry listing the worst-aligned passages
+        """
+        passages = [(wiki_content.passages, grok_content.passages) for _, wiki_content, grok_content in items]
+        texts = [text for pair in passages for side in pair for text in side]
+        embeddings = self.embedding_manager.generate_embeddings(texts) if texts else None
+        discrepancies = rule_discrepancies(stats, overlap, not self.section_diff)
+        if texts and embeddings is None:
+            logger.warning(f"⚠ Batch passage embedding failed, embedding {len(items)} topics one by one")
+        
+        results = []
+        offset = 0
+        for i, ((topic, wiki_content, grok_content), (wiki_passages, grok_passages)) in enumerate(zip(items, passages)):
+            wiki_end = offset + len(wiki_passages)
+            grok_end = wiki_end + len(grok_passages)
+            
+            vectors = None
+            if not wiki_passages or not grok_passages:
+                error = 'Article has no text'
+            elif embeddings is not None:
+                vectors = embeddings[offset:grok_end]
+            else:
+                # Batch encode failed, so let this topic try on its own
+                vectors = self.embedding_manager.generate_embeddings([*wiki_passages, *grok_passages])
+                error = 'Embedding generation failed'
+            
+            if vectors is None:
+                logger.error(f"✗ Failed to compare passages for {topic}: {error}")
+                results.append({
+                    'similarity_score': 0.0,
+                    'discrepancies': [],
+                    'comparison_metadata': {'error': error}
+                })
+            else:
+                results.append(self._compare_passages(
+                    topic, wiki_content, grok_content, wiki_passages, grok_passages,
+                    vectors[:len(wiki_passages)], vectors[len(wiki_passages):],
+                    discrepancies[i]
+                ))
+            offset = grok_end
+        return results
+    
+    def _compare_passages(self, topic, wiki_content, grok_content, wiki_passages, grok_passages,
+                          wiki_vectors, grok_vectors, discrepancies=None):
+        """
+        Score one topic from its passage embeddings
+        
+        Returns:
+            compare_topics() result dict
+        """
+        try:
+            wiki_vectors = wiki_vectors / np.clip(np.linalg.norm(wiki_vectors, axis=1, keepdims=True), 1e-12, None)
+            grok_vectors = grok_vectors / np.clip(np.linalg.norm(grok_vectors, axis=1, keepdims=True), 1e-12, None)
+            similarity = wiki_vectors @ grok_vectors.T
+            
+            # How well each passage is covered by its best match on the other side
+            wiki_best = similarity.max(axis=1)
+            grok_best = similarity.max(axis=0)
+            
+            # Document score: coverage of both articles, weighted by passage length
+            wiki_weights = np.array([len(text.split()) for text in wiki_passages], dtype=np.float32)
+            grok_weights = np.array([len(text.split()) for text in grok_passages], dtype=np.float32)
+            similarity_score = float(
+                (wiki_best @ wiki_weights + grok_best @ grok_weights)
+                / (wiki_weights.sum() + grok_weights.sum())
+            )
+            
+            # Document embeddings for the vector store: mean of passage vectors
+            for source, vectors, content in (
+                ('wikipedia', wiki_vectors, wiki_content), ('grokipedia', grok_vectors, grok_content)
+            ):
+                self.embedding_manager.store_embedding(
+                    topic, source, vectors.mean(axis=0),
+                    {'content_length': content.length, 'passages': len(vectors)}
+                )
+            
+            if discrepancies is None:
+                discrepancies = self._detect_discrepancies(wiki_content, grok_content)
+            
+            result = {
+                'similarity_score': similarity_score,
+                'discrepancies': discrepancies,
+                'comparison_metadata': {
+                    'wiki_length': wiki_content.length,
+                    'grok_length': grok_content.length,
+                    'discrepancy_count': len(discrepancies),
+                    'mode': 'chunked',
+                    'wiki_passages': len(wiki_passages),
+                    'grok_passages': len(grok_passages)
+                },
+                'passage_alignment': {
+                    'wikipedia': self._worst_aligned(wiki_passages, wiki_best, similarity.argmax(axis=1)),
+                    'grokipedia': self._worst_aligned(grok_passages, grok_best, similarity.argmax(axis=0))
+                }
+            }
+            
+            logger.info(
+                f"✓ Compared {topic}: similarity={similarity_score:.2f} "
+                f"({len(wiki_passages)}×{len(grok_passages)} passages), discrepancies={len(discrepancies)}"
+            )
+            return result
+            
+        except Exception as e:
+            logger.error(f"✗ Comparison failed for {topic}: {str(e)}")
+            return {
+                'similarity_score': 0.0,
+                'discrepancies': [],
+                'comparison_metadata': {'error': str(e)}
+            }
+    
+    def _worst_aligned(self, passages, best_scores, best_matches, limit=None):
+        """
+        List the passages whose best match on the other side is weakest
+        
+        Returns:
+            list of {index, text, similarity, best_match} dicts, worst first
+        """
+        limit = limit or config.WORST_PASSAGES
+        worst = np.argsort(best_scores)[:limit]
+        return [
+            {
+                'index': int(i),
+                'text': passages[i],
+                'similarity': float(best_scores[i]),
+                'best_match': int(best_matches[i])
+            }
+            for i in worst
+        ]
+    
     def _calculate_cosine_similarity(self, vec1, vec2):
         """
         Calculate cosine similarity between two vectors
@@ -87,91 +732,34 @@ class ContentComparator:
             float between 0 and 1
         """
         try:
-            # Reshape for sklearn
-            vec1 = vec1.reshape(1, -1)
-            vec2 = vec2.reshape(1, -1)
-            
-            similarity = cosine_similarity(vec1, vec2)[0][0]
-            return similarity
+            return float(cosine_similarities(np.reshape(vec1, (1, -1)), np.reshape(vec2, (1, -1)))[0])
             
         except Exception as e:
             logger.error(f"✗ Cosine similarity calculation failed: {str(e)}")
             return 0.0
     
-    def _detect_discrepancies(self, wiki_text, grok_text):
+    def _detect_discrepancies(self, wiki_text, grok_text, keywords=None):
         """
         Detect discrepancies between Wikipedia and Grokipedia content
         
         Args:
-            wiki_text: Wikipedia article text
-            grok_text: Grokipedia article text
+            wiki_text: Wikipedia article Document (or text)
+            grok_text: Grokipedia article Document (or text)
+            keywords: Precomputed (wiki_keywords, grok_keywords) from
+                _keyword_sets() (computed here if not given)
             
         Returns:
             list of dicts with {type, severity, description}
         """
-        discrepancies = []
-        
         try:
-            # 1. Length Discrepancy
-            wiki_len = len(wiki_text)
-            grok_len = len(grok_text)
-            max_len = max(wiki_len, grok_len)
-            
-            if max_len > 0:
-                length_diff_ratio = abs(wiki_len - grok_len) / max_len
-                
-                if length_diff_ratio > 0.3:
-                    discrepancies.append({
-                        'type': 'length',
-                        'severity': 'medium',
-                        'description': f'Significant length difference: Wikipedia has {wiki_len} chars, Grokipedia has {grok_len} chars ({length_diff_ratio*100:.1f}% difference)'
-                    })
-            
-            # 2. Keyword Mismatch using TF-IDF
-            try:
-                vectorizer = TfidfVectorizer(max_features=10, stop_words='english')
-                
-                # Need at least 2 documents for TF-IDF
-                if wiki_text and grok_text:
-                    tfidf_matrix = vectorizer.fit_transform([wiki_text, grok_text])
-                    
-                    # Get feature names (keywords)
-                    feature_names = vectorizer.get_feature_names_out()
-                    
-                    # Get top keywords for each document
-                    wiki_scores = tfidf_matrix[0].toarray()[0]
-                    grok_scores = tfidf_matrix[1].toarray()[0]
-                    
-                    wiki_keywords = set([feature_names[i] for i in wiki_scores.argsort()[-10:][::-1] if wiki_scores[i] > 0])
-                    grok_keywords = set([feature_names[i] for i in grok_scores.argsort()[-10:][::-1] if grok_scores[i] > 0])
-                    
-                    # Calculate overlap
-                    if wiki_keywords and grok_keywords:
-                        overlap = len(wiki_keywords.intersection(grok_keywords))
-                        total = len(wiki_keywords.union(grok_keywords))
-                        overlap_ratio = overlap / total if total > 0 else 0
-                        
-                        if overlap_ratio < 0.5:
-                            discrepancies.append({
-                                'type': 'keyword',
-                                'severity': 'high',
-                                'description': f'Low keyword overlap: only {overlap_ratio*100:.1f}% of key terms match between sources'
-                            })
-            except Exception as e:
-                logger.warning(f"⚠ Keyword analysis failed: {str(e)}")
-            
-            # 3. Structural Differences
-            wiki_lines = wiki_text.count('\n')
-            grok_lines = grok_text.count('\n')
-            
-            if abs(wiki_lines - grok_lines) > max(wiki_lines, grok_lines) * 0.5:
-                discrepancies.append({
-                    'type': 'structural',
-                    'severity': 'low',
-                    'description': f'Different content structure: Wikipedia has {wiki_lines} line breaks, Grokipedia has {grok_lines}'
-                })
+            wiki_text, grok_text = as_document(wiki_text), as_document(grok_text)
+            if keywords is None:
+                keywords = self._keyword_sets([(None, wiki_text, grok_text)])[0]
+            return rule_discrepancies(
+                document_stats([(None, wiki_text, grok_text)]), keyword_overlap([keywords]),
+                structural=not self.section_diff
+            )[0]
             
         except Exception as e:
             logger.error(f"✗ Discrepancy detection failed: {str(e)}")
-        
-        return discrepancies
+            return []
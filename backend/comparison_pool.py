@@ -0,0 +1,133 @@
+import logging
+import math
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from backend.document import as_document
+from backend.keyword_model import build_vectorizer, count_terms
+from backend.sections import diff_sections
+import config
+
+logger = logging.getLogger(__name__)
+
+# Term counter built by the initializer of each worker process
+_worker_vectorizer = None
+
+
+def analyze_texts(items, vectorizer, section_diff=True, signature_sources=None):
+    """
+    CPU-bound, stateless text analysis of a batch of topics
+
+    Runs in a worker process or in-process; everything that needs shared
+    state (document frequencies, the signature store) is left to the caller,
+    which merges the returned features.
+
+    Args:
+        items: List of (topic, wiki_content, grok_content) tuples of
+            Documents (or texts)
+        vectorizer: build_vectorizer() term counter
+        section_diff: Run diff_sections() for each topic
+        signature_sources: Per topic, the sources ('wikipedia'/'grokipedia')
+            whose MinHash signatures are needed (None: no signatures)
+
+    Returns:
+        dict with counts (count_terms() CSR matrix, rows wiki0, grok0,
+        wiki1, ...) and topics (per topic {section_diff, signatures}, where
+        signatures maps source -> article_signatures() result)
+    """
+    items = [(topic, as_document(wiki), as_document(grok)) for topic, wiki, grok in items]
+    features = []
+    for i, (topic, wiki, grok) in enumerate(items):
+        topic_features = {'section_diff': None, 'signatures': {}}
+        try:
+            if section_diff:
+                topic_features['section_diff'] = diff_sections(wiki, grok)
+            for source in (signature_sources[i] if signature_sources else ()):
+                document = wiki if source == 'wikipedia' else grok
+                topic_features['signatures'][source] = document.signatures
+        except Exception as e:
+            # The caller recomputes whatever is missing
+            logger.warning(f"⚠ Text analysis failed for {topic}: {str(e)}")
+        features.append(topic_features)
+
+    documents = [document for _, wiki, grok in items for document in (wiki, grok)]
+    return {'counts': count_terms(vectorizer, documents), 'topics': features}
+
+
+def _init_worker(n_features):
+    """Build the term counter once per worker process"""
+    global _worker_vectorizer
+    _worker_vectorizer = build_vectorizer(n_features)
+
+
+def _analyze_chunk(items, section_diff, signature_sources):
+    """Analyze one chunk of topics in a worker"""
+    return analyze_texts(items, _worker_vectorizer, section_diff, signature_sources)
+
+
+class ComparisonWorkerPool:
+    """
+    Runs the CPU-bound part of comparison on worker processes
+
+    Tokenizing, term counting, MinHash signatures and section diffs hold the
+    GIL, so a batch of topics is split into chunks that are analyzed in
+    parallel. Each worker builds its term counter once, in its initializer;
+    each chunk's texts are pickled once, and features come back as sparse
+    and NumPy arrays that merge in input order.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or config.COMPARISON_WORKERS
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def _get_executor(self):
+        """Start the worker processes if needed"""
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(config.KEYWORD_HASH_FEATURES,)
+                )
+                logger.info(f"✓ Started {self.workers} comparison workers")
+            return self.executor
+
+    def analyze(self, items, section_diff=True, signature_sources=None):
+        """
+        Analyze topics across the worker processes
+
+        Takes and returns the same as analyze_texts() (minus the vectorizer).
+
+        Raises:
+            Exception if a worker fails
+        """
+        from scipy.sparse import vstack
+
+        executor = self._get_executor()
+        # Two chunks per worker evens out topics of different lengths
+        size = max(1, math.ceil(len(items) / (self.workers * 2)))
+        futures = [
+            executor.submit(
+                _analyze_chunk, items[start:start + size], section_diff,
+                signature_sources[start:start + size] if signature_sources else None
+            )
+            for start in range(0, len(items), size)
+        ]
+        chunks = [future.result() for future in futures]
+        return {
+            'counts': vstack([chunk['counts'] for chunk in chunks], format='csr'),
+            'topics': [features for chunk in chunks for features in chunk['topics']]
+        }
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=True, cancel_futures=True)
+                self.executor = None
+
+
+# Global instance for use across modules (workers start on first use)
+comparison_pool = ComparisonWorkerPool() if config.COMPARISON_WORKERS else None
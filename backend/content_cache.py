@@ -0,0 +1,158 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class ContentCache:
+    """
+    On-disk cache of fetched articles, keyed by source and resolved title
+
+    Each entry stores the parsed fetch result together with the validators
+    needed to revalidate it (ETag/Last-Modified for Grokipedia, the revision
+    ID for Wikipedia). Entries younger than the TTL are served without any
+    network call; total size is bounded with least-recently-used eviction.
+    """
+
+    def __init__(self, cache_dir=None, ttl=None, max_bytes=None):
+        self.cache_dir = cache_dir or config.CONTENT_CACHE_DIR
+        self.ttl = config.CONTENT_CACHE_TTL if ttl is None else ttl
+        self.max_bytes = config.CONTENT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.lock = threading.Lock()
+
+        # path -> [size, last_used]; file mtimes double as last-used times
+        self.entries = {}
+        self.total_bytes = 0
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and entry.name.endswith('.json'):
+                    stat = entry.stat()
+                    self.entries[entry.path] = [stat.st_size, stat.st_mtime]
+                    self.total_bytes += stat.st_size
+            logger.info(f"✓ Content cache ready: {len(self.entries)} entries ({self.total_bytes // 1024} KB)")
+        except OSError as e:
+            logger.warning(f"⚠ Content cache unavailable: {str(e)}")
+
+    def _path(self, source, title):
+        """Map a source/title pair to its entry file"""
+        key = hashlib.sha1(f"{source}:{title}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, source, title):
+        """
+        Look up a cached fetch result
+
+        Args:
+            source: 'wikipedia' or 'grokipedia'
+            title: Resolved page title (or URL slug)
+
+        Returns:
+            dict with {result, fetched_at, etag, last_modified, revid} or None
+        """
+        path = self._path(source, title)
+
+        # Only the index lookup holds the lock; the file is read outside it,
+        # which is safe because writers replace entry files atomically
+        with self.lock:
+            stats = self.entries.get(path)
+            if stats is None:
+                return None
+            now = time.time()
+            stats[1] = now
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError) as e:
+            with self.lock:
+                # Leave the entry alone if a writer replaced or evicted it meanwhile
+                if self.entries.get(path) is stats:
+                    logger.warning(f"⚠ Dropping unreadable cache entry for {source}:{title}: {str(e)}")
+                    self._remove(path)
+            return None
+
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        return entry
+
+    def is_fresh(self, entry):
+        """Return True if an entry is within the TTL and needs no revalidation"""
+        return time.time() - entry['fetched_at'] < self.ttl
+
+    def put(self, source, title, result, etag=None, last_modified=None, revid=None):
+        """
+        Store a fetch result with its revalidation metadata
+
+        Args:
+            source: 'wikipedia' or 'grokipedia'
+            title: Resolved page title (or URL slug)
+            result: Fetch result dict {title, content, url, timestamp}
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+            revid: MediaWiki revision ID, if any
+        """
+        entry = {
+            'source': source,
+            'title': title,
+            'result': result,
+            'fetched_at': time.time(),
+            'etag': etag,
+            'last_modified': last_modified,
+            'revid': revid
+        }
+        self._write(self._path(source, title), entry)
+
+    def touch(self, source, title, entry):
+        """Mark an entry as revalidated (e.g. after a 304) so its TTL restarts"""
+        entry['fetched_at'] = time.time()
+        self._write(self._path(source, title), entry)
+
+    def _write(self, path, entry):
+        """Atomically write an entry file and evict if over the size bound"""
+        data = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+
+        with self.lock:
+            try:
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"⚠ Failed to write cache entry: {str(e)}")
+                return
+
+            if path in self.entries:
+                self.total_bytes -= self.entries[path][0]
+            self.entries[path] = [len(data), time.time()]
+            self.total_bytes += len(data)
+
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Delete least recently used entries until under the size bound"""
+        evicted = 0
+        for path, _ in sorted(self.entries.items(), key=lambda item: item[1][1]):
+            if self.total_bytes <= self.max_bytes:
+                break
+            self._remove(path)
+            evicted += 1
+        logger.info(f"✓ Evicted {evicted} content cache entries")
+
+    def _remove(self, path):
+        """Delete an entry file and forget it (caller holds the lock)"""
+        size, _ = self.entries.pop(path, (0, 0))
+        self.total_bytes -= size
+        try:
+            os.remove(path)
+        except OSError:
+            pass
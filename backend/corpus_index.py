@@ -0,0 +1,172 @@
+import logging
+import threading
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ('wikipedia', 'grokipedia')
+
+INITIAL_CAPACITY = 256
+
+
+class CorpusIndex:
+    """
+    In-memory matrix of every topic's article embeddings
+
+    Each source has an N×384 matrix of L2-normalized vectors, one row per
+    topic, so corpus-wide questions (nearest topics, most divergent topics)
+    are answered with a single matrix product instead of re-fetching or
+    re-embedding anything. Rows are set as scans store embeddings and are
+    loaded from the vector store once at startup.
+
+    Each topic's scan similarity_score is kept alongside, so divergence is
+    ranked by the same score a scan reports (in chunked mode the stored
+    vectors are passage means, whose cosine differs from that score).
+    """
+
+    def __init__(self, dim=384):
+        self.dim = dim
+        self.lock = threading.Lock()
+        self.topics = []
+        self.positions = {}
+        self.capacity = INITIAL_CAPACITY
+        self.vectors = {source: np.zeros((self.capacity, dim), dtype=np.float32) for source in SOURCES}
+        self.present = {source: np.zeros(self.capacity, dtype=bool) for source in SOURCES}
+        # Scan similarity_score per row (NaN until a scan has scored the topic)
+        self.similarity = np.full(self.capacity, np.nan, dtype=np.float32)
+
+    def _row(self, topic):
+        """Row for a topic, adding it (and growing the matrices) if new"""
+        row = self.positions.get(topic)
+        if row is not None:
+            return row
+
+        row = len(self.topics)
+        if row >= self.capacity:
+            for source in SOURCES:
+                self.vectors[source] = np.concatenate([self.vectors[source], np.zeros_like(self.vectors[source])])
+                self.present[source] = np.concatenate([self.present[source], np.zeros_like(self.present[source])])
+            self.similarity = np.concatenate([self.similarity, np.full_like(self.similarity, np.nan)])
+            self.capacity *= 2
+
+        self.topics.append(topic)
+        self.positions[topic] = row
+        return row
+
+    def set(self, topic, source, vector):
+        """
+        Set a topic's embedding for one source
+
+        Args:
+            topic: Topic name
+            source: 'wikipedia' or 'grokipedia'
+            vector: Embedding vector
+        """
+        if source not in SOURCES:
+            return
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        with self.lock:
+            row = self._row(topic)
+            self.vectors[source][row] = vector / norm if norm else vector
+            self.present[source][row] = norm > 0
+
+    def set_similarity(self, topic, score):
+        """
+        Set the similarity_score a scan reported for a topic
+
+        Args:
+            topic: Topic name
+            score: Wikipedia/Grokipedia similarity score
+        """
+        with self.lock:
+            row = self._row(topic)
+            self.similarity[row] = score
+
+    def load(self, embedding_manager, topics, similarities=None):
+        """
+        Fill the index from the vector store in batched fetches
+
+        Args:
+            embedding_manager: EmbeddingManager to read stored embeddings from
+            topics: Topic names to load
+            similarities: dict of topic -> stored scan similarity_score (optional)
+        """
+        for topic, score in (similarities or {}).items():
+            # A scan may already have set a newer score while this loaded
+            row = self.positions.get(topic)
+            if row is None or np.isnan(self.similarity[row]):
+                self.set_similarity(topic, score)
+
+        keys = [(topic, source) for topic in topics for source in SOURCES]
+        found = embedding_manager.get_embeddings(keys) if keys else {}
+        for (topic, source), vector in found.items():
+            # A scan may already have set a newer vector while this loaded
+            row = self.positions.get(topic)
+            if row is None or not self.present[source][row]:
+                self.set(topic, source, vector)
+        logger.info(f"✓ Corpus index loaded: {len(self.topics)} topics")
+
+    def __contains__(self, topic):
+        return topic in self.positions
+
+    def __len__(self):
+        return len(self.topics)
+
+    def nearest(self, topic, source='grokipedia', against=None, top_k=10):
+        """
+        Find the topics whose articles are most similar to one topic's article
+
+        Args:
+            topic: Topic name to search from
+            source: Which of the topic's articles to search with
+            against: Which source's articles to search (defaults to source)
+            top_k: Number of topics to return
+
+        Returns:
+            list of (topic, cosine similarity) pairs, most similar first,
+            or None if the topic has no embedding for source
+        """
+        against = against or source
+        with self.lock:
+            row = self.positions.get(topic)
+            if row is None or not self.present[source][row]:
+                return None
+
+            count = len(self.topics)
+            scores = self.vectors[against][:count] @ self.vectors[source][row]
+            mask = self.present[against][:count].copy()
+            mask[row] = False
+            return self._top(scores, mask, top_k, descending=True)
+
+    def divergent(self, top_k=10):
+        """
+        Find the topics whose Wikipedia and Grokipedia articles differ most
+
+        Topics are ranked by their scan similarity_score; topics without one
+        fall back to the cosine of their stored embeddings.
+
+        Returns:
+            list of (topic, similarity) pairs, least similar first
+        """
+        with self.lock:
+            count = len(self.topics)
+            cosines = np.einsum(
+                'ij,ij->i', self.vectors['wikipedia'][:count], self.vectors['grokipedia'][:count]
+            )
+            scored = ~np.isnan(self.similarity[:count])
+            scores = np.where(scored, self.similarity[:count], cosines)
+            mask = scored | (self.present['wikipedia'][:count] & self.present['grokipedia'][:count])
+            return self._top(scores, mask, top_k, descending=False)
+
+    def _top(self, scores, mask, top_k, descending):
+        """Top-k (topic, score) pairs among masked rows (caller holds the lock)"""
+        candidates = np.flatnonzero(mask)
+        k = min(top_k, len(candidates))
+        if k <= 0:
+            return []
+
+        keyed = -scores[candidates] if descending else scores[candidates]
+        best = np.argpartition(keyed, k - 1)[:k]
+        best = best[np.argsort(keyed[best])]
+        return [(self.topics[candidates[i]], float(scores[candidates[i]])) for i in best]
@@ -5,6 +5,7 @@ from datetime import datetime
 import uuid
 import os
 from dotenv import load_dotenv
+from backend.http_client import http_client
 
 load_dotenv()
 
@@ -34,7 +35,7 @@ class DKGPublisher:
             bool: True if service is healthy
         """
         try:
-            response = requests.get(f"{self.dkg_service_url}/health", timeout=5)
+            response = http_client.get(f"{self.dkg_service_url}/health", retry=False, timeout=5)
             if response.status_code == 200:
                 logger.info("✅ DKG Edge Node service is healthy")
                 return True
@@ -70,8 +71,9 @@ class DKGPublisher:
             
             logger.info(f"📤 Publishing to DKG via Edge Node: {topic}")
             
-            # POST to DKG Edge Node service
-            response = requests.post(
+            # POST to DKG Edge Node service (not retried: a replay could
+            # publish the same note twice)
+            response = http_client.post(
                 f"{self.dkg_service_url}/publish",
                 json=payload,
                 headers={'Content-Type': 'application/json'},
@@ -121,7 +123,7 @@ class DKGPublisher:
             dict: Asset data or None if failed
         """
         try:
-            response = requests.get(
+            response = http_client.get(
                 f"{self.dkg_service_url}/asset/{ual}",
                 timeout=30
             )
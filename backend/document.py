@@ -0,0 +1,124 @@
+import hashlib
+import logging
+import unicodedata
+from functools import cached_property
+from backend.scan_store import content_hash
+
+logger = logging.getLogger(__name__)
+
+# Characters of each article quoted in LLM prompts
+EXCERPT_CHARS = 1500
+# Words handed to the embedding model. Every word is at least one token, so
+# this covers the longest input the model reads (MiniLM truncates at 256
+# tokens) without tokenizing the rest of a long article on every encode
+MODEL_INPUT_WORDS = 512
+
+
+class Document:
+    """
+    One fetched article, preprocessed once and shared by every scan stage
+
+    The text is normalized (NFC, '\\n' line endings, no surrounding
+    whitespace) on construction; everything derived from it (hashes, word
+    counts, sentence offsets, passages, sections, MinHash signatures) is
+    computed on first use and cached on the instance, so an article is
+    hashed, tokenized and segmented at most once however many stages read it.
+    Length and line counts are taken from the text as fetched (raw), which
+    the discrepancy rules have always measured. Stages that take article text
+    accept a Document or a plain string.
+    """
+
+    def __init__(self, text):
+        # Already-normalized text (the usual case) is not copied
+        self.raw = text
+        self.text = unicodedata.normalize('NFC', text.replace('\r\n', '\n')).strip()
+
+    def __getstate__(self):
+        # Only the text crosses process boundaries (once, if raw is the same
+        # string); features are rebuilt on demand
+        return {'raw': self.raw, 'text': self.text}
+
+    def __setstate__(self, state):
+        self.raw = state['raw']
+        self.text = state['text']
+
+    def __len__(self):
+        return len(self.text)
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"Document({len(self.text)} chars, {self.hash[:12]})"
+
+    @cached_property
+    def hash(self):
+        """scan_store.content_hash() of the text (stage fingerprints)"""
+        return content_hash(self.text)
+
+    @cached_property
+    def key(self):
+        """64-bit content key (keyword model and signature store lookups)"""
+        return int.from_bytes(hashlib.blake2b(self.text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+    @cached_property
+    def length(self):
+        """Characters of the text as fetched"""
+        return len(self.raw)
+
+    @cached_property
+    def line_count(self):
+        """Line breaks of the text as fetched"""
+        return self.raw.count('\n')
+
+    @cached_property
+    def words(self):
+        """Whitespace-separated words"""
+        return self.text.split()
+
+    @cached_property
+    def word_count(self):
+        return len(self.words)
+
+    @cached_property
+    def model_input(self):
+        """The part of the text the embedding model reads, whitespace-normalized"""
+        return ' '.join(self.words[:MODEL_INPUT_WORDS])
+
+    @cached_property
+    def excerpt(self):
+        """Opening of the text quoted in LLM prompts"""
+        return self.text[:EXCERPT_CHARS]
+
+    @cached_property
+    def sentences(self):
+        """Sentence (start, end) offsets, from alignment.split_sentences()"""
+        from backend.alignment import split_sentences
+
+        return split_sentences(self.text)
+
+    @cached_property
+    def passages(self):
+        """Embedding-sized passages, from chunking.split_passages()"""
+        from backend.chunking import split_passages
+
+        return split_passages(self.text)
+
+    @cached_property
+    def sections(self):
+        """Flat section list, from sections.parse_sections()"""
+        from backend.sections import parse_sections
+
+        return parse_sections(self.text)[1]
+
+    @cached_property
+    def signatures(self):
+        """Passage MinHash signatures and word counts, from minhash.article_signatures()"""
+        from backend.minhash import article_signatures
+
+        return article_signatures(self.text)
+
+
+def as_document(text):
+    """Wrap article text in a Document (Documents are returned as they are)"""
+    return text if isinstance(text, Document) else Document(text)
@@ -0,0 +1,212 @@
+import hashlib
+import logging
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+import numpy as np
+import config
+
+logger = logging.getLogger(__name__)
+
+# Unsaved index changes tolerated before the index is written out
+AUTOSAVE_EVERY = 1000
+# Minimum rows added to the vector and key files when the cache grows
+GROW_ROWS = 4096
+
+INDEX_DTYPE = np.dtype([('key', 'V16'), ('slot', '<i4')])
+
+
+def normalize_text(text):
+    """Normalize text so trivially different copies share a cache entry"""
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+
+class EmbeddingCache:
+    """
+    Disk-backed embedding cache keyed by normalized text and model name
+
+    Vectors live in a memory-mapped float32 matrix, one row per slot, so
+    cached vectors are paged in from disk on demand instead of being held
+    in process memory. The files grow as vectors are added, up to the
+    capacity. A compact index of 16-byte keys and slot numbers is kept in
+    LRU order; when the cache is full the least recently used slot is
+    reused. Each slot also records the key it holds, so an index saved
+    before a crash can never hand out another text's vector. Existing files
+    are kept when the capacity changes; lowering it keeps the most recently
+    used vectors.
+    """
+
+    def __init__(self, model_name, cache_dir=None, capacity=None, dim=384):
+        self.model_name = model_name
+        self.cache_dir = cache_dir or config.EMBEDDING_CACHE_DIR
+        self.capacity = capacity or config.EMBEDDING_CACHE_CAPACITY
+        self.dim = dim
+        self.lock = threading.Lock()
+        self.dirty = 0
+
+        # key -> slot, least recently used first
+        self.slots = OrderedDict()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.vectors_path = os.path.join(self.cache_dir, 'vectors.f32')
+        self.keys_path = os.path.join(self.cache_dir, 'keys.bin')
+        self.index_path = os.path.join(self.cache_dir, 'index.npy')
+
+        self.rows = self._open()
+
+        if self.rows and os.path.exists(self.index_path):
+            try:
+                index = np.load(self.index_path)
+                for key, slot in index:
+                    key, slot = key.tobytes(), int(slot)
+                    if 0 <= slot < self.rows and self.slot_keys[slot].tobytes() == key:
+                        self.slots[key] = slot
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠ Ignoring unreadable embedding cache index: {str(e)}")
+
+        if self.rows > self.capacity:
+            self._shrink()
+
+        used = set(self.slots.values())
+        self.free_slots = [slot for slot in range(self.rows - 1, -1, -1) if slot not in used]
+        logger.info(f"✓ Embedding cache ready: {len(self.slots)}/{self.capacity} vectors")
+
+    def _open(self):
+        """Map the vector and key files, creating them empty if missing or unusable; returns their row count"""
+        rows = 0
+        if os.path.exists(self.vectors_path) and os.path.exists(self.keys_path):
+            rows = os.path.getsize(self.keys_path) // 16
+            if (os.path.getsize(self.keys_path) != rows * 16
+                    or os.path.getsize(self.vectors_path) != rows * self.dim * 4):
+                logger.warning(
+                    f"⚠ Embedding cache files don't hold {self.dim}-dim vectors, "
+                    f"rebuilding an empty cache (dropping {rows} slots)"
+                )
+                rows = 0
+        if not rows:
+            for path in (self.vectors_path, self.keys_path):
+                open(path, 'wb').close()
+        self._map(rows)
+        return rows
+
+    def _map(self, rows):
+        """Memory-map the first rows of the vector and key files"""
+        if not rows:
+            self.vectors = np.zeros((0, self.dim), dtype=np.float32)
+            self.slot_keys = np.zeros((0, 16), dtype=np.uint8)
+            return
+        self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode='r+', shape=(rows, self.dim))
+        self.slot_keys = np.memmap(self.keys_path, dtype=np.uint8, mode='r+', shape=(rows, 16))
+
+    def _grow(self):
+        """Extend the files by at least GROW_ROWS free slots, up to capacity (caller holds the lock)"""
+        rows = min(self.capacity, max(self.rows + GROW_ROWS, 2 * self.rows))
+        if self.rows:
+            self.vectors.flush()
+            self.slot_keys.flush()
+        for path, width in ((self.vectors_path, self.dim * 4), (self.keys_path, 16)):
+            with open(path, 'r+b') as f:
+                f.truncate(rows * width)
+        self._map(rows)
+        self.free_slots = list(range(rows - 1, self.rows - 1, -1))
+        self.rows = rows
+
+    def _shrink(self):
+        """Compact the most recently used vectors into files of at most capacity rows"""
+        keep = list(self.slots.items())[-self.capacity:]
+        rows = len(keep)
+        for path, source, width in ((self.vectors_path, self.vectors, self.dim * 4), (self.keys_path, self.slot_keys, 16)):
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.truncate(rows * width)
+            if rows:
+                target = np.memmap(tmp_path, dtype=source.dtype, mode='r+', shape=(rows,) + source.shape[1:])
+                for start in range(0, rows, GROW_ROWS):
+                    old_slots = [slot for _, slot in keep[start:start + GROW_ROWS]]
+                    target[start:start + len(old_slots)] = source[old_slots]
+                target.flush()
+                del target
+            os.replace(tmp_path, path)
+
+        self._map(rows)
+        self.slots = OrderedDict((key, slot) for slot, (key, _) in enumerate(keep))
+        logger.info(
+            f"✓ Embedding cache capacity lowered to {self.capacity}: "
+            f"kept the {rows} most recently used of {self.rows} slots"
+        )
+        self.rows = rows
+        self.dirty += 1
+        self.flush()
+
+    def key(self, text):
+        """Cache key for a text under this cache's model"""
+        data = f"{self.model_name}\0{normalize_text(text)}".encode('utf-8')
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def get_many(self, keys):
+        """
+        Look up cached vectors
+
+        Args:
+            keys: List of keys from key()
+
+        Returns:
+            dict mapping position in keys to a float32 vector, for hits only
+        """
+        hits = {}
+        with self.lock:
+            for i, key in enumerate(keys):
+                slot = self.slots.get(key)
+                if slot is not None and self.slot_keys[slot].tobytes() == key:
+                    self.slots.move_to_end(key)
+                    hits[i] = np.array(self.vectors[slot])
+        return hits
+
+    def put_many(self, keys, vectors):
+        """
+        Store vectors, evicting least recently used entries if full
+
+        Args:
+            keys: List of keys from key()
+            vectors: Array of shape (len(keys), dim)
+        """
+        with self.lock:
+            for key, vector in zip(keys, vectors):
+                slot = self.slots.get(key)
+                if slot is None:
+                    if not self.free_slots and self.rows < self.capacity:
+                        self._grow()
+                    if self.free_slots:
+                        slot = self.free_slots.pop()
+                    else:
+                        _, slot = self.slots.popitem(last=False)
+                    self.slots[key] = slot
+                else:
+                    self.slots.move_to_end(key)
+
+                self.vectors[slot] = vector
+                self.slot_keys[slot] = np.frombuffer(key, dtype=np.uint8)
+                self.dirty += 1
+
+            autosave = self.dirty >= AUTOSAVE_EVERY
+
+        if autosave:
+            self.flush()
+
+    def flush(self):
+        """Write the vectors and the LRU-ordered index to disk"""
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                if self.rows:
+                    self.vectors.flush()
+                    self.slot_keys.flush()
+                index = np.array(list(self.slots.items()), dtype=INDEX_DTYPE)
+                tmp_path = f"{self.index_path}.tmp.npy"
+                np.save(tmp_path, index)
+                os.replace(tmp_path, self.index_path)
+                self.dirty = 0
+            except OSError as e:
+                logger.warning(f"⚠ Failed to save embedding cache index: {str(e)}")
@@ -0,0 +1,181 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import config
+
+logger = logging.getLogger(__name__)
+
+# Model loaded by the initializer of each worker process
+_worker_model = None
+
+
+def _init_worker(model_name, backend, threads):
+    """Load the model once per worker process, pinned to `threads` threads"""
+    global _worker_model
+    from backend.model_registry import ModelRegistry
+
+    registry = ModelRegistry(model_name, backend, threads=threads)
+    _worker_model = registry.get_model()
+
+
+def _attach(name):
+    """Attach to a shared memory block owned by the parent process"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always tracks the block, but workers share the
+        # parent's resource tracker, so the parent's unlink still clears it
+        return shared_memory.SharedMemory(name=name)
+
+
+def _encode_into(name, shape, start, texts, batch_size):
+    """Encode texts in a worker and write them to rows of the shared result"""
+    block = _attach(name)
+    try:
+        result = np.ndarray(shape, dtype=np.float32, buffer=block.buf)
+        result[start:start + len(texts)] = _worker_model.encode(
+            texts, batch_size=batch_size, convert_to_numpy=True
+        )
+        del result
+    finally:
+        block.close()
+    return len(texts)
+
+
+def _ping():
+    """No-op task used to start (and load the model in) a worker"""
+    return os.getpid()
+
+
+class EmbeddingWorkerPool:
+    """
+    Spreads embedding batches across worker processes
+
+    Each worker loads the model once, in its initializer, and runs with a
+    fixed intra-op thread count so workers don't oversubscribe the cores.
+    Vectors are written by the workers straight into a shared memory block
+    allocated by the caller, so only texts and row offsets are pickled.
+    Processes are started on first use or through warm_up().
+    """
+
+    def __init__(self, workers=None, threads=None, model_name=None, backend=None):
+        self.workers = workers or config.EMBEDDING_WORKERS
+        self.threads = threads or config.EMBEDDING_WORKER_THREADS or max(1, (os.cpu_count() or 1) // self.workers)
+        self.model_name = model_name or config.EMBEDDING_MODEL
+        self.backend = backend or config.EMBEDDING_BACKEND
+        self.dim = 384
+        self.executor = None
+        self.ready = False
+        self.load_seconds = None
+        self.error = None
+        self.lock = threading.Lock()
+
+    def _get_executor(self):
+        """Start the worker processes if needed"""
+        with self.lock:
+            if self.executor is None:
+                if self.backend == 'onnx':
+                    # Export once here rather than racing in every worker
+                    from backend.onnx_encoder import ensure_onnx_model
+
+                    ensure_onnx_model(self.model_name, config.EMBEDDING_ONNX_DIR)
+
+                # spawn: forking a process that holds torch threads is unsafe
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.model_name, self.backend, self.threads)
+                )
+                logger.info(f"✓ Started {self.workers} embedding workers ({self.threads} threads each)")
+            return self.executor
+
+    def encode(self, texts, batch_size=32, **kwargs):
+        """
+        Embed texts across the worker processes
+
+        Args:
+            texts: List of texts
+            batch_size: Texts per task (and per model call in the worker)
+
+        Returns:
+            float32 array of shape (len(texts), 384)
+
+        Raises:
+            Exception if a worker fails (e.g. the model cannot be loaded)
+        """
+        texts = list(texts)
+        shape = (len(texts), self.dim)
+        if not texts:
+            return np.zeros(shape, dtype=np.float32)
+
+        executor = self._get_executor()
+        block = shared_memory.SharedMemory(create=True, size=len(texts) * self.dim * 4)
+        try:
+            futures = [
+                executor.submit(_encode_into, block.name, shape, start, texts[start:start + batch_size], batch_size)
+                for start in range(0, len(texts), batch_size)
+            ]
+            for future in futures:
+                future.result()
+            self.ready = True
+            return np.ndarray(shape, dtype=np.float32, buffer=block.buf).copy()
+        finally:
+            block.close()
+            block.unlink()
+
+    def warm_up(self):
+        """Start every worker and load its model now; returns True on success"""
+        start = time.perf_counter()
+        try:
+            executor = self._get_executor()
+            for future in [executor.submit(_ping) for _ in range(self.workers)]:
+                future.result()
+        except Exception as e:
+            self.error = str(e)
+            logger.error(f"✗ Embedding workers failed to start: {self.error}")
+            return False
+        self.load_seconds = time.perf_counter() - start
+        self.ready = True
+        self.error = None
+        logger.info(f"✓ Embedding workers ready ({self.load_seconds:.1f}s)")
+        return True
+
+    def warm_up_async(self):
+        """Start the workers in a background thread"""
+        thread = threading.Thread(target=self.warm_up, name='embedding-pool-warm-up')
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def is_ready(self):
+        """Return True once the workers have loaded the model"""
+        return self.ready
+
+    def status(self):
+        """Readiness details for health endpoints"""
+        return {
+            "ready": self.is_ready(),
+            "model": self.model_name,
+            "backend": self.backend,
+            "workers": self.workers,
+            "threads_per_worker": self.threads,
+            "load_seconds": self.load_seconds,
+            "error": self.error
+        }
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=True, cancel_futures=True)
+                self.executor = None
+
+
+# Global instance for use across modules (workers start on first use)
+embedding_pool = EmbeddingWorkerPool() if config.EMBEDDING_WORKERS else None
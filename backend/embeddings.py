@@ -1,6 +1,12 @@
 import logging
+import threading
 import numpy as np
-from sentence_transformers import SentenceTransformer
+from backend.document import Document
+from backend.embedding_cache import EmbeddingCache
+from backend.embedding_pool import embedding_pool
+from backend.model_registry import model_registry
+from backend.vector_buffer import VectorWriteBuffer
+from backend.vector_store import LocalVectorStore
 from datetime import datetime
 import config
 
@@ -8,73 +14,208 @@ logger = logging.getLogger(__name__)
 
 
 class EmbeddingManager:
-    """Manages vector embeddings using Sentence-Transformers and Pinecone"""
+    """Manages vector embeddings using Sentence-Transformers and a vector store"""
     
-    def __init__(self):
-        """Initialize Sentence-Transformers model and Pinecone connection"""
+    def __init__(self, registry=None, corpus=None, pool=None):
+        """
+        Initialize the embedding cache
+        
+        Neither the embedding model nor the vector store is set up here: the
+        model comes from the process-wide model registry, shared by every
+        EmbeddingManager, and the store is opened (or Pinecone connected) on
+        first use so app startup never waits on disk or the network.
+        
+        Args:
+            registry: ModelRegistry to get the model from (defaults to the global one)
+            corpus: CorpusIndex to keep up to date with stored embeddings (optional)
+            pool: EmbeddingWorkerPool to encode on (defaults to the global one,
+                which exists only when config.EMBEDDING_WORKERS is set)
+        """
+        self.registry = registry or model_registry
+        self.pool = pool or embedding_pool
+        self.corpus = corpus
+        
+        # Vectors for text embedded on earlier scans skip the model
+        try:
+            self.cache = EmbeddingCache(self.registry.variant) if config.EMBEDDING_CACHE_ENABLED else None
+        except Exception as e:
+            logger.warning(f"⚠ Embedding cache unavailable: {str(e)}")
+            self.cache = None
+        
+        self._index = None
+        self._index_connected = False
+        self._index_lock = threading.Lock()
+        self._writer = None
+    
+    @property
+    def model(self):
+        """Shared embedding model (loaded on first use)"""
+        return self.registry.get_model()
+    
+    @property
+    def index(self):
+        """Vector store (opened on first use), or None if unavailable"""
+        if not self._index_connected:
+            with self._index_lock:
+                if not self._index_connected:
+                    self._index = self._open_vector_store()
+                    if self._index is not None:
+                        self._writer = VectorWriteBuffer(self._index)
+                    self._index_connected = True
+        return self._index
+    
+    @property
+    def writer(self):
+        """Write buffer batching vector store I/O, or None if no store"""
+        return self._writer if self.index is not None else None
+    
+    def _open_vector_store(self):
+        """
+        Open the configured vector store
+        
+        Returns:
+            Pinecone Index or LocalVectorStore (both expose upsert/fetch/query),
+            or None if no store can be opened
+        """
+        if config.VECTOR_STORE == 'pinecone':
+            index = self._connect_pinecone()
+            if index is not None:
+                return index
+            logger.warning("⚠ Falling back to the local vector store")
+        elif config.VECTOR_STORE != 'local':
+            logger.warning(f"⚠ Unknown vector store '{config.VECTOR_STORE}', using the local store")
+        
         try:
-            # Initialize local embedding model
-            self.model = SentenceTransformer('all-MiniLM-L6-v2')
-            logger.info("✓ Sentence-Transformers model loaded")
+            return LocalVectorStore()
+        except Exception as e:
+            logger.warning(f"⚠ Local vector store unavailable: {str(e)}")
+            return None
+    
+    def _connect_pinecone(self):
+        """
+        Connect to (and if needed create) the Pinecone index
+        
+        Returns:
+            Pinecone Index, or None if Pinecone is not configured or unreachable
+        """
+        if not config.PINECONE_API_KEY:
+            logger.warning("⚠ Pinecone API key not set")
+            return None
+        
+        try:
+            from pinecone import Pinecone, ServerlessSpec
+            
+            self.pc = Pinecone(api_key=config.PINECONE_API_KEY)
+            
+            # Create index if it doesn't exist
+            existing_indexes = [idx.name for idx in self.pc.list_indexes()]
             
-            # Initialize Pinecone
-            if config.PINECONE_API_KEY:
-                try:
-                    from pinecone import Pinecone, ServerlessSpec
-                    
-                    self.pc = Pinecone(api_key=config.PINECONE_API_KEY)
-                    
-                    # Create index if it doesn't exist
-                    existing_indexes = [idx.name for idx in self.pc.list_indexes()]
-                    
-                    if config.PINECONE_INDEX_NAME not in existing_indexes:
-                        self.pc.create_index(
-                            name=config.PINECONE_INDEX_NAME,
-                            dimension=384,  # all-MiniLM-L6-v2 produces 384-dim vectors
-                            metric='cosine',
-                            spec=ServerlessSpec(
-                                cloud='aws',
-                                region='us-east-1'
-                            )
-                        )
-                        logger.info(f"✓ Created Pinecone index: {config.PINECONE_INDEX_NAME}")
-                    
-                    self.index = self.pc.Index(config.PINECONE_INDEX_NAME)
-                    logger.info(f"✓ Connected to Pinecone index: {config.PINECONE_INDEX_NAME}")
-                except ImportError:
-                    logger.warning("⚠ Pinecone library not installed, using in-memory storage only")
-                    self.index = None
-                except Exception as e:
-                    logger.warning(f"⚠ Pinecone connection failed: {str(e)}, using in-memory storage")
-                    self.index = None
-            else:
-                self.index = None
-                logger.warning("⚠ Pinecone API key not set, using in-memory storage only")
-                
+            if config.PINECONE_INDEX_NAME not in existing_indexes:
+                self.pc.create_index(
+                    name=config.PINECONE_INDEX_NAME,
+                    dimension=384,  # all-MiniLM-L6-v2 produces 384-dim vectors
+                    metric='cosine',
+                    spec=ServerlessSpec(
+                        cloud='aws',
+                        region='us-east-1'
+                    )
+                )
+                logger.info(f"✓ Created Pinecone index: {config.PINECONE_INDEX_NAME}")
+            
+            index = self.pc.Index(config.PINECONE_INDEX_NAME)
+            logger.info(f"✓ Connected to Pinecone index: {config.PINECONE_INDEX_NAME}")
+            return index
+        except ImportError:
+            logger.warning("⚠ Pinecone library not installed")
+            return None
         except Exception as e:
-            logger.error(f"✗ Failed to initialize EmbeddingManager: {str(e)}")
-            self.index = None
+            logger.warning(f"⚠ Pinecone connection failed: {str(e)}")
+            return None
     
     def generate_embedding(self, text):
         """
         Generate vector embedding for text
         
         Args:
-            text: Text content to embed
+            text: Text content (or Document) to embed
             
         Returns:
             numpy array of 384 dimensions
         """
+        embeddings = self.generate_embeddings([text])
+        return None if embeddings is None else embeddings[0]
+    
+    def generate_embeddings(self, texts, batch_size=None):
+        """
+        Generate vector embeddings for many texts in batched model calls
+        
+        Texts already in the embedding cache are not re-encoded. The rest are
+        encoded longest first so each batch pads to similar lengths, and the
+        vectors are returned in input order. For a Document only the words
+        the model reads (Document.model_input) are hashed and tokenized.
+        
+        Args:
+            texts: List of texts (or Documents) to embed
+            batch_size: Texts per model call (defaults to config.EMBEDDING_BATCH_SIZE)
+            
+        Returns:
+            numpy array of shape (len(texts), 384), or None if failed
+        """
+        embeddings = np.zeros((len(texts), 384), dtype=np.float32)
+        if not texts:
+            return embeddings
+        
         try:
-            embedding = self.model.encode(text, convert_to_numpy=True)
-            return embedding
+            texts = [text.model_input if isinstance(text, Document) else text for text in texts]
+            keys = [self.cache.key(text) for text in texts] if self.cache else None
+            hits = self.cache.get_many(keys) if self.cache else {}
+            for i, vector in hits.items():
+                embeddings[i] = vector
+            
+            misses = sorted(
+                (i for i in range(len(texts)) if i not in hits),
+                key=lambda i: len(texts[i]), reverse=True
+            )
+            if misses:
+                encoded = self._encode(
+                    [texts[i] for i in misses],
+                    batch_size or config.EMBEDDING_BATCH_SIZE
+                )
+                embeddings[misses] = encoded
+                if self.cache:
+                    self.cache.put_many([keys[i] for i in misses], encoded)
+            
+            return embeddings
         except Exception as e:
-            logger.error(f"✗ Failed to generate embedding: {str(e)}")
+            logger.error(f"✗ Failed to generate {len(texts)} embeddings: {str(e)}")
             return None
     
+    def _encode(self, texts, batch_size):
+        """Encode on the worker pool if there is one and the work spans batches"""
+        if self.pool is not None and len(texts) > batch_size:
+            try:
+                return self.pool.encode(texts, batch_size=batch_size)
+            except Exception as e:
+                logger.warning(f"⚠ Embedding workers failed, encoding in-process: {str(e)}")
+                self.pool = None
+        
+        return self.model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+    
+    def flush(self):
+        """Send buffered vector writes and persist the embedding cache and local store"""
+        if self.cache:
+            self.cache.flush()
+        if self._writer is not None:
+            self._writer.flush()
+        if isinstance(self._index, LocalVectorStore):
+            self._index.flush()
+    
     def store_embedding(self, topic, source, vector, metadata=None):
         """
-        Store embedding in Pinecone
+        Store embedding in the vector store
+        
+        The write is buffered and sent with others in one batched upsert;
+        it is readable through get_embedding() straight away.
         
         Args:
             topic: Topic name
@@ -83,7 +224,7 @@ class EmbeddingManager:
             metadata: Additional metadata dict
         """
         if self.index is None:
-            logger.warning("⚠ Pinecone not available, skipping storage")
+            logger.warning("⚠ Vector store not available, skipping storage")
             return
         
         try:
@@ -98,10 +239,9 @@ class EmbeddingManager:
             if metadata:
                 meta.update(metadata)
             
-            # Store in Pinecone
-            self.index.upsert(
-                vectors=[(vector_id, vector.tolist(), meta)]
-            )
+            self.writer.add(vector_id, vector.tolist(), meta)
+            if self.corpus is not None:
+                self.corpus.set(topic, source, vector)
             
             logger.info(f"✓ Stored embedding: {vector_id}")
             
@@ -110,7 +250,7 @@ class EmbeddingManager:
     
     def get_embedding(self, topic, source):
         """
-        Retrieve embedding from Pinecone
+        Retrieve embedding from the vector store
         
         Args:
             topic: Topic name
@@ -119,22 +259,63 @@ class EmbeddingManager:
         Returns:
             numpy array or None if not found
         """
+        vector = self.get_embeddings([(topic, source)]).get((topic, source))
+        if vector is None:
+            logger.warning(f"⚠ Embedding not found: {topic}_{source}")
+        return vector
+    
+    def get_embeddings(self, keys):
+        """
+        Retrieve many embeddings in batched fetches
+        
+        Args:
+            keys: List of (topic, source) tuples
+            
+        Returns:
+            dict mapping (topic, source) -> numpy array, for embeddings found
+        """
         if self.index is None:
-            logger.warning("⚠ Pinecone not available")
-            return None
+            logger.warning("⚠ Vector store not available")
+            return {}
         
         try:
-            vector_id = f"{topic}_{source}"
-            result = self.index.fetch(ids=[vector_id])
+            ids = {f"{topic}_{source}": (topic, source) for topic, source in keys}
+            found = self.writer.fetch_many(list(ids))
+            logger.info(f"✓ Retrieved {len(found)}/{len(ids)} embeddings")
+            return {ids[vector_id]: np.array(vector['values']) for vector_id, vector in found.items()}
+        except Exception as e:
+            logger.error(f"✗ Failed to retrieve {len(keys)} embeddings: {str(e)}")
+            return {}
+    
+    def query_similar(self, vector, top_k=10, source=None):
+        """
+        Find stored embeddings most similar to a vector
+        
+        Args:
+            vector: Query embedding
+            top_k: Number of matches to return
+            source: Only match 'wikipedia' or 'grokipedia' embeddings (optional)
             
-            if vector_id in result['vectors']:
-                vector = np.array(result['vectors'][vector_id]['values'])
-                logger.info(f"✓ Retrieved embedding: {vector_id}")
-                return vector
-            else:
-                logger.warning(f"⚠ Embedding not found: {vector_id}")
-                return None
-                
+        Returns:
+            list of {id, score, metadata} matches, most similar first
+        """
+        if self.index is None:
+            logger.warning("⚠ Vector store not available")
+            return []
+        
+        try:
+            # Buffered writes must land before the store can match them
+            self.writer.flush()
+            result = self.index.query(
+                vector=np.asarray(vector).tolist(),
+                top_k=top_k,
+                filter={'source': source} if source else None,
+                include_metadata=True
+            )
+            return [
+                {'id': match['id'], 'score': float(match['score']), 'metadata': dict(match.get('metadata') or {})}
+                for match in result['matches']
+            ]
         except Exception as e:
-            logger.error(f"✗ Failed to retrieve embedding for {topic}_{source}: {str(e)}")
-            return None
+            logger.error(f"✗ Similarity query failed: {str(e)}")
+            return []
@@ -0,0 +1,276 @@
+import logging
+import re
+import config
+
+logger = logging.getLogger(__name__)
+
+# (tag, class) probes in priority order; None matches any class
+TITLE_SELECTORS = (('h1', 'page-title'), ('h1', 'title'), ('h1', None), ('title', None))
+CONTENT_SELECTORS = (
+    ('div', 'content'),
+    ('article', None),
+    ('div', 'article-content'),
+    ('div', 'page-content'),
+    ('main', None),
+)
+STRIP_TAGS = ('script', 'style', 'nav', 'header', 'footer')
+# Section headings are written as MediaWiki plaintext headings ("== Title ==",
+# one '=' per level), so both sources share one section format
+HEADING_TAGS = ('h2', 'h3', 'h4', 'h5', 'h6')
+# Bumped whenever extracted text changes, so cached pages are re-parsed
+EXTRACTION_VERSION = 3
+# HTML fed to lxml's pull parser at a time when slicing out one element
+FEED_BYTES = 64 * 1024
+# Openers and closers of raw-text regions, where a tag-like string is not
+# markup; an unterminated region runs to the end of the page, as it does
+# for the parser
+RAW_TEXT_OPEN = r'<(script|style)\b|<!--'
+RAW_TEXT_CLOSE = {'script': r'</script\s*>', 'style': r'</style\s*>', None: r'-->'}
+
+
+def heading_line(tag, text):
+    """MediaWiki-style heading line for an <hN> element's text"""
+    marker = '=' * int(tag[1])
+    return f"{marker} {text} {marker}"
+
+
+class SoupExtractor:
+    """Pure-Python extraction with BeautifulSoup's html.parser"""
+
+    name = 'soup'
+
+    def extract(self, html, topic):
+        """
+        Extract title and article text from a Grokipedia page
+
+        Args:
+            html: Raw page HTML (bytes or str)
+            topic: Topic name (used as title fallback)
+
+        Returns:
+            (title, content) tuple with content lines joined by newlines
+        """
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(html, 'html.parser')
+
+        title_elem = self._find_first(soup, TITLE_SELECTORS)
+        title = title_elem.get_text(strip=True) if title_elem else topic
+
+        # Fall back to the whole body if no content container matches
+        content_elem = self._find_first(soup, CONTENT_SELECTORS) or soup.find('body')
+        if not content_elem:
+            return title, ""
+
+        for element in content_elem(list(STRIP_TAGS)):
+            element.decompose()
+
+        for heading in content_elem(list(HEADING_TAGS)):
+            heading.string = heading_line(heading.name, heading.get_text(' ', strip=True))
+
+        return title, content_elem.get_text(separator='\n', strip=True)
+
+    def _find_first(self, soup, selectors):
+        """Return the element matched by the first selector that hits"""
+        for tag, class_ in selectors:
+            element = soup.find(tag, class_=class_) if class_ else soup.find(tag)
+            if element:
+                return element
+        return None
+
+
+class LxmlExtractor:
+    """
+    C-accelerated extraction with lxml
+
+    Like a SoupStrainer, only the elements that are needed are parsed: each
+    selector's opening tag is located in the raw HTML, and lxml's pull parser
+    is fed from there until that element closes, so the page head, scripts
+    and payloads around the article are never parsed. Pages whose selectors
+    cannot be located this way are parsed whole, with every probe compiled
+    into an XPath expression once.
+    """
+
+    name = 'lxml'
+
+    def __init__(self):
+        import lxml.html
+        from lxml import etree
+
+        self.html = lxml.html
+        self.etree = etree
+        self.title_xpaths = [etree.XPath(self._xpath(tag, class_)) for tag, class_ in TITLE_SELECTORS]
+        self.content_xpaths = [etree.XPath(self._xpath(tag, class_)) for tag, class_ in CONTENT_SELECTORS]
+        self.title_probes = [self._probe(tag, class_) for tag, class_ in TITLE_SELECTORS]
+        self.content_probes = [self._probe(tag, class_) for tag, class_ in CONTENT_SELECTORS]
+        self.raw_text_patterns = (self._raw_text_patterns(str), self._raw_text_patterns(bytes))
+        self.charset_pattern = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w-]+)', re.IGNORECASE)
+
+    def _xpath(self, tag, class_):
+        """Build an XPath for the first tag carrying a class (like soup.find)"""
+        if class_ is None:
+            return f"(//{tag})[1]"
+        return f"(//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_} ')])[1]"
+
+    def _raw_text_patterns(self, kind):
+        """(opener regex, closer regex by opener name) for str or bytes pages"""
+        encode = (lambda pattern: pattern.encode('ascii')) if kind is bytes else (lambda pattern: pattern)
+        closers = {
+            (encode(name).lower() if name else None): re.compile(encode(pattern), re.IGNORECASE)
+            for name, pattern in RAW_TEXT_CLOSE.items()
+        }
+        return re.compile(encode(RAW_TEXT_OPEN), re.IGNORECASE), closers
+
+    def _probe(self, tag, class_):
+        """(tag, class, str regex, bytes regex) locating a selector's opening tag"""
+        if class_ is None:
+            pattern = rf'<{tag}\b'
+        else:
+            value = rf'(?:[^"\'>]*\s)?{class_}(?:\s[^"\'>]*)?'
+            pattern = rf'<{tag}\b[^>]*?\sclass\s*=\s*(?:"{value}"|\'{value}\'|{class_}(?=[\s/>]))'
+        return (
+            tag, class_,
+            re.compile(pattern, re.IGNORECASE),
+            re.compile(pattern.encode('ascii'), re.IGNORECASE)
+        )
+
+    def extract(self, html, topic):
+        """
+        Extract title and article text from a Grokipedia page
+
+        Args:
+            html: Raw page HTML (bytes or str)
+            topic: Topic name (used as title fallback)
+
+        Returns:
+            (title, content) tuple with content lines joined by newlines
+        """
+        encoding = None
+        if isinstance(html, bytes):
+            match = self.charset_pattern.search(html, 0, FEED_BYTES)
+            encoding = match.group(1).decode('ascii') if match else 'utf-8'
+
+        raw_text = self.raw_text_patterns[1 if encoding else 0]
+        located, content_elem = self._parse_first(html, self.content_probes, encoding, raw_text)
+        if located and content_elem is not None:
+            located, title_elem = self._parse_first(html, self.title_probes, encoding, raw_text)
+        if not located or content_elem is None:
+            # Nothing to slice out (or a probe was unsure): parse the whole page
+            root = self.html.document_fromstring(html)
+            title_elem = self._find_first(root, self.title_xpaths)
+            content_elem = self._find_first(root, self.content_xpaths)
+            if content_elem is None:
+                content_elem = root.find('body')
+
+        title = ''.join(text.strip() for text in title_elem.itertext()) if title_elem is not None else topic
+        if content_elem is None:
+            return title, ""
+
+        self.etree.strip_elements(content_elem, *STRIP_TAGS, with_tail=False)
+
+        for heading in list(content_elem.iter(*HEADING_TAGS)):
+            text = ' '.join(part.strip() for part in heading.itertext() if part.strip())
+            for child in list(heading):
+                heading.remove(child)
+            heading.text = heading_line(heading.tag, text)
+
+        lines = (text.strip() for text in content_elem.itertext())
+        return title, '\n'.join(line for line in lines if line)
+
+    def _find_tag(self, html, pattern, raw_text):
+        """
+        First match of an opening-tag pattern that is markup, not raw text
+
+        Walks forward from the top of the page, jumping over each script,
+        style or comment that opens before the candidate match, so only the
+        page up to the first real match is scanned.
+        """
+        opener, closers = raw_text
+        pos = 0
+        while True:
+            match = pattern.search(html, pos)
+            if match is None:
+                return None
+            region = opener.search(html, pos, match.start())
+            if region is None:
+                return match
+            name = region.group(1)
+            close = closers[name.lower() if name else None].search(html, region.end())
+            pos = close.end() if close else len(html)
+
+    def _parse_first(self, html, probes, encoding, raw_text):
+        """
+        Parse just the element picked by the first selector that hits
+
+        Opening tags inside scripts, styles and comments are skipped.
+
+        Returns:
+            (located, element): element is None if no selector hits;
+            located is False if a probe hit an opening tag the parser did
+            not confirm, and the page has to be parsed whole
+        """
+        for tag, class_, text_pattern, bytes_pattern in probes:
+            match = self._find_tag(html, bytes_pattern if encoding else text_pattern, raw_text)
+            if match is None:
+                continue
+
+            element = self._parse_element(html, match.start(), tag, encoding)
+            if element is None or (class_ and class_ not in (element.get('class') or '').split()):
+                return False, None
+            return True, element
+        return True, None
+
+    def _parse_element(self, html, start, tag, encoding):
+        """Feed the pull parser from an opening tag until that element closes"""
+        parser = self.etree.HTMLPullParser(events=('start', 'end'), tag=tag, encoding=encoding)
+        element = None
+        for offset in range(start, len(html), FEED_BYTES):
+            parser.feed(html[offset:offset + FEED_BYTES])
+            for event, node in parser.read_events():
+                if element is None:
+                    element = node
+                elif event == 'end' and node is element:
+                    return element
+        parser.close()
+        return element
+
+    def _find_first(self, root, xpaths):
+        """Return the element matched by the first XPath that hits"""
+        for xpath in xpaths:
+            matches = xpath(root)
+            if matches:
+                return matches[0]
+        return None
+
+
+EXTRACTORS = {
+    'soup': SoupExtractor,
+    'lxml': LxmlExtractor,
+}
+
+
+def get_extractor(name=None):
+    """
+    Build the configured HTML extraction backend
+
+    Falls back to BeautifulSoup if the requested backend is unknown or its
+    library is not installed.
+
+    Args:
+        name: Backend name (defaults to config.GROKIPEDIA_EXTRACTOR)
+
+    Returns:
+        Extractor instance exposing extract(html, topic)
+    """
+    name = name or config.GROKIPEDIA_EXTRACTOR
+
+    try:
+        extractor = EXTRACTORS[name]()
+        logger.info(f"✓ Using {extractor.name} HTML extractor")
+        return extractor
+    except KeyError:
+        logger.warning(f"⚠ Unknown HTML extractor '{name}', using BeautifulSoup")
+    except ImportError:
+        logger.warning(f"⚠ {name} not installed, using BeautifulSoup HTML extractor")
+
+    return SoupExtractor()
@@ -0,0 +1,156 @@
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+import config
+
+logger = logging.getLogger(__name__)
+
+# Methods that are safe to send again after a failed attempt
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+# Status codes worth retrying: throttling and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks until a request may be sent"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class HttpClient:
+    """
+    Shared outbound HTTP layer for scraping and DKG calls
+
+    Keeps one pooled keep-alive session per host, rate limits each host with
+    a token bucket from config.HTTP_RATE_LIMITS, and retries idempotent
+    requests on connection errors, timeouts, 429 and 5xx responses with
+    jittered exponential backoff.
+    """
+
+    def __init__(self, rate_limits=None, max_retries=None, backoff_base=None, backoff_max=None):
+        self.rate_limits = config.HTTP_RATE_LIMITS if rate_limits is None else rate_limits
+        self.max_retries = config.HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_base = config.HTTP_BACKOFF_BASE if backoff_base is None else backoff_base
+        self.backoff_max = config.HTTP_BACKOFF_MAX if backoff_max is None else backoff_max
+
+        self.sessions = {}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        """Send a GET request (retried on transient failures)"""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        """Send a POST request (not retried unless retry=True)"""
+        return self.request('POST', url, **kwargs)
+
+    def request(self, method, url, retry=None, **kwargs):
+        """
+        Send a request through the host's pooled session
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            retry: Override whether the request may be retried (defaults to
+                True for idempotent methods)
+            **kwargs: Passed through to requests.Session.request
+
+        Returns:
+            requests.Response (the last one if retries were exhausted)
+
+        Raises:
+            requests.exceptions.RequestException on connection errors or
+            timeouts once retries are exhausted
+        """
+        host = urlparse(url).hostname or ''
+        session, bucket = self._host_state(host)
+
+        if retry is None:
+            retry = method.upper() in IDEMPOTENT_METHODS
+        attempts = self.max_retries + 1 if retry else 1
+
+        for attempt in range(attempts):
+            if bucket:
+                bucket.acquire()
+
+            last_attempt = attempt == attempts - 1
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if last_attempt:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"⚠ {method} {host} failed ({type(e).__name__}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            if response.status_code in RETRY_STATUSES and not last_attempt:
+                delay = max(self._retry_after(response), self._backoff(attempt))
+                logger.warning(f"⚠ {method} {host} returned {response.status_code}, retrying in {delay:.1f}s")
+                response.close()
+                time.sleep(delay)
+                continue
+
+            return response
+
+    def _host_state(self, host):
+        """Get (or create) the pooled session and rate limiter for a host"""
+        with self.lock:
+            if host not in self.sessions:
+                session = requests.Session()
+                session.headers['User-Agent'] = config.HTTP_USER_AGENT
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.HTTP_POOL_SIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self.sessions[host] = session
+                self.buckets[host] = self._make_bucket(host)
+
+            return self.sessions[host], self.buckets[host]
+
+    def _make_bucket(self, host):
+        """Build a token bucket if the host (or a parent domain) is rate limited"""
+        for domain, (rate, burst) in self.rate_limits.items():
+            if host == domain or host.endswith(f".{domain}"):
+                return TokenBucket(rate, burst)
+        return None
+
+    def _backoff(self, attempt):
+        """Full-jitter exponential backoff delay for a retry attempt"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _retry_after(self, response):
+        """Seconds requested by a Retry-After header (0 if absent or a date)"""
+        try:
+            return min(self.backoff_max, float(response.headers.get('Retry-After', 0)))
+        except ValueError:
+            return 0
+
+
+# Global instance for use across modules
+http_client = HttpClient()
@@ -0,0 +1,179 @@
+import logging
+import os
+import threading
+import numpy as np
+from backend.document import as_document
+import config
+
+logger = logging.getLogger(__name__)
+
+# A pair's keyword counts as shared when it is within an article's top
+# MATCH_DEPTH * k terms (paired_keywords)
+MATCH_DEPTH = 3
+
+
+def build_vectorizer(n_features=None):
+    """Hashing term counter (stateless, so worker processes can build their own)"""
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    return HashingVectorizer(
+        n_features=n_features or config.KEYWORD_HASH_FEATURES, stop_words='english',
+        alternate_sign=False, norm=None
+    )
+
+
+def count_terms(vectorizer, texts):
+    """Term counts of articles (Documents or texts) as a CSR matrix with one entry per term and row"""
+    counts = vectorizer.transform([as_document(text).text for text in texts]).tocsr()
+    counts.sum_duplicates()
+    return counts
+
+
+class KeywordModel:
+    """
+    Corpus-wide TF-IDF keyword model over hashed terms
+
+    Terms are hashed into a fixed feature space, so there is no vocabulary
+    to fit: document frequencies are simply counted as articles are seen,
+    and persisted, so IDF reflects every article scanned so far rather than
+    the two articles of one topic. Each article is counted once (by content
+    hash), no matter how many scans see it.
+    """
+
+    def __init__(self, path=None, n_features=None):
+        self.path = path or config.KEYWORD_MODEL_PATH
+        self.n_features = n_features or config.KEYWORD_HASH_FEATURES
+        self.lock = threading.Lock()
+        self.vectorizer = None
+        self.dirty = 0
+
+        self.doc_freq = np.zeros(self.n_features, dtype=np.int32)
+        self.n_docs = 0
+        self.seen = set()
+
+        if os.path.exists(self.path):
+            try:
+                with np.load(self.path) as data:
+                    if len(data['doc_freq']) == self.n_features:
+                        self.doc_freq = data['doc_freq'].astype(np.int32)
+                        self.n_docs = int(data['n_docs'])
+                        self.seen = set(data['seen'].tolist())
+                    else:
+                        logger.warning("⚠ Keyword model feature count changed, starting empty")
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"⚠ Ignoring unreadable keyword model: {str(e)}")
+
+    def get_vectorizer(self):
+        """Hashing term counter (sklearn is imported on first use)"""
+        if self.vectorizer is None:
+            self.vectorizer = build_vectorizer(self.n_features)
+        return self.vectorizer
+
+    def transform(self, texts, counts=None):
+        """
+        Count terms in a batch of articles, adding unseen ones to the corpus
+
+        Args:
+            texts: List of article Documents (or texts)
+            counts: count_terms() result for texts, if already computed
+                (e.g. by a worker process)
+
+        Returns:
+            scipy CSR matrix of term counts, one row per text
+        """
+        documents = [as_document(text) for text in texts]
+        if counts is None:
+            counts = count_terms(self.get_vectorizer(), documents)
+
+        keys = [document.key for document in documents]
+        with self.lock:
+            new_rows = []
+            for row, key in enumerate(keys):
+                if key not in self.seen:
+                    self.seen.add(key)
+                    new_rows.append(row)
+            if new_rows:
+                # Each row lists a term at most once, so counting indices
+                # counts the documents containing each term
+                self.doc_freq += np.bincount(
+                    counts[new_rows].indices, minlength=self.n_features
+                ).astype(np.int32)
+                self.n_docs += len(new_rows)
+                self.dirty += len(new_rows)
+        return counts
+
+    def idf(self, terms):
+        """Smoothed inverse document frequency of hashed term ids"""
+        return np.log((1 + self.n_docs) / (1 + self.doc_freq[terms])) + 1
+
+    def paired_keywords(self, texts, k=None, counts=None):
+        """
+        Keywords of article pairs, scored against a shared vocabulary
+
+        Each pair's vocabulary is the union of both articles' top-k TF-IDF
+        terms; an article's keywords are the vocabulary terms among its own
+        top MATCH_DEPTH * k (with ties). Comparing two separate top-k lists instead
+        makes rewritten articles look unrelated whenever TF-IDF ranks their
+        shared terms slightly differently.
+
+        Args:
+            texts: List of article Documents (or texts), pairs adjacent
+                (wiki, grok, wiki, grok, ...)
+            k: Top terms per article (defaults to config.KEYWORD_TOP_K)
+            counts: count_terms() result for texts, if already computed
+
+        Returns:
+            list of (first_keywords, second_keywords) sets of hashed term
+            ids, one per pair
+        """
+        k = k or config.KEYWORD_TOP_K
+        counts = self.transform(texts, counts)
+        top_terms = self._top_terms(counts, k)
+        wide_terms = self._top_terms(counts, k * MATCH_DEPTH, ties=True)
+
+        pairs = []
+        for row in range(0, counts.shape[0] - 1, 2):
+            vocabulary = np.union1d(top_terms[row], top_terms[row + 1])
+            pairs.append(tuple(
+                set(vocabulary[np.isin(vocabulary, wide_terms[r])].tolist()) for r in (row, row + 1)
+            ))
+        return pairs
+
+    def _top_terms(self, counts, k, ties=False):
+        """
+        Term id array of each row's top-k TF-IDF terms
+
+        Short articles have many terms of equal weight, so ties are broken
+        by term id (the same way for every article), or with ties=True all
+        terms tied with the k-th are kept.
+        """
+        weights = counts.data * self.idf(counts.indices)
+
+        top_terms = []
+        for row in range(counts.shape[0]):
+            start, end = counts.indptr[row], counts.indptr[row + 1]
+            terms, row_weights = counts.indices[start:end], weights[start:end]
+            if end - start <= k:
+                top_terms.append(terms)
+            elif ties:
+                top_terms.append(terms[row_weights >= np.partition(row_weights, end - start - k)[end - start - k]])
+            else:
+                top_terms.append(terms[np.lexsort((terms, -row_weights))[:k]])
+        return top_terms
+
+    def flush(self):
+        """Write document frequencies to disk"""
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                tmp_path = f"{self.path}.tmp.npz"
+                np.savez_compressed(
+                    tmp_path, doc_freq=self.doc_freq, n_docs=self.n_docs,
+                    seen=np.array(sorted(self.seen), dtype=np.uint64)
+                )
+                os.replace(tmp_path, self.path)
+                self.dirty = 0
+            except OSError as e:
+                logger.warning(f"⚠ Failed to save keyword model: {str(e)}")
@@ -0,0 +1,388 @@
+import logging
+import os
+import re
+import threading
+import zlib
+import numpy as np
+from backend.chunking import split_passages
+from backend.document import as_document
+import config
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Signature parameters; stored signatures are only comparable if these match
+SHINGLE_WORDS = 3
+NUM_PERM = 128
+# Two 32-bit rows per band, so a band is read as one uint64 key. 64 bands of
+# 2 rows make pairs with Jaccard ~0.2 candidates 93% of the time
+BAND_ROWS = 2
+BANDS = NUM_PERM // BAND_ROWS
+SEED = 1
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64(0xFFFFFFFF)
+SHINGLE_BASE = np.uint64(1000003)
+
+_rng = np.random.default_rng(SEED)
+PERM_A = _rng.integers(1, 1 << 32, NUM_PERM, dtype=np.uint64)
+PERM_B = _rng.integers(0, 1 << 32, NUM_PERM, dtype=np.uint64)
+
+# Candidate passage pairs scored at once (bounds memory to PAIR_BLOCK × NUM_PERM)
+PAIR_BLOCK = 1 << 16
+
+
+def word_hashes(text):
+    """crc32 of each lowercased word of a text (stable across processes), as uint64"""
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    return np.fromiter((zlib.crc32(token.encode('utf-8')) for token in tokens), dtype=np.uint64, count=len(tokens))
+
+
+def window_hashes(words, k):
+    """
+    Rolling 64-bit hashes of every k-word window, in one linear pass
+
+    Each window hash is a polynomial of its k word hashes, built with k
+    array operations. Fewer than k words make a single window.
+
+    Args:
+        words: word_hashes() array
+        k: Words per window
+
+    Returns:
+        uint64 array; entry i hashes words i..i+k-1 (empty without words)
+    """
+    k = min(k, len(words))
+    if k == 0:
+        return words
+
+    count = len(words) - k + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    for j in range(k):
+        hashes = hashes * SHINGLE_BASE + words[j:j + count]
+    return hashes
+
+
+def shingle_hashes(text, k=SHINGLE_WORDS):
+    """
+    32-bit hashes of every k-word shingle of a text
+
+    Returns:
+        uint64 array of shingle hashes (empty for text without words)
+    """
+    hashes = window_hashes(word_hashes(text), k)
+    return (hashes ^ (hashes >> np.uint64(32))) & MAX_HASH
+
+
+def signature(text):
+    """
+    MinHash signature of a text's shingle set
+
+    Returns:
+        uint32 array of NUM_PERM minimum permuted hashes
+    """
+    shingles = np.unique(shingle_hashes(text))
+    if not len(shingles):
+        return np.full(NUM_PERM, MAX_HASH, dtype=np.uint32)
+    permuted = (shingles[:, None] * PERM_A + PERM_B) % MERSENNE_PRIME & MAX_HASH
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def signatures(passages):
+    """Signatures of many passages, as an (n, NUM_PERM) uint32 matrix"""
+    if not passages:
+        return np.zeros((0, NUM_PERM), dtype=np.uint32)
+    return np.stack([signature(passage) for passage in passages])
+
+
+def article_signatures(text):
+    """
+    Passage signatures of a whole article
+
+    Returns:
+        (signatures, weights): (n, NUM_PERM) uint32 matrix and the word
+        count of each passage
+    """
+    # Non-overlapping passages, so ratios add up to the whole article
+    passages = split_passages(text, overlap=0)
+    return (
+        signatures(passages),
+        np.array([len(passage.split()) for passage in passages], dtype=np.int32)
+    )
+
+
+def band_keys(signature_matrix):
+    """LSH bucket keys: each band's two 32-bit rows read as one uint64"""
+    return np.ascontiguousarray(signature_matrix, dtype=np.uint32).view(np.uint64)
+
+
+def band_index(signature_matrix):
+    """
+    Banded LSH index of a signature matrix, for candidate_pairs()
+
+    Returns:
+        (sorted_keys, order): (BANDS, n) arrays holding each band's bucket
+        keys in sorted order and the signature row of each
+    """
+    keys = band_keys(signature_matrix).T
+    order = np.argsort(keys, axis=1, kind='stable')
+    return np.take_along_axis(keys, order, axis=1), order
+
+
+def candidate_pairs(queries, index):
+    """
+    Query/indexed signature pairs that share a bucket in at least one band
+
+    A sort-based join: each query's band key is binary-searched in that
+    band's sorted keys, so the cost grows with the number of queries and of
+    candidate pairs found, not with the size of the index.
+
+    Args:
+        queries: (m, NUM_PERM) signature matrix
+        index: band_index() of the signatures to search
+
+    Returns:
+        (rows, cols): int64 arrays of query rows and indexed rows, each
+        pair listed once
+    """
+    sorted_keys, order = index
+    size = sorted_keys.shape[1]
+    query_keys = band_keys(queries)
+    pair_ids = []
+    for band in range(sorted_keys.shape[0]):
+        lo = np.searchsorted(sorted_keys[band], query_keys[:, band], side='left')
+        counts = np.searchsorted(sorted_keys[band], query_keys[:, band], side='right') - lo
+        total = int(counts.sum())
+        if not total:
+            continue
+        # Expand each query's [lo, hi) bucket range into one entry per pair
+        rows = np.repeat(np.arange(len(query_keys), dtype=np.int64), counts)
+        positions = np.arange(total) + np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        pair_ids.append(rows * size + order[band, positions])
+
+    if not pair_ids:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    pair_ids = np.unique(np.concatenate(pair_ids))
+    return pair_ids // size, pair_ids % size
+
+
+def pair_jaccard(queries, candidates, rows, cols):
+    """Estimated Jaccard similarity of (query row, candidate row) pairs, PAIR_BLOCK pairs at a time"""
+    jaccard = np.empty(len(rows))
+    for start in range(0, len(rows), PAIR_BLOCK):
+        block = slice(start, start + PAIR_BLOCK)
+        jaccard[block] = (queries[rows[block]] == candidates[cols[block]]).mean(axis=1)
+    return jaccard
+
+
+def best_matches(queries, candidates):
+    """
+    Best estimated Jaccard similarity of each query passage to any candidate
+
+    Pairs are only scored if banded LSH makes them candidates (they share a
+    bucket in at least one band); other pairs count as 0.
+
+    Args:
+        queries: (m, NUM_PERM) signature matrix
+        candidates: (n, NUM_PERM) signature matrix
+
+    Returns:
+        (scores, indices): float arrays of length m; index -1 where a query
+        has no candidate
+    """
+    scores = np.zeros(len(queries))
+    indices = np.full(len(queries), -1, dtype=np.int64)
+    if not len(queries) or not len(candidates):
+        return scores, indices
+
+    rows, cols = candidate_pairs(queries, band_index(candidates))
+    if not len(rows):
+        return scores, indices
+    jaccard = pair_jaccard(queries, candidates, rows, cols)
+
+    # Keep each query's best candidate: sort by row, best first
+    order = np.lexsort((-jaccard, rows))
+    rows, cols, jaccard = rows[order], cols[order], jaccard[order]
+    first = np.unique(rows, return_index=True)[1]
+    scores[rows[first]] = jaccard[first]
+    indices[rows[first]] = cols[first]
+    return scores, indices
+
+
+class SignatureStore:
+    """
+    Persisted MinHash signatures of every scanned article's passages
+
+    Signatures are keyed by content hash, so an unchanged article is never
+    re-shingled on a rescan, and indexed by (topic, source), so passages
+    can be matched against every other topic to find duplicated text.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or config.MINHASH_STORE_PATH
+        self.lock = threading.Lock()
+        self.dirty = 0
+        self.reused = 0
+
+        # content key -> (signatures (n, NUM_PERM) uint32, passage word counts)
+        self.articles = {}
+        # (topic, source) -> content key of its latest article
+        self.topics = {}
+        # Concatenated signatures of every indexed article, their owners and
+        # band_index(), built on demand
+        self.matrix = None
+
+        if os.path.exists(self.path):
+            try:
+                self._load()
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"⚠ Ignoring unreadable signature store: {str(e)}")
+
+    def _load(self):
+        with np.load(self.path) as data:
+            if int(data['num_perm']) != NUM_PERM or int(data['shingle_words']) != SHINGLE_WORDS:
+                logger.warning("⚠ MinHash parameters changed, starting with an empty signature store")
+                return
+            offsets = data['offsets']
+            sigs, weights = data['signatures'], data['weights']
+            for i, (key, topic, source) in enumerate(zip(data['keys'].tolist(), data['topics'].tolist(), data['sources'].tolist())):
+                self.articles[key] = (sigs[offsets[i]:offsets[i + 1]], weights[offsets[i]:offsets[i + 1]])
+                self.topics[(topic, source)] = key
+        logger.info(f"✓ Loaded MinHash signatures for {len(self.topics)} articles")
+
+    def __contains__(self, text):
+        """Return True if an article (Document or text) already has stored signatures"""
+        return as_document(text).key in self.articles
+
+    def get(self, topic, source, text, entry=None):
+        """
+        Passage signatures of an article, computed once per distinct text
+
+        Args:
+            topic: Topic name
+            source: 'wikipedia' or 'grokipedia'
+            text: Article Document (or text)
+            entry: article_signatures() result computed elsewhere (e.g. in
+                a worker process), stored if the text has none yet
+
+        Returns:
+            (signatures, weights): (n, NUM_PERM) uint32 matrix and the word
+            count of each passage
+        """
+        document = as_document(text)
+        key = document.key
+        with self.lock:
+            stored = self.articles.get(key)
+            if stored is not None:
+                self.reused += 1
+                if self.topics.get((topic, source)) != key:
+                    self.topics[(topic, source)] = key
+                    self.matrix = None
+                    self.dirty += 1
+                return stored
+
+        if entry is None:
+            entry = document.signatures
+        with self.lock:
+            self.articles[key] = entry
+            self.topics[(topic, source)] = key
+            self.matrix = None
+            self.dirty += 1
+        return entry
+
+    def _index(self):
+        """
+        Signatures of every indexed article, the (topic, source) of each row
+        and their band_index() (caller holds the lock)
+        """
+        if self.matrix is None:
+            owners, blocks = [], []
+            for owner, key in self.topics.items():
+                sigs = self.articles[key][0]
+                owners.extend([owner] * len(sigs))
+                blocks.append(sigs)
+            matrix = np.concatenate(blocks) if blocks else np.zeros((0, NUM_PERM), dtype=np.uint32)
+            self.matrix = (matrix, owners, band_index(matrix))
+        return self.matrix
+
+    def find_duplicates(self, topic, source='grokipedia', threshold=None, limit=10):
+        """
+        Find other topics' articles that share near-duplicate passages
+
+        Args:
+            topic: Topic name
+            source: Which of the topic's articles to search with
+            threshold: Minimum estimated Jaccard for a passage to count
+                (defaults to config.COPY_THRESHOLD)
+            limit: Number of articles to return
+
+        Returns:
+            list of {name, source, passages, ratio, similarity} dicts, most
+            duplicated first (ratio is the share of the topic's words in
+            matching passages), or None if the topic has no signatures
+        """
+        threshold = config.COPY_THRESHOLD if threshold is None else threshold
+        with self.lock:
+            key = self.topics.get((topic, source))
+            if key is None:
+                return None
+            queries, weights = self.articles[key]
+            matrix, owners, index = self._index()
+
+        # Banded LSH: only passages sharing a bucket are scored, and the
+        # topic's own articles are dropped so only other topics can match
+        rows, cols = candidate_pairs(queries, index)
+        other = np.array([owners[col][0] != topic for col in cols.tolist()], dtype=bool)
+        rows, cols = rows[other], cols[other]
+        jaccard = pair_jaccard(queries, matrix, rows, cols)
+        total = max(1, int(weights.sum()))
+
+        matches = {}
+        above = jaccard >= threshold
+        for row, col, score in zip(rows[above].tolist(), cols[above].tolist(), jaccard[above].tolist()):
+            match = matches.setdefault(owners[col], {'passages': set(), 'similarity': 0.0})
+            match['passages'].add(row)
+            match['similarity'] = max(match['similarity'], score)
+
+        results = [
+            {
+                'name': name,
+                'source': other_source,
+                'passages': len(match['passages']),
+                'ratio': float(weights[sorted(match['passages'])].sum()) / total,
+                'similarity': match['similarity']
+            }
+            for (name, other_source), match in matches.items()
+        ]
+        results.sort(key=lambda match: (match['ratio'], match['similarity']), reverse=True)
+        return results[:limit]
+
+    def flush(self):
+        """Write the signatures of every indexed article to disk"""
+        with self.lock:
+            if not self.dirty:
+                return
+            owners = list(self.topics.items())
+            # Articles no topic points at any more are dropped here
+            self.articles = {key: self.articles[key] for _, key in owners}
+            blocks = [self.articles[key] for _, key in owners]
+            offsets = np.cumsum([0] + [len(sigs) for sigs, _ in blocks])
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                tmp_path = f"{self.path}.tmp.npz"
+                np.savez_compressed(
+                    tmp_path,
+                    num_perm=NUM_PERM,
+                    shingle_words=SHINGLE_WORDS,
+                    keys=np.array([key for _, key in owners], dtype=np.uint64),
+                    topics=np.array([topic for (topic, _), _ in owners], dtype=str),
+                    sources=np.array([source for (_, source), _ in owners], dtype=str),
+                    offsets=offsets,
+                    signatures=np.concatenate([sigs for sigs, _ in blocks]) if blocks else np.zeros((0, NUM_PERM), dtype=np.uint32),
+                    weights=np.concatenate([weights for _, weights in blocks]) if blocks else np.zeros(0, dtype=np.int32)
+                )
+                os.replace(tmp_path, self.path)
+                self.dirty = 0
+            except OSError as e:
+                logger.warning(f"⚠ Failed to save MinHash signatures: {str(e)}")
@@ -0,0 +1,127 @@
+import importlib.util
+import logging
+import threading
+import time
+import config
+
+logger = logging.getLogger(__name__)
+
+
+BACKENDS = ('torch', 'onnx')
+
+
+class ModelRegistry:
+    """
+    Process-wide holder for the embedding model
+
+    The model is loaded once, on first use or through warm_up(), and shared
+    by every EmbeddingManager in the process. The 'torch' backend is the
+    Sentence-Transformers model; the 'onnx' backend is the same model
+    quantized to int8 and run on ONNX Runtime (see backend/onnx_encoder.py).
+    Both expose encode() and produce the same 384-dim vectors.
+    """
+
+    def __init__(self, model_name=None, backend=None, threads=None):
+        self.model_name = model_name or config.EMBEDDING_MODEL
+        self.threads = threads  # intra-op threads (None = library default)
+        self.backend = self._select_backend(backend or config.EMBEDDING_BACKEND)
+        self.model = None
+        self.load_seconds = None
+        self.error = None
+        self.lock = threading.Lock()
+
+    def _select_backend(self, backend):
+        """Validate the configured backend, falling back to torch"""
+        if backend not in BACKENDS:
+            logger.warning(f"⚠ Unknown embedding backend '{backend}', using torch")
+            return 'torch'
+        if backend == 'onnx' and not all(
+            importlib.util.find_spec(module) for module in ('onnxruntime', 'tokenizers')
+        ):
+            logger.warning("⚠ onnxruntime/tokenizers not installed, using torch embedding backend")
+            return 'torch'
+        return backend
+
+    @property
+    def variant(self):
+        """Name identifying the model and backend (vectors differ slightly per backend)"""
+        return self.model_name if self.backend == 'torch' else f"{self.model_name}+onnx-int8"
+
+    def _load(self):
+        """Load the model for the selected backend"""
+        if self.backend == 'onnx':
+            from backend.onnx_encoder import OnnxEncoder, ensure_onnx_model
+
+            ensure_onnx_model(self.model_name, config.EMBEDDING_ONNX_DIR)
+            return OnnxEncoder(config.EMBEDDING_ONNX_DIR, threads=self.threads or config.EMBEDDING_ONNX_THREADS)
+
+        from sentence_transformers import SentenceTransformer
+
+        if self.threads:
+            import torch
+
+            torch.set_num_threads(self.threads)
+
+        return SentenceTransformer(self.model_name)
+
+    def get_model(self):
+        """
+        Get the shared model, loading it if needed
+
+        Returns:
+            SentenceTransformer or OnnxEncoder instance
+
+        Raises:
+            Exception if the model cannot be loaded
+        """
+        if self.model is not None:
+            return self.model
+
+        with self.lock:
+            # Another thread may have finished loading while we waited
+            if self.model is None:
+                start = time.perf_counter()
+                try:
+                    self.model = self._load()
+                except Exception as e:
+                    self.error = str(e)
+                    logger.error(f"✗ Failed to load {self.model_name}: {self.error}")
+                    raise
+                self.load_seconds = time.perf_counter() - start
+                self.error = None
+                logger.info(f"✓ Embedding model loaded: {self.variant} ({self.load_seconds:.1f}s)")
+
+            return self.model
+
+    def warm_up(self):
+        """Load the model now instead of on first use; returns True on success"""
+        try:
+            self.get_model()
+            return True
+        except Exception:
+            return False
+
+    def warm_up_async(self):
+        """Load the model in a background thread"""
+        thread = threading.Thread(target=self.warm_up, name='model-warm-up')
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def is_ready(self):
+        """Return True once the model is loaded"""
+        return self.model is not None
+
+    def status(self):
+        """Readiness details for health endpoints"""
+        return {
+            "ready": self.is_ready(),
+            "model": self.model_name,
+            "backend": self.backend,
+            "load_seconds": self.load_seconds,
+            "error": self.error
+        }
+
+
+# Global instance for use across modules
+model_registry = ModelRegistry()
@@ -0,0 +1,138 @@
+import json
+import logging
+import os
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILE = 'model.int8.onnx'
+TOKENIZER_FILE = 'tokenizer.json'
+SETTINGS_FILE = 'encoder.json'
+
+
+def export_onnx_model(model_name, model_dir):
+    """
+    Export a Sentence-Transformers model to an int8-quantized ONNX model
+
+    The transformer is exported with dynamic batch and sequence axes, then
+    its weights are quantized to int8 with ONNX Runtime's dynamic
+    quantization. Pooling and normalization are done in numpy by
+    OnnxEncoder, so only the transformer goes into the graph. Needs torch
+    and sentence-transformers; only runs once per model directory.
+
+    Args:
+        model_name: Sentence-Transformers model name
+        model_dir: Directory to write the model, tokenizer and settings to
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from sentence_transformers import SentenceTransformer
+
+    os.makedirs(model_dir, exist_ok=True)
+    model = SentenceTransformer(model_name, device='cpu')
+    transformer = model[0].auto_model.eval()
+    model.tokenizer.save_pretrained(model_dir)
+
+    sample = model.tokenizer(["An example sentence to trace the model"], return_tensors='pt')
+    input_names = ['input_ids', 'attention_mask', 'token_type_ids']
+    fp32_path = os.path.join(model_dir, 'model.fp32.onnx')
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            tuple(sample[name] for name in input_names),
+            fp32_path,
+            input_names=input_names,
+            output_names=['last_hidden_state'],
+            dynamic_axes={name: {0: 'batch', 1: 'sequence'} for name in input_names + ['last_hidden_state']},
+            opset_version=14
+        )
+
+    quantize_dynamic(fp32_path, os.path.join(model_dir, MODEL_FILE), weight_type=QuantType.QInt8)
+    os.remove(fp32_path)
+
+    with open(os.path.join(model_dir, SETTINGS_FILE), 'w') as f:
+        json.dump({
+            'model': model_name,
+            'max_seq_length': model.max_seq_length,
+            'dimension': model.get_sentence_embedding_dimension(),
+            'normalize': any(type(module).__name__ == 'Normalize' for module in model)
+        }, f, indent=2)
+    logger.info(f"✓ Exported int8 ONNX model for {model_name} to {model_dir}")
+
+
+def ensure_onnx_model(model_name, model_dir):
+    """Export the model into model_dir unless an export is already there"""
+    if not os.path.exists(os.path.join(model_dir, MODEL_FILE)):
+        logger.info(f"🔧 Exporting {model_name} to int8 ONNX (one-time)...")
+        export_onnx_model(model_name, model_dir)
+
+
+class OnnxEncoder:
+    """
+    Sentence embeddings from an int8-quantized transformer on ONNX Runtime
+
+    A drop-in replacement for SentenceTransformer.encode: texts are
+    tokenized with the model's fast tokenizer, run through the quantized
+    transformer, mean-pooled over their attention mask and L2-normalized,
+    matching the all-MiniLM-L6-v2 pipeline and its 384-dim output.
+    """
+
+    def __init__(self, model_dir, threads=0):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        with open(os.path.join(model_dir, SETTINGS_FILE)) as f:
+            settings = json.load(f)
+        self.dimension = settings['dimension']
+        self.normalize = settings['normalize']
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, TOKENIZER_FILE))
+        self.tokenizer.enable_truncation(max_length=settings['max_seq_length'])
+        self.tokenizer.enable_padding()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, MODEL_FILE), options, providers=['CPUExecutionProvider']
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, **kwargs):
+        """
+        Embed texts
+
+        Args:
+            texts: List of texts (or a single text)
+            batch_size: Texts per inference call
+            convert_to_numpy: Accepted for SentenceTransformer compatibility;
+                results are always numpy arrays
+
+        Returns:
+            float32 array of shape (len(texts), dimension), or (dimension,)
+            for a single text
+        """
+        single = isinstance(texts, str)
+        if single:
+            texts = [texts]
+
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            encodings = self.tokenizer.encode_batch(list(texts[start:start + batch_size]))
+            input_ids = np.array([encoding.ids for encoding in encodings], dtype=np.int64)
+            attention_mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+
+            feeds = {'input_ids': input_ids, 'attention_mask': attention_mask}
+            if 'token_type_ids' in self.input_names:
+                feeds['token_type_ids'] = np.zeros_like(input_ids)
+            hidden = self.session.run(None, feeds)[0]
+
+            # Mean pooling over real (non-padding) tokens
+            mask = attention_mask[..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if self.normalize:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            embeddings[start:start + len(encodings)] = pooled
+
+        return embeddings[0] if single else embeddings
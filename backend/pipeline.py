@@ -0,0 +1,195 @@
+import logging
+import config
+from backend.document import Document
+from backend.scan_store import fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+class ScanPipeline:
+    """Runs the fetch → compare → AI analysis → DKG publish scan over topics"""
+
+    def __init__(self, scraper, comparator, cerebras, dkg, store):
+        self.scraper = scraper
+        self.comparator = comparator
+        self.cerebras = cerebras
+        self.dkg = dkg
+        self.store = store
+
+    def run(self, topics, status, incremental=True):
+        """
+        Scan topics, updating a shared status dict as topics complete
+
+        Args:
+            topics: List of topic names
+            status: dict with status/progress/current_topic keys to update
+            incremental: Reuse stages whose inputs match the previous scan
+        """
+        status["status"] = "processing"
+
+        # Content for both sources is fetched concurrently; topics arrive
+        # here in the order their fetches complete and are processed in
+        # batches so their embeddings are generated together
+        batch = []
+        for i, (topic, wiki, grok) in enumerate(self.scraper.fetch_many(topics)):
+            status["current_topic"] = topic
+            status["progress"] = int((i / len(topics)) * 100)
+
+            if not wiki or not grok:
+                logger.warning(f"⚠ Skipping {topic}: content fetch failed")
+                continue
+
+            batch.append((topic, wiki, grok))
+            if len(batch) >= config.SCAN_BATCH_SIZE:
+                self.process_batch(batch, incremental)
+                batch = []
+
+        if batch:
+            self.process_batch(batch, incremental)
+
+        self.comparator.flush()
+        status["status"] = "completed"
+        status["progress"] = 100
+
+    def process_batch(self, items, incremental=True):
+        """
+        Run the scan stages for a batch of fetched topics
+
+        Topics whose comparison stage has to run are compared together, so
+        their articles share one batched embedding pass. Each article is
+        wrapped in a Document once, here, and every stage reads that.
+
+        Args:
+            items: List of (topic, wiki, grok) fetch results
+            incremental: Reuse stages whose inputs match the previous scan
+        """
+        documents = [(Document(wiki['content']), Document(grok['content'])) for _, wiki, grok in items]
+        pending = [
+            (topic, wiki_doc, grok_doc)
+            for (topic, _, _), (wiki_doc, grok_doc) in zip(items, documents)
+            if self._needs_comparison(topic, wiki_doc, grok_doc, incremental)
+        ]
+
+        comparisons = {}
+        if pending:
+            try:
+                comparisons = dict(zip(
+                    [topic for topic, _, _ in pending],
+                    self.comparator.compare_topics_batch(pending)
+                ))
+            except Exception as e:
+                logger.error(f"✗ Batch comparison failed, comparing topics one by one: {str(e)}")
+
+        for (topic, wiki, grok), topic_documents in zip(items, documents):
+            try:
+                self.process_topic(topic, wiki, grok, incremental, comparisons.get(topic), topic_documents)
+            except Exception as e:
+                logger.error(f"✗ Error scanning {topic}: {str(e)}")
+
+    def _needs_comparison(self, topic, wiki_doc, grok_doc, incremental):
+        """Check whether a topic's comparison stage would have to run"""
+        previous = (self.store.get(topic) if incremental else None) or {}
+        inputs = fingerprint(wiki_doc.hash, grok_doc.hash, self.comparator.settings)
+        return (
+            'error' in previous.get('comparison_metadata', {})
+            or previous.get('stage_inputs', {}).get('comparison') != inputs
+        )
+
+    def process_topic(self, topic, wiki, grok, incremental=True, comparison=None, documents=None):
+        """
+        Run the scan stages for one topic
+
+        Each stage records a fingerprint of its inputs. On an incremental
+        scan a stage is rerun only if that fingerprint changed since the
+        previous scan or the stage failed last time; otherwise its previous
+        output is reused, so unchanged topics cost no embeddings, LLM tokens
+        or DKG publishes.
+
+        Args:
+            topic: Topic name
+            wiki: fetch_wikipedia result
+            grok: fetch_grokipedia result
+            incremental: Reuse stages whose inputs match the previous scan
+            comparison: Precomputed compare_topics() result to use if the
+                comparison stage has to run
+            documents: (wiki, grok) Documents of the fetched content, if
+                already built
+
+        Returns:
+            Stored scan result dict
+        """
+        previous = (self.store.get(topic) if incremental else None) or {}
+        previous_inputs = previous.get('stage_inputs', {})
+        stage_inputs = {}
+        rerun = []
+
+        def stale(stage, *inputs, failed=False):
+            stage_inputs[stage] = fingerprint(*inputs)
+            if failed or previous_inputs.get(stage) != stage_inputs[stage]:
+                rerun.append(stage)
+                return True
+            return False
+
+        wiki_doc, grok_doc = documents or (Document(wiki['content']), Document(grok['content']))
+        wiki_hash = wiki_doc.hash
+        grok_hash = grok_doc.hash
+
+        # Vector comparison
+        comparison_failed = 'error' in previous.get('comparison_metadata', {})
+        if stale('comparison', wiki_hash, grok_hash, self.comparator.settings, failed=comparison_failed):
+            if comparison is None:
+                comparison = self.comparator.compare_topics(topic, wiki_doc, grok_doc)
+        else:
+            comparison = {
+                key: previous[key]
+                for key in ('similarity_score', 'discrepancies', 'comparison_metadata', 'passage_alignment')
+                if key in previous
+            }
+
+        # Store content for AI analysis
+        comparison['wiki_content'] = wiki_doc.raw
+        comparison['grok_content'] = grok_doc.raw
+        comparison['topic'] = topic
+        comparison['wiki_hash'] = wiki_hash
+        comparison['grok_hash'] = grok_hash
+
+        # AI-powered analysis with Cerebras
+        if stale('ai_analysis', wiki_hash, grok_hash, comparison['discrepancies'],
+                 failed=not previous.get('analysis_success')):
+            ai_analysis = self.cerebras.analyze_discrepancies(
+                topic, wiki_doc, grok_doc, comparison['discrepancies']
+            )
+            comparison['ai_analysis'] = ai_analysis['ai_analysis']
+            comparison['analysis_success'] = ai_analysis['success']
+        else:
+            comparison['ai_analysis'] = previous['ai_analysis']
+            comparison['analysis_success'] = previous['analysis_success']
+
+        # Generate Community Note
+        if stale('community_note', comparison['similarity_score'],
+                 comparison['discrepancies'], comparison['ai_analysis']):
+            comparison['community_note'] = self.cerebras.generate_community_note(
+                topic, comparison['similarity_score'],
+                comparison['discrepancies'], comparison['ai_analysis']
+            )
+        else:
+            comparison['community_note'] = previous['community_note']
+
+        # Publish to DKG
+        if stale('ual', comparison['discrepancies'], comparison['similarity_score'],
+                 comparison['ai_analysis'], failed=not previous.get('ual')):
+            comparison['ual'] = self.dkg.publish_community_note(
+                topic, comparison['discrepancies'],
+                comparison['similarity_score'], comparison['ai_analysis']
+            )
+        else:
+            comparison['ual'] = previous['ual']
+
+        comparison['stage_inputs'] = stage_inputs
+        self.store.put(topic, comparison)
+
+        if rerun:
+            logger.info(f"✓ Completed: {topic} (ran: {', '.join(rerun)})")
+        else:
+            logger.info(f"✓ Unchanged: {topic} (reused previous scan)")
+        return comparison
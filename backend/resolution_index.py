@@ -0,0 +1,87 @@
+import json
+import logging
+import os
+import threading
+import time
+import config
+
+logger = logging.getLogger(__name__)
+
+# Unsaved changes tolerated before the index is written out automatically
+AUTOSAVE_EVERY = 100
+
+
+class ResolutionIndex:
+    """
+    Persisted map from input topics to where they live on each source
+
+    Stores the canonical Wikipedia title and the working Grokipedia slug for
+    each topic, so later scans can skip search, disambiguation and slug
+    guessing. A value of None records that the topic was not found; such
+    negative entries expire after the negative TTL so the topic is retried.
+    Grokipedia slugs that returned 404 are kept as negative entries under
+    'grokipedia_slugs', so no topic requests them again within the TTL.
+    """
+
+    def __init__(self, path=None, negative_ttl=None):
+        self.path = path or config.RESOLUTION_INDEX_PATH
+        self.negative_ttl = config.RESOLUTION_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        self.lock = threading.Lock()
+        self.dirty = 0
+        self.entries = {'wikipedia': {}, 'grokipedia': {}, 'grokipedia_slugs': {}}
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries.update(json.load(f))
+            logger.info(f"✓ Loaded resolution index: {sum(len(v) for v in self.entries.values())} entries")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠ Ignoring unreadable resolution index: {str(e)}")
+
+    def get(self, source, topic):
+        """
+        Look up how a topic resolved on a source
+
+        Args:
+            source: 'wikipedia', 'grokipedia' or 'grokipedia_slugs'
+            topic: Input topic name (or slug)
+
+        Returns:
+            dict with {value, checked_at} where value is the title/slug or
+            None for a known miss; None if the topic is unknown or its
+            negative entry has expired
+        """
+        with self.lock:
+            entry = self.entries[source].get(topic)
+        if entry and entry['value'] is None and time.time() - entry['checked_at'] > self.negative_ttl:
+            return None
+        return entry
+
+    def set(self, source, topic, value):
+        """Record a resolved title/slug, or None if the topic was not found"""
+        with self.lock:
+            entry = self.entries[source].get(topic)
+            if entry and entry['value'] == value and value is not None:
+                return
+            self.entries[source][topic] = {'value': value, 'checked_at': time.time()}
+            self.dirty += 1
+            autosave = self.dirty >= AUTOSAVE_EVERY
+
+        if autosave:
+            self.flush()
+
+    def flush(self):
+        """Write pending changes to disk"""
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.entries, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self.dirty = 0
+            except OSError as e:
+                logger.warning(f"⚠ Failed to save resolution index: {str(e)}")
@@ -0,0 +1,66 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text):
+    """Fingerprint article text so unchanged content can be recognized"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def fingerprint(*parts):
+    """Fingerprint arbitrary JSON-serializable stage inputs"""
+    data = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class ScanStore:
+    """
+    Persisted scan results, one JSON file per topic
+
+    Results survive restarts so incremental scans can compare content
+    fingerprints against the previous run and reuse unchanged stages.
+    """
+
+    def __init__(self, scan_dir=None):
+        self.scan_dir = scan_dir or config.SCAN_RESULTS_DIR
+        self.lock = threading.Lock()
+        self.results = {}
+
+        try:
+            os.makedirs(self.scan_dir, exist_ok=True)
+            for entry in os.scandir(self.scan_dir):
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        result = json.load(f)
+                    self.results[result['topic']] = result
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning(f"⚠ Skipping unreadable scan result {entry.name}: {str(e)}")
+            logger.info(f"✓ Loaded {len(self.results)} stored scan results")
+        except OSError as e:
+            logger.warning(f"⚠ Scan result storage unavailable: {str(e)}")
+
+    def get(self, topic):
+        """Return the stored result for a topic, or None"""
+        return self.results.get(topic)
+
+    def put(self, topic, result):
+        """Store a topic's result in memory and on disk"""
+        self.results[topic] = result
+        path = os.path.join(self.scan_dir, f"{hashlib.sha1(topic.encode('utf-8')).hexdigest()}.json")
+
+        with self.lock:
+            try:
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(result, f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"⚠ Failed to persist scan result for {topic}: {str(e)}")
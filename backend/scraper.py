@@ -1,30 +1,333 @@
-import json
 import logging
-import wikipedia
+import re
+import threading
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from backend.content_cache import ContentCache
+from backend.extraction import EXTRACTION_VERSION, SoupExtractor, get_extractor
+from backend.http_client import http_client
+from backend.resolution_index import ResolutionIndex
+from backend.topic_catalog import TopicCatalog
+import config
 
 logger = logging.getLogger(__name__)
 
+WIKIPEDIA_HOST = 'wikipedia.org'
+GROKIPEDIA_HOST = 'grokipedia.com'
+WIKIPEDIA_API_URL = 'https://en.wikipedia.org/w/api.php'
+
 
 class ContentScraper:
     """Fetches content from Wikipedia and Grokipedia"""
     
     def __init__(self):
         self.timeout = 10
-        wikipedia.set_lang("en")
+        self.max_workers = config.FETCH_MAX_WORKERS
+        # One semaphore per host caps concurrent requests during fetch_many()
+        self.host_limits = {
+            host: threading.BoundedSemaphore(limit)
+            for host, limit in config.FETCH_HOST_LIMITS.items()
+        }
+        self.cache = ContentCache()
+        self.resolutions = ResolutionIndex()
+        self.extractor = get_extractor()
+        self.catalog = TopicCatalog()
+        self._wikipedia = None
+    
+    @property
+    def wikipedia(self):
+        """The wikipedia package, imported on first use (only fallbacks need it)"""
+        if self._wikipedia is None:
+            import wikipedia
+            wikipedia.set_lang("en")
+            self._wikipedia = wikipedia
+        return self._wikipedia
     
     def get_topics(self):
-        """Load topics from data/topics.json"""
+        """Load topics from the catalog file (config.TOPICS_PATH)"""
+        return self.catalog.topics()
+    
+    def fetch_many(self, topics, max_workers=None):
+        """
+        Fetch Wikipedia and Grokipedia articles for many topics concurrently
+        
+        Both sources are fetched on a bounded thread pool, with requests to
+        each host capped by config.FETCH_HOST_LIMITS. Wikipedia topics are
+        fetched in batches through fetch_wikipedia_bulk().
+        
+        Args:
+            topics: Iterable of topic names
+            max_workers: Thread pool size (defaults to config.FETCH_MAX_WORKERS)
+            
+        Yields:
+            (topic, wiki, grok) tuples in the order topics complete, where wiki
+            and grok are fetch_wikipedia/fetch_grokipedia results (None if failed)
+        """
+        topics = list(dict.fromkeys(topics))
+        batch_size = config.WIKIPEDIA_BATCH_SIZE
+        executor = ThreadPoolExecutor(max_workers=max_workers or self.max_workers)
+        
         try:
-            with open('data/topics.json', 'r') as f:
-                topics = json.load(f)
-            logger.info(f"✓ Loaded {len(topics)} topics")
-            return topics
+            # Every task returns a {topic: result} dict for its batch of topics
+            futures = {}
+            for i in range(0, len(topics), batch_size):
+                batch = topics[i:i + batch_size]
+                future = executor.submit(self._fetch_limited, WIKIPEDIA_HOST, self.fetch_wikipedia_bulk, batch)
+                futures[future] = ('wikipedia', batch)
+            for topic in topics:
+                future = executor.submit(self._fetch_limited, GROKIPEDIA_HOST, self._fetch_grokipedia_batch, [topic])
+                futures[future] = ('grokipedia', [topic])
+            
+            # Hold each topic's first result until its other source arrives
+            partial = {}
+            for future in as_completed(futures):
+                source, batch = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.error(f"✗ {source} fetch crashed for {len(batch)} topic(s): {str(e)}")
+                    results = {}
+                
+                for topic in batch:
+                    fetched = partial.setdefault(topic, {})
+                    fetched[source] = results.get(topic)
+                    if len(fetched) == 2:
+                        del partial[topic]
+                        yield topic, fetched['wikipedia'], fetched['grokipedia']
+        finally:
+            # Don't block on queued fetches if the consumer stops early
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.resolutions.flush()
+    
+    def _fetch_limited(self, host, fetch, batch):
+        """Run a batch fetch while holding one of the host's concurrency slots"""
+        with self.host_limits[host]:
+            return fetch(batch)
+    
+    def _fetch_grokipedia_batch(self, topics):
+        """Fetch Grokipedia pages one by one, keyed by topic"""
+        return {topic: self.fetch_grokipedia(topic) for topic in topics}
+    
+    def fetch_wikipedia_bulk(self, topics):
+        """
+        Fetch many Wikipedia articles through multi-title MediaWiki queries
+        
+        Up to config.WIKIPEDIA_BATCH_SIZE titles are resolved per request,
+        with title normalization and redirects handled by the API in the same
+        call. Only topics that don't resolve to an article (missing pages and
+        disambiguation pages) fall back to search via the wikipedia package.
+        Topics already in the resolution index skip straight to their
+        canonical title (or are skipped if recently not found), fresh cached
+        articles need no request, and articles whose cached revision ID
+        still matches are not downloaded.
+        
+        Requests per batch: 1 title query, plus 1 extract request per
+        article downloaded (MediaWiki returns one full extract per
+        response), plus the wikipedia package's search and page lookups for
+        topics that don't resolve. The per-topic path needs about 2 requests
+        per article, so an uncached batch costs about half as many requests;
+        a rescan of unchanged articles costs only the title query.
+        
+        Args:
+            topics: List of topic names
+            
+        Returns:
+            dict mapping each topic to {title, content, url, timestamp, revid}
+            or None if it could not be fetched
+        """
+        topics = list(dict.fromkeys(topics))
+        batch_size = config.WIKIPEDIA_BATCH_SIZE
+        results = {}
+        
+        for i in range(0, len(topics), batch_size):
+            batch = topics[i:i + batch_size]
+            
+            # Consult the resolution index before touching the network
+            titles, fresh = {}, {}
+            for topic in batch:
+                resolution = self.resolutions.get('wikipedia', topic)
+                if resolution is None:
+                    titles[topic] = topic
+                elif resolution['value'] is None:
+                    results[topic] = None
+                else:
+                    entry = self.cache.get('wikipedia', resolution['value'])
+                    if entry and self.cache.is_fresh(entry):
+                        fresh[topic] = entry
+                    else:
+                        titles[topic] = resolution['value']
+            
+            try:
+                resolved = self._resolve_wikipedia_titles(list(dict.fromkeys(titles.values())))
+                pages = {topic: resolved.get(title) for topic, title in titles.items()}
+                
+                # Cached articles whose revision hasn't changed skip the download
+                cached = {}
+                for topic, page in pages.items():
+                    if page:
+                        entry = self.cache.get('wikipedia', page['title'])
+                        if entry and entry.get('revid') == page.get('lastrevid'):
+                            cached[topic] = entry
+                
+                extracts = self._fetch_wikipedia_extracts(
+                    [page['pageid'] for topic, page in pages.items() if page and topic not in cached]
+                )
+            except requests.exceptions.RequestException as e:
+                logger.error(f"✗ Wikipedia bulk query failed, fetching {len(titles)} topics one by one: {str(e)}")
+                pages, cached, extracts = {}, {}, {}
+            
+            for topic, entry in fresh.items():
+                results[topic] = entry['result']
+            
+            for topic in titles:
+                page = pages.get(topic)
+                if topic in cached:
+                    self.cache.touch('wikipedia', page['title'], cached[topic])
+                    results[topic] = cached[topic]['result']
+                    self.resolutions.set('wikipedia', topic, page['title'])
+                elif page and page['pageid'] in extracts:
+                    results[topic] = {
+                        'title': page['title'],
+                        'content': extracts[page['pageid']],
+                        'url': page['fullurl'],
+                        'timestamp': datetime.utcnow().isoformat(),
+                        'revid': page.get('lastrevid')
+                    }
+                    self.cache.put('wikipedia', page['title'], results[topic], revid=page.get('lastrevid'))
+                    self.resolutions.set('wikipedia', topic, page['title'])
+                elif pages:
+                    # Resolution failed for this title only, so search for it
+                    results[topic] = self._search_wikipedia(topic)
+                else:
+                    results[topic] = self.fetch_wikipedia(topic)
+            
+            fetched = sum(1 for topic in batch if results[topic])
+            unchanged = len(fresh) + len(cached)
+            logger.info(f"✓ Fetched Wikipedia batch: {fetched}/{len(batch)} topics ({unchanged} unchanged)")
+        
+        return results
+    
+    def _query_wikipedia(self, params):
+        """Run a MediaWiki action=query request and return the JSON body"""
+        params = dict(params, action='query', format='json', formatversion=2)
+        response = http_client.get(WIKIPEDIA_API_URL, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        if 'error' in data:
+            raise requests.exceptions.RequestException(data['error'].get('info', 'MediaWiki API error'))
+        return data
+    
+    def _resolve_wikipedia_titles(self, topics):
+        """
+        Resolve topics to Wikipedia pages in a single MediaWiki query
+        
+        Args:
+            topics: List of at most config.WIKIPEDIA_BATCH_SIZE topic names
+            
+        Returns:
+            dict mapping each topic to its page info {pageid, title, fullurl,
+            lastrevid} or None if missing, invalid or a disambiguation page
+        """
+        if not topics:
+            return {}
+        
+        data = self._query_wikipedia({
+            'titles': '|'.join(topics),
+            'redirects': 1,
+            'prop': 'info|pageprops',
+            'inprop': 'url',
+            'ppprop': 'disambiguation'
+        })
+        query = data.get('query', {})
+        
+        normalized = {item['from']: item['to'] for item in query.get('normalized', [])}
+        redirects = {item['from']: item['to'] for item in query.get('redirects', [])}
+        pages = {page['title']: page for page in query.get('pages', [])}
+        
+        resolved = {}
+        for topic in topics:
+            title = normalized.get(topic, topic)
+            title = redirects.get(title, title)
+            page = pages.get(title)
+            
+            if (not page or page.get('missing') or page.get('invalid')
+                    or 'disambiguation' in page.get('pageprops', {})):
+                resolved[topic] = None
+            else:
+                resolved[topic] = page
+        
+        return resolved
+    
+    def _fetch_wikipedia_extracts(self, pageids):
+        """
+        Download plaintext extracts for resolved pages
+        
+        MediaWiki returns at most one full-article extract per response, so
+        the remaining pages are walked through the query continuation
+        (excontinue): one request per page.
+        
+        Args:
+            pageids: List of page IDs from _resolve_wikipedia_titles()
+            
+        Returns:
+            dict mapping page ID to article plaintext
+        """
+        extracts = {}
+        if not pageids:
+            return extracts
+        
+        params = {
+            'pageids': '|'.join(str(pageid) for pageid in pageids),
+            'prop': 'extracts',
+            'explaintext': 1
+        }
+        while True:
+            data = self._query_wikipedia(params)
+            for page in data.get('query', {}).get('pages', []):
+                if page.get('extract'):
+                    extracts[page['pageid']] = page['extract']
+            
+            if 'continue' not in data:
+                return extracts
+            params = dict(params, **data['continue'])
+    
+    def _search_wikipedia(self, topic):
+        """
+        Fetch the best Wikipedia search hit for a topic that didn't resolve
+        
+        Args:
+            topic: Topic name to search
+            
+        Returns:
+            dict with {title, content, url, timestamp} or None if failed
+        """
+        wikipedia = self.wikipedia
+        
+        try:
+            search_results = wikipedia.search(topic, results=3)
+            if not search_results:
+                logger.error(f"✗ Wikipedia page not found: {topic}")
+                self.resolutions.set('wikipedia', topic, None)
+                return None
+            
+            try:
+                page = wikipedia.page(search_results[0], auto_suggest=False)
+            except wikipedia.exceptions.DisambiguationError as e:
+                page = wikipedia.page(e.options[0], auto_suggest=False)
+            
+            self.resolutions.set('wikipedia', topic, page.title)
+            logger.info(f"✓ Fetched Wikipedia (searched): {topic} -> {page.title}")
+            return {
+                'title': page.title,
+                'content': page.content,
+                'url': page.url,
+                'timestamp': datetime.utcnow().isoformat()
+            }
+            
         except Exception as e:
-            logger.error(f"✗ Failed to load topics: {str(e)}")
-            return []
+            logger.error(f"✗ Wikipedia search failed for {topic}: {str(e)}")
+            return None
     
     def fetch_wikipedia(self, topic):
         """
@@ -36,10 +339,18 @@ class ContentScraper:
         Returns:
             dict with {title, content, url, timestamp} or None if failed
         """
+        resolution = self.resolutions.get('wikipedia', topic)
+        if resolution and resolution['value'] is None:
+            logger.info(f"⚠ Skipping Wikipedia for {topic}: not found on a recent scan")
+            return None
+        
+        wikipedia = self.wikipedia
+        
         try:
-            # First, try exact match without auto-suggest
+            # First, try exact match without auto-suggest (or the title it
+            # resolved to on an earlier scan)
             try:
-                page = wikipedia.page(topic, auto_suggest=False)
+                page = wikipedia.page(resolution['value'] if resolution else topic, auto_suggest=False)
                 
                 result = {
                     'title': page.title,
@@ -48,6 +359,7 @@ class ContentScraper:
                     'timestamp': datetime.utcnow().isoformat()
                 }
                 
+                self.resolutions.set('wikipedia', topic, page.title)
                 logger.info(f"✓ Fetched Wikipedia: {topic}")
                 return result
                 
@@ -58,6 +370,7 @@ class ContentScraper:
                 
                 if not search_results:
                     logger.error(f"✗ Wikipedia page not found: {topic}")
+                    self.resolutions.set('wikipedia', topic, None)
                     return None
                 
                 # Try the first search result
@@ -70,6 +383,7 @@ class ContentScraper:
                     'timestamp': datetime.utcnow().isoformat()
                 }
                 
+                self.resolutions.set('wikipedia', topic, page.title)
                 logger.info(f"✓ Fetched Wikipedia (searched): {topic} -> {page.title}")
                 return result
             
@@ -84,6 +398,7 @@ class ContentScraper:
                     'url': page.url,
                     'timestamp': datetime.utcnow().isoformat()
                 }
+                self.resolutions.set('wikipedia', topic, page.title)
                 logger.info(f"✓ Fetched Wikipedia (disambiguated): {topic} -> {page.title}")
                 return result
             except Exception as inner_e:
@@ -92,6 +407,7 @@ class ContentScraper:
                 
         except wikipedia.exceptions.PageError:
             logger.error(f"✗ Wikipedia page not found: {topic}")
+            self.resolutions.set('wikipedia', topic, None)
             return None
             
         except Exception as e:
@@ -106,86 +422,41 @@ class ContentScraper:
         - First letter capitalized
         - Spaces replaced with underscores
         
+        The slug that worked on an earlier scan is tried first; topics with
+        no page on a recent scan are skipped without a request. Otherwise at
+        most config.GROKIPEDIA_MAX_SLUGS candidate slugs are tried, skipping
+        slugs that returned 404 on a recent scan. Pages already
+        in the content cache are served without a request while fresh, and
+        revalidated with If-None-Match/If-Modified-Since otherwise.
+        
         Args:
             topic: Topic name to search
             
         Returns:
             dict with {title, content, url, timestamp} or None if failed
         """
+        resolution = self.resolutions.get('grokipedia', topic)
+        if resolution and resolution['value'] is None:
+            logger.info(f"⚠ Skipping Grokipedia for {topic}: not found on a recent scan")
+            return None
+        
+        slugs = self._grokipedia_slugs(topic)[:config.GROKIPEDIA_MAX_SLUGS]
+        if resolution:
+            slugs = [resolution['value']] + [slug for slug in slugs if slug != resolution['value']]
+        
         try:
-            # Format topic for Grokipedia URL
-            # Rules:
-            # - If entire word is uppercase (acronym like NLP, AI), keep it uppercase
-            # - Otherwise: capitalize first letter, rest lowercase
-            # - Spaces become underscores
-            # Examples: "NLP" -> "NLP", "Machine Learning" -> "Machine_learning"
-            
-            words = topic.split(' ')
-            formatted_words = []
-            
-            for word in words:
-                # Check if entire word is uppercase (acronym)
-                if word.isupper() and len(word) > 1:
-                    # Keep acronyms uppercase
-                    formatted_words.append(word)
-                elif word:
-                    # Regular word: capitalize first letter, rest lowercase
-                    formatted_words.append(word[0].upper() + word[1:].lower())
-            
-            formatted_topic = '_'.join(formatted_words)
-            
-            url = f"https://grokipedia.com/page/{formatted_topic}"
-            
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract title - try multiple selectors
-            title_elem = (soup.find('h1', class_='page-title') or 
-                         soup.find('h1', class_='title') or 
-                         soup.find('h1') or
-                         soup.find('title'))
-            title = title_elem.get_text(strip=True) if title_elem else topic
-            
-            # Extract content - try multiple selectors for article content
-            content_elem = (soup.find('div', class_='content') or 
-                           soup.find('article') or
-                           soup.find('div', class_='article-content') or
-                           soup.find('div', class_='page-content') or
-                           soup.find('main'))
-            
-            if content_elem:
-                # Remove script, style, and navigation elements
-                for element in content_elem(['script', 'style', 'nav', 'header', 'footer']):
-                    element.decompose()
-                
-                # Get text content
-                content = content_elem.get_text(separator='\n', strip=True)
-            else:
-                # Fallback: get all text from body
-                body = soup.find('body')
-                if body:
-                    for element in body(['script', 'style', 'nav', 'header', 'footer']):
-                        element.decompose()
-                    content = body.get_text(separator='\n', strip=True)
-                else:
-                    content = ""
-            
-            # Clean up excessive whitespace
-            import re
-            content = re.sub(r'\n\s*\n', '\n\n', content)
-            content = content.strip()
-            
-            result = {
-                'title': title,
-                'content': content,
-                'url': url,
-                'timestamp': datetime.utcnow().isoformat()
-            }
+            for slug in slugs:
+                if self.resolutions.get('grokipedia_slugs', slug):
+                    continue
+                result = self._fetch_grokipedia_page(topic, slug)
+                if result:
+                    self.resolutions.set('grokipedia', topic, slug)
+                    return result
+                self.resolutions.set('grokipedia_slugs', slug, None)
             
-            logger.info(f"✓ Fetched Grokipedia: {topic} ({len(content)} chars)")
-            return result
+            logger.error(f"✗ Grokipedia page not found: {topic}")
+            self.resolutions.set('grokipedia', topic, None)
+            return None
             
         except requests.exceptions.Timeout:
             logger.error(f"✗ Grokipedia timeout for {topic}")
@@ -202,3 +473,125 @@ class ContentScraper:
         except Exception as e:
             logger.error(f"✗ Grokipedia scraping failed for {topic}: {str(e)}")
             return None
+    
+    def _fetch_grokipedia_page(self, topic, slug):
+        """
+        Fetch one Grokipedia page through the content cache
+        
+        Args:
+            topic: Topic name
+            slug: URL slug to try
+            
+        Returns:
+            dict with {title, content, url, timestamp} or None on 404
+        """
+        url = f"https://grokipedia.com/page/{slug}"
+        # Pages parsed by an older extractor are not reused, even if unchanged
+        cache_key = f"{slug}@v{EXTRACTION_VERSION}"
+        
+        cached = self.cache.get('grokipedia', cache_key)
+        if cached and self.cache.is_fresh(cached):
+            logger.info(f"✓ Grokipedia cache hit: {topic}")
+            return cached['result']
+        
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = http_client.get(url, headers=headers, timeout=self.timeout)
+        
+        if cached and response.status_code == 304:
+            self.cache.touch('grokipedia', cache_key, cached)
+            logger.info(f"✓ Grokipedia unchanged: {topic}")
+            return cached['result']
+        
+        if response.status_code == 404:
+            logger.info(f"⚠ No Grokipedia page at {slug} for {topic}")
+            return None
+        
+        response.raise_for_status()
+        
+        result = self._parse_grokipedia(response.content, topic, url)
+        self.cache.put(
+            'grokipedia', cache_key, result,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        
+        logger.info(f"✓ Fetched Grokipedia: {topic} ({len(result['content'])} chars)")
+        return result
+    
+    def _grokipedia_slugs(self, topic):
+        """
+        Candidate Grokipedia URL slugs for a topic, most likely first
+        
+        Grokipedia mirrors Wikipedia's titles, so the topic's canonical
+        Wikipedia title comes first when the resolution index knows it.
+        
+        Rules:
+        - If entire word is uppercase (acronym like NLP, AI), keep it uppercase
+        - Otherwise: capitalize first letter, rest lowercase
+        - Spaces become underscores
+        Examples: "NLP" -> "NLP", "Machine Learning" -> "Machine_Learning"
+        
+        Sentence case ("Machine_learning") and the topic as written are
+        tried next, since Grokipedia mirrors Wikipedia's title casing.
+        """
+        words = [word for word in topic.split(' ') if word]
+        formatted_words = []
+        
+        for word in words:
+            # Check if entire word is uppercase (acronym)
+            if word.isupper() and len(word) > 1:
+                # Keep acronyms uppercase
+                formatted_words.append(word)
+            else:
+                # Regular word: capitalize first letter, rest lowercase
+                formatted_words.append(word[0].upper() + word[1:].lower())
+        
+        sentence_case = formatted_words[:1] + [
+            word if word.isupper() and len(word) > 1 else word.lower()
+            for word in formatted_words[1:]
+        ]
+        
+        candidates = ['_'.join(formatted_words), '_'.join(sentence_case), '_'.join(words)]
+        wikipedia = self.resolutions.get('wikipedia', topic)
+        if wikipedia and wikipedia['value']:
+            candidates.insert(0, wikipedia['value'].replace(' ', '_'))
+        return list(dict.fromkeys(candidates))
+    
+    def _parse_grokipedia(self, html, topic, url):
+        """
+        Extract title and article text from a Grokipedia page
+        
+        Uses the configured extraction backend, falling back to BeautifulSoup
+        if it fails on a page.
+        
+        Args:
+            html: Raw page HTML
+            topic: Topic name (used as title fallback)
+            url: Page URL
+            
+        Returns:
+            dict with {title, content, url, timestamp}
+        """
+        try:
+            title, content = self.extractor.extract(html, topic)
+        except Exception as e:
+            if isinstance(self.extractor, SoupExtractor):
+                raise
+            logger.warning(f"⚠ {self.extractor.name} extraction failed for {topic}, using BeautifulSoup: {str(e)}")
+            title, content = SoupExtractor().extract(html, topic)
+        
+        # Clean up excessive whitespace
+        content = re.sub(r'\n\s*\n', '\n\n', content)
+        content = content.strip()
+        
+        return {
+            'title': title,
+            'content': content,
+            'url': url,
+            'timestamp': datetime.utcnow().isoformat()
+        }
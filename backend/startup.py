@@ -0,0 +1,59 @@
+import logging
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """
+    Records how long each phase of app startup takes
+
+    Phases are timed with the phase() context manager. The embedding model
+    load, which normally happens after startup, is reported from the model
+    registry alongside them.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.ready_seconds = None
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block of startup work under the given phase name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+    def mark_ready(self):
+        """Record that the app is ready to serve requests"""
+        self.ready_seconds = time.perf_counter() - self.started
+        phases = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in self.phases.items())
+        logger.info(f"✓ App ready in {self.ready_seconds:.2f}s ({phases})")
+
+    def report(self, registry=None):
+        """
+        Startup timing details for health endpoints
+
+        Args:
+            registry: ModelRegistry (or EmbeddingWorkerPool) whose model load
+                time to include
+
+        Returns:
+            dict with phase timings in seconds
+        """
+        report = {
+            "ready_seconds": self.ready_seconds,
+            "phases": dict(self.phases)
+        }
+        if registry is not None:
+            report["model"] = registry.status()
+        return report
+
+
+# Global instance for use across modules; created at first import so the
+# clock starts as early as possible
+startup_timer = StartupTimer()
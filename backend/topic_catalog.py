@@ -0,0 +1,73 @@
+import json
+import logging
+import os
+import threading
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class TopicCatalog:
+    """
+    Topic list loaded from a JSON or JSONL file
+
+    The file is parsed once and re-read only when its modification time
+    changes. JSONL catalogs (one topic per line, either a JSON string or an
+    object with a "name" field) are streamed line by line, so large catalogs
+    never have to be parsed as a single document.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or config.TOPICS_PATH
+        self.lock = threading.Lock()
+        self.mtime = None
+        self.names = []
+        self.positions = {}
+
+    def topics(self):
+        """
+        Get all topic names, reloading the file if it changed
+
+        Returns:
+            list of topic names in catalog order (empty if unreadable)
+        """
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError as e:
+            logger.error(f"✗ Failed to load topics: {str(e)}")
+            return []
+
+        with self.lock:
+            if mtime != self.mtime:
+                try:
+                    names = list(dict.fromkeys(self.iter_file()))
+                except (OSError, ValueError) as e:
+                    logger.error(f"✗ Failed to load topics: {str(e)}")
+                    return self.names
+
+                self.names = names
+                self.positions = {name: i for i, name in enumerate(names)}
+                self.mtime = mtime
+                logger.info(f"✓ Loaded {len(names)} topics")
+
+            return self.names
+
+    def iter_file(self):
+        """
+        Stream topic names straight from the catalog file
+
+        Yields:
+            Topic names in file order
+        """
+        if not self.path.endswith('.jsonl'):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                yield from json.load(f)
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                item = json.loads(line)
+                yield item['name'] if isinstance(item, dict) else item
@@ -0,0 +1,160 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class VectorWriteBuffer:
+    """
+    Batches vector store writes and reads
+
+    Upserts are collected and sent in chunks of batch_size, either when a
+    chunk fills, when the oldest buffered vector has waited flush_interval
+    seconds, or on flush() (called at the end of every scan). Chunks are
+    sent concurrently on a small thread pool. Fetches go out in chunks too,
+    and are answered from buffered or in-flight writes first, so a vector is
+    readable as soon as it has been added.
+    """
+
+    def __init__(self, index, batch_size=None, flush_interval=None, max_workers=None):
+        """
+        Args:
+            index: Vector index exposing upsert(vectors=...) and fetch(ids=...)
+                (Pinecone Index or LocalVectorStore)
+            batch_size: Vectors per upsert / ids per fetch request
+            flush_interval: Seconds a buffered vector may wait before it is sent
+            max_workers: Concurrent upsert/fetch requests
+        """
+        self.index = index
+        self.batch_size = batch_size or config.VECTOR_UPSERT_BATCH_SIZE
+        self.flush_interval = flush_interval if flush_interval is not None else config.VECTOR_FLUSH_INTERVAL
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or config.VECTOR_FLUSH_WORKERS,
+            thread_name_prefix='vector-flush'
+        )
+        self.lock = threading.Lock()
+        self.timer = None
+
+        # id -> (id, values, metadata); a later write to an id replaces the
+        # buffered one, so only the latest value is ever sent
+        self.pending = {}
+        # Chunks sent but not yet acknowledged, readable until they land
+        self.in_flight = {}
+        self.futures = set()
+
+        self.upsert_requests = 0
+        self.fetch_requests = 0
+
+    def add(self, vector_id, values, metadata=None):
+        """
+        Buffer a vector for upsert
+
+        Args:
+            vector_id: Vector id
+            values: Vector values (list of floats)
+            metadata: Metadata dict
+        """
+        with self.lock:
+            self.pending[vector_id] = (vector_id, values, metadata or {})
+            if len(self.pending) >= self.batch_size:
+                self._send_pending()
+            elif self.timer is None and self.flush_interval > 0:
+                self.timer = threading.Timer(self.flush_interval, self._flush_due)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def _flush_due(self):
+        """Timer callback: send whatever has been waiting"""
+        with self.lock:
+            self.timer = None
+            self._send_pending()
+
+    def _send_pending(self):
+        """Send buffered vectors in batch_size chunks (caller holds the lock)"""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        items = list(self.pending.values())
+        self.pending = {}
+        for start in range(0, len(items), self.batch_size):
+            chunk = items[start:start + self.batch_size]
+            for item in chunk:
+                self.in_flight[item[0]] = item
+            future = self.executor.submit(self._upsert, chunk)
+            self.futures.add(future)
+            future.add_done_callback(self.futures.discard)
+
+    def _upsert(self, chunk):
+        """Send one chunk, re-buffering it if the request fails"""
+        try:
+            self.index.upsert(vectors=chunk)
+            failed = False
+        except Exception as e:
+            logger.error(f"✗ Failed to upsert {len(chunk)} vectors, will retry on next flush: {str(e)}")
+            failed = True
+
+        with self.lock:
+            self.upsert_requests += 1
+            for item in chunk:
+                vector_id = item[0]
+                if self.in_flight.get(vector_id) is item:
+                    del self.in_flight[vector_id]
+                    # Keep failed writes unless a newer value was added since
+                    if failed and vector_id not in self.pending:
+                        self.pending[vector_id] = item
+
+    def flush(self):
+        """
+        Send all buffered vectors and wait for every in-flight upsert
+
+        Returns:
+            Number of vectors still buffered because their upsert failed
+        """
+        with self.lock:
+            self._send_pending()
+            futures = list(self.futures)
+        wait(futures)
+
+        with self.lock:
+            failed = len(self.pending)
+        if failed:
+            logger.warning(f"⚠ {failed} vectors could not be stored yet")
+        return failed
+
+    def fetch_many(self, ids):
+        """
+        Fetch many vectors, in concurrent batch_size requests
+
+        Args:
+            ids: List of vector ids
+
+        Returns:
+            dict mapping id -> {id, values, metadata} for ids that exist
+        """
+        found = {}
+        with self.lock:
+            for vector_id in ids:
+                item = self.pending.get(vector_id) or self.in_flight.get(vector_id)
+                if item:
+                    found[vector_id] = {'id': item[0], 'values': list(item[1]), 'metadata': dict(item[2])}
+
+        remaining = list(dict.fromkeys(vector_id for vector_id in ids if vector_id not in found))
+        chunks = [remaining[start:start + self.batch_size] for start in range(0, len(remaining), self.batch_size)]
+        for result in self.executor.map(self._fetch, chunks):
+            for vector_id, vector in result.items():
+                found.setdefault(vector_id, {
+                    'id': vector_id,
+                    'values': list(vector['values']),
+                    'metadata': dict(vector.get('metadata') or {})
+                })
+        return found
+
+    def _fetch(self, chunk):
+        """Fetch one chunk of ids"""
+        result = self.index.fetch(ids=chunk)
+        with self.lock:
+            self.fetch_requests += 1
+        return result['vectors']
@@ -0,0 +1,266 @@
+import json
+import logging
+import os
+import threading
+import numpy as np
+import config
+
+logger = logging.getLogger(__name__)
+
+# Unsaved changes tolerated before the id/metadata index is written out
+AUTOSAVE_EVERY = 500
+
+# Metadata fields kept in arrays so filtered queries avoid a Python loop
+INDEXED_FIELDS = ('topic', 'source')
+
+INITIAL_CAPACITY = 1024
+
+
+class LocalVectorStore:
+    """
+    Persistent flat vector index with a Pinecone-style interface
+
+    Vectors live in a memory-mapped float32 matrix that doubles in size as
+    it fills; ids and metadata are kept in a JSON index next to it. Queries
+    are exact: one matrix-vector product over all stored rows, which stays
+    well under a millisecond for the tens of thousands of vectors a scan
+    produces. Supports the subset of the Pinecone Index API used here:
+    upsert, fetch, query and delete.
+    """
+
+    def __init__(self, store_dir=None, dim=384):
+        self.store_dir = store_dir or config.VECTOR_STORE_DIR
+        self.dim = dim
+        self.lock = threading.Lock()
+        self.dirty = 0
+
+        os.makedirs(self.store_dir, exist_ok=True)
+        self.vectors_path = os.path.join(self.store_dir, 'vectors.f32')
+        self.index_path = os.path.join(self.store_dir, 'index.json')
+
+        # id -> row, row -> id/metadata; None marks a free row
+        self.rows = {}
+        self.ids = []
+        self.metadata = []
+
+        index = self._load_index()
+        capacity = max(INITIAL_CAPACITY, len(index))
+        if os.path.exists(self.vectors_path) and index:
+            capacity = max(capacity, os.path.getsize(self.vectors_path) // (4 * self.dim))
+        else:
+            index = []
+        self._open(capacity)
+
+        for row, entry in enumerate(index):
+            self.ids.append(entry and entry['id'])
+            self.metadata.append(entry and entry['metadata'])
+            if entry:
+                self.rows[entry['id']] = row
+        self.free_rows = [row for row in range(len(self.ids) - 1, -1, -1) if self.ids[row] is None]
+
+        self._reindex()
+        logger.info(f"✓ Local vector store ready: {len(self.rows)} vectors")
+
+    def _load_index(self):
+        """Read the saved id/metadata index (a list with one entry per row)"""
+        if not os.path.exists(self.index_path):
+            return []
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('dim') != self.dim:
+                logger.warning("⚠ Vector store dimension changed, starting empty")
+                return []
+            return index['rows']
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠ Ignoring unreadable vector store index: {str(e)}")
+            return []
+
+    def _open(self, capacity):
+        """Map the vector file, growing it to capacity rows if needed"""
+        size = capacity * self.dim * 4
+        with open(self.vectors_path, 'ab') as f:
+            if f.tell() < size:
+                f.truncate(size)
+        self.capacity = capacity
+        self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode='r+', shape=(capacity, self.dim))
+
+    def _reindex(self):
+        """Rebuild the in-memory norms and indexed metadata arrays"""
+        count = len(self.ids)
+        self.norms = np.zeros(self.capacity, dtype=np.float32)
+        self.norms[:count] = np.linalg.norm(self.vectors[:count], axis=1)
+        self.live = np.zeros(self.capacity, dtype=bool)
+        self.live[:count] = [vector_id is not None for vector_id in self.ids]
+        self.fields = {}
+        for field in INDEXED_FIELDS:
+            self.fields[field] = np.full(self.capacity, None, dtype=object)
+            self.fields[field][:count] = [(meta or {}).get(field) for meta in self.metadata]
+
+    def _allocate(self):
+        """Return a free row, growing the vector file and arrays when full"""
+        if self.free_rows:
+            return self.free_rows.pop()
+
+        row = len(self.ids)
+        if row >= self.capacity:
+            self.vectors.flush()
+            del self.vectors
+            grow = self.capacity
+            self._open(self.capacity * 2)
+            self.norms = np.concatenate([self.norms, np.zeros(grow, dtype=np.float32)])
+            self.live = np.concatenate([self.live, np.zeros(grow, dtype=bool)])
+            for field in INDEXED_FIELDS:
+                self.fields[field] = np.concatenate([self.fields[field], np.full(grow, None, dtype=object)])
+
+        self.ids.append(None)
+        self.metadata.append(None)
+        return row
+
+    def upsert(self, vectors):
+        """
+        Insert or overwrite vectors
+
+        Args:
+            vectors: List of (id, values, metadata) tuples or dicts with
+                id/values/metadata keys, as accepted by Pinecone
+
+        Returns:
+            dict with upserted_count
+        """
+        with self.lock:
+            for item in vectors:
+                if isinstance(item, dict):
+                    vector_id, values, metadata = item['id'], item['values'], item.get('metadata')
+                else:
+                    vector_id, values, metadata = (tuple(item) + (None,))[:3]
+
+                row = self.rows.get(vector_id)
+                if row is None:
+                    row = self._allocate()
+                    self.rows[vector_id] = row
+
+                values = np.asarray(values, dtype=np.float32)
+                self.vectors[row] = values
+                self.ids[row] = vector_id
+                self.metadata[row] = metadata or {}
+                self.norms[row] = np.linalg.norm(values)
+                self.live[row] = True
+                for field in INDEXED_FIELDS:
+                    self.fields[field][row] = self.metadata[row].get(field)
+                self.dirty += 1
+
+            autosave = self.dirty >= AUTOSAVE_EVERY
+
+        if autosave:
+            self.flush()
+        return {'upserted_count': len(vectors)}
+
+    def fetch(self, ids):
+        """
+        Get vectors by id
+
+        Args:
+            ids: List of vector ids
+
+        Returns:
+            dict with a 'vectors' map of id -> {id, values, metadata} for
+            the ids that exist
+        """
+        found = {}
+        with self.lock:
+            for vector_id in ids:
+                row = self.rows.get(vector_id)
+                if row is not None:
+                    found[vector_id] = {
+                        'id': vector_id,
+                        'values': np.array(self.vectors[row]).tolist(),
+                        'metadata': dict(self.metadata[row])
+                    }
+        return {'vectors': found}
+
+    def query(self, vector, top_k=10, filter=None, include_values=False, include_metadata=True):
+        """
+        Find the stored vectors most similar to a query vector
+
+        Args:
+            vector: Query vector
+            top_k: Number of matches to return
+            filter: Metadata equality filter, e.g. {'source': 'wikipedia'}
+            include_values: Include stored vectors in the matches
+            include_metadata: Include metadata in the matches
+
+        Returns:
+            dict with 'matches', a list of {id, score[, values, metadata]}
+            sorted by descending cosine similarity
+        """
+        vector = np.asarray(vector, dtype=np.float32)
+        with self.lock:
+            count = len(self.ids)
+            mask = self.live[:count].copy()
+            for field, value in (filter or {}).items():
+                if field in self.fields:
+                    mask &= self.fields[field][:count] == value
+                else:
+                    mask &= np.array([(meta or {}).get(field) == value for meta in self.metadata], dtype=bool)
+
+            k = min(top_k, int(mask.sum()))
+            if k <= 0:
+                return {'matches': []}
+
+            # Score every row in place (no copy of the matrix), then drop
+            # deleted and filtered-out rows
+            scores = np.asarray(self.vectors[:count] @ vector)
+            scores /= np.clip(self.norms[:count] * np.linalg.norm(vector), 1e-12, None)
+            scores[~mask] = -np.inf
+
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best])]
+
+            matches = []
+            for row in best:
+                match = {'id': self.ids[row], 'score': float(scores[row])}
+                if include_values:
+                    match['values'] = np.array(self.vectors[row]).tolist()
+                if include_metadata:
+                    match['metadata'] = dict(self.metadata[row])
+                matches.append(match)
+        return {'matches': matches}
+
+    def delete(self, ids):
+        """Remove vectors by id"""
+        with self.lock:
+            for vector_id in ids:
+                row = self.rows.pop(vector_id, None)
+                if row is None:
+                    continue
+                self.ids[row] = None
+                self.metadata[row] = None
+                self.live[row] = False
+                for field in INDEXED_FIELDS:
+                    self.fields[field][row] = None
+                self.free_rows.append(row)
+                self.dirty += 1
+
+    def describe_index_stats(self):
+        """Vector count and dimension, like Pinecone's index stats"""
+        return {'dimension': self.dim, 'total_vector_count': len(self.rows)}
+
+    def flush(self):
+        """Write the vectors and the id/metadata index to disk"""
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                self.vectors.flush()
+                rows = [
+                    {'id': vector_id, 'metadata': meta} if vector_id is not None else None
+                    for vector_id, meta in zip(self.ids, self.metadata)
+                ]
+                tmp_path = f"{self.index_path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'dim': self.dim, 'rows': rows}, f)
+                os.replace(tmp_path, self.index_path)
+                self.dirty = 0
+            except OSError as e:
+                logger.warning(f"⚠ Failed to save vector store index: {str(e)}")
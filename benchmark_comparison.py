@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the vectorized comparison pass
+Scores N synthetic topics with the per-topic path (one sklearn cosine and one
+run of the Python rules per topic) and with compare_arrays(), which does
+every topic in one NumPy pass, and checks both give the same results
+(no model or network needed)
+
+Usage:
+    python benchmark_comparison.py              # 10,000 topics
+    python benchmark_comparison.py --topics 50000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from backend.comparison import KEYWORD_OVERLAP_RATIO, compare_arrays, document_stats, keyword_overlap
+
+
+def synthetic_topics(count, dim=384, seed=0):
+    """Random article pairs, embeddings and keyword sets shaped like a scan"""
+    rng = np.random.default_rng(seed)
+    chooser = random.Random(seed)
+
+    items = []
+    for i in range(count):
+        wiki_lines = chooser.randint(5, 200)
+        grok_lines = max(1, int(wiki_lines * chooser.uniform(0.3, 1.7)))
+        wiki_content = 'Sentence about the topic. ' * chooser.randint(20, 400) + '\n' * wiki_lines
+        grok_content = 'Sentence about the topic. ' * chooser.randint(20, 400) + '\n' * grok_lines
+        items.append((f"Topic {i}", wiki_content, grok_content))
+
+    wiki_embeddings = rng.standard_normal((count, dim)).astype(np.float32)
+    grok_embeddings = (wiki_embeddings + rng.standard_normal((count, dim)) * rng.uniform(0.2, 2.0, (count, 1))).astype(np.float32)
+
+    keywords = []
+    for _ in range(count):
+        shared = set(chooser.sample(range(1000), chooser.randint(0, 10)))
+        keywords.append((
+            shared | set(chooser.sample(range(1000, 2000), 10 - len(shared))),
+            shared | set(chooser.sample(range(2000, 3000), 10 - len(shared)))
+        ))
+    return items, wiki_embeddings, grok_embeddings, keywords
+
+
+def per_topic(items, wiki_embeddings, grok_embeddings, keywords):
+    """The per-topic path: sklearn cosine and Python rules, one topic at a time"""
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    scores, all_discrepancies = [], []
+    for (_, wiki_text, grok_text), wiki_embedding, grok_embedding, (wiki_keywords, grok_keywords) in zip(
+        items, wiki_embeddings, grok_embeddings, keywords
+    ):
+        scores.append(cosine_similarity(wiki_embedding.reshape(1, -1), grok_embedding.reshape(1, -1))[0][0])
+
+        discrepancies = []
+        wiki_len, grok_len = len(wiki_text), len(grok_text)
+        max_len = max(wiki_len, grok_len)
+        if max_len > 0:
+            length_diff_ratio = abs(wiki_len - grok_len) / max_len
+            if length_diff_ratio > 0.3:
+                discrepancies.append({
+                    'type': 'length',
+                    'severity': 'medium',
+                    'description': f'Significant length difference: Wikipedia has {wiki_len} chars, Grokipedia has {grok_len} chars ({length_diff_ratio*100:.1f}% difference)'
+                })
+        if wiki_keywords and grok_keywords:
+            overlap_ratio = len(wiki_keywords & grok_keywords) / len(wiki_keywords | grok_keywords)
+            if overlap_ratio < KEYWORD_OVERLAP_RATIO:
+                discrepancies.append({
+                    'type': 'keyword',
+                    'severity': 'high',
+                    'description': f'Low keyword overlap: only {overlap_ratio*100:.1f}% of key terms match between sources'
+                })
+        wiki_lines, grok_lines = wiki_text.count('\n'), grok_text.count('\n')
+        if abs(wiki_lines - grok_lines) > max(wiki_lines, grok_lines) * 0.5:
+            discrepancies.append({
+                'type': 'structural',
+                'severity': 'low',
+                'description': f'Different content structure: Wikipedia has {wiki_lines} line breaks, Grokipedia has {grok_lines}'
+            })
+        all_discrepancies.append(discrepancies)
+    return np.array(scores), all_discrepancies
+
+
+def vectorized(items, wiki_embeddings, grok_embeddings, keywords):
+    """The batch path: stats arrays, then one compare_arrays() pass"""
+    return compare_arrays(wiki_embeddings, grok_embeddings, document_stats(items), keyword_overlap(keywords))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--topics', type=int, default=10000, help='number of synthetic topics')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per path')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Comparison Benchmark")
+    print("=" * 60)
+    print(f"Topics: {args.topics:,}")
+    print()
+
+    data = synthetic_topics(args.topics)
+    paths = {'per-topic': per_topic, 'vectorized': vectorized}
+
+    medians, outputs = {}, {}
+    for name, path in paths.items():
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            outputs[name] = path(*data)
+            timings.append(time.perf_counter() - start)
+        medians[name] = statistics.median(timings)
+        print(f"{name:<10} median {medians[name] * 1000:9.1f} ms   "
+              f"({args.topics / medians[name]:,.0f} topics/s)")
+
+    (reference_scores, reference_discrepancies), (scores, discrepancies) = outputs['per-topic'], outputs['vectorized']
+    max_diff = float(np.abs(reference_scores - scores).max()) if args.topics else 0.0
+    flagged = sum(len(topic) for topic in discrepancies)
+
+    print()
+    print("=" * 60)
+    print(f"Speedup:              {medians['per-topic'] / medians['vectorized']:.1f}x")
+    print(f"Max score difference: {max_diff:.2e}")
+    print(f"Discrepancies:        {flagged:,}")
+    same = reference_discrepancies == discrepancies and max_diff < 1e-5
+    print("✓ Paths agree" if same else "✗ Paths disagree")
+    print("=" * 60)
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Accuracy check and throughput benchmark for the embedding backends
+Compares the int8 ONNX Runtime backend against the PyTorch backend
+
+Similarities are computed with each backend on sample article pairs
+(articles from saved scans if any, otherwise built-in samples). The check
+fails if ONNX similarities drift from PyTorch by more than --tolerance.
+
+Usage:
+    python benchmark_embeddings.py                  # accuracy + throughput
+    python benchmark_embeddings.py --tolerance 0.01
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from backend.model_registry import ModelRegistry
+from backend.scan_store import ScanStore
+
+SAMPLE_PAIRS = [
+    (
+        "Artificial intelligence is the capability of computational systems to perform tasks "
+        "typically associated with human intelligence, such as learning, reasoning, problem-solving, "
+        "perception, and decision-making.",
+        "AI refers to computer systems able to carry out tasks that normally require human "
+        "intelligence, including learning from data, reasoning about problems and perceiving the world."
+    ),
+    (
+        "Climate change refers to long-term shifts in temperatures and weather patterns, mainly "
+        "driven by human activities since the 1800s, primarily the burning of fossil fuels.",
+        "Climate change describes changes in global temperature and weather over decades. Its causes "
+        "and the scale of human contribution remain the subject of ongoing public debate."
+    ),
+    (
+        "A black hole is a region of spacetime where gravity is so strong that nothing, not even "
+        "light, can escape. General relativity predicts that a sufficiently compact mass can deform "
+        "spacetime to form a black hole.",
+        "Black holes are astronomical objects with gravitational pulls so intense that no light or "
+        "matter can escape once past the event horizon."
+    ),
+    (
+        "Bitcoin is the first decentralized cryptocurrency. Nodes in the peer-to-peer bitcoin network "
+        "verify transactions through cryptography and record them in a public distributed ledger.",
+        "Pizza is a dish of Italian origin consisting of a flat base of leavened wheat-based dough "
+        "topped with tomatoes, cheese, and various other ingredients."
+    ),
+    (
+        "Vaccines train the immune system to recognise a pathogen by exposing it to a weakened, "
+        "inactivated or partial form of the organism, preventing severe illness on later exposure.",
+        "A vaccine is a biological preparation that provides active acquired immunity to a particular "
+        "infectious disease."
+    ),
+    (
+        "The Roman Empire was the post-Republican state of ancient Rome, ruling large territorial "
+        "holdings around the Mediterranean Sea in Europe, North Africa, and Western Asia.",
+        "Quantum computing uses qubits, which can exist in superpositions of states, to perform "
+        "certain calculations far faster than classical computers."
+    ),
+]
+
+
+def load_pairs(limit):
+    """Article pairs from saved scans, or the built-in samples"""
+    pairs = [
+        (result['wiki_content'], result['grok_content'])
+        for result in ScanStore().results.values()
+        if result.get('wiki_content') and result.get('grok_content')
+    ][:limit]
+    if not pairs:
+        print("⚠ No saved scans found, using built-in sample articles")
+        pairs = SAMPLE_PAIRS
+    return pairs
+
+
+def row_cosine(a, b):
+    """Cosine similarity of matching rows of two matrices"""
+    norms = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+    return np.einsum('ij,ij->i', a, b) / np.clip(norms, 1e-12, None)
+
+
+def rank(values):
+    """Ranks for a Spearman correlation (ties are rare for float scores)"""
+    ranks = np.empty(len(values))
+    ranks[np.argsort(values)] = np.arange(len(values))
+    return ranks
+
+
+def time_encode(model, texts, batch_size, repeat):
+    """Median texts/second over repeated encode calls"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+        timings.append(time.perf_counter() - start)
+    return len(texts) / statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pairs', type=int, default=50, help='maximum article pairs from saved scans')
+    parser.add_argument('--tolerance', type=float, default=0.02, help='maximum allowed similarity difference')
+    parser.add_argument('--batch-size', type=int, default=32, help='texts per encode call')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per backend')
+    args = parser.parse_args()
+
+    pairs = load_pairs(args.pairs)
+    texts = [text for pair in pairs for text in pair]
+
+    print("=" * 60)
+    print("Embedding Backend Benchmark")
+    print("=" * 60)
+    print(f"{len(pairs)} article pairs, {len(texts)} texts")
+    print()
+
+    models = {}
+    for backend in ('torch', 'onnx'):
+        registry = ModelRegistry(backend=backend)
+        if registry.backend != backend:
+            print(f"✗ {backend} backend is not available")
+            return 1
+        models[backend] = registry.get_model()
+        print(f"✓ Loaded {registry.variant} ({registry.load_seconds:.1f}s)")
+    print()
+
+    # Accuracy: the same texts and pairs through both backends
+    embeddings = {
+        backend: np.asarray(model.encode(texts, batch_size=args.batch_size, convert_to_numpy=True))
+        for backend, model in models.items()
+    }
+    for backend, vectors in embeddings.items():
+        if vectors.shape[1] != 384:
+            print(f"✗ {backend} produced {vectors.shape[1]}-dim vectors, expected 384")
+            return 1
+
+    vector_agreement = row_cosine(embeddings['torch'], embeddings['onnx'])
+    similarities = {
+        backend: row_cosine(vectors[0::2], vectors[1::2])
+        for backend, vectors in embeddings.items()
+    }
+    differences = np.abs(similarities['torch'] - similarities['onnx'])
+
+    print("🎯 Accuracy (ONNX int8 vs PyTorch fp32)")
+    print(f"   vector cosine     min {vector_agreement.min():.4f}   mean {vector_agreement.mean():.4f}")
+    print(f"   pair similarity   max diff {differences.max():.4f}   mean diff {differences.mean():.4f}")
+    if len(pairs) > 2:
+        spearman = np.corrcoef(rank(similarities['torch']), rank(similarities['onnx']))[0, 1]
+        print(f"   rank correlation  {spearman:.4f}")
+    print()
+
+    print(f"⚡ Throughput (batch size {args.batch_size})")
+    throughput = {
+        backend: time_encode(model, texts, args.batch_size, args.repeat)
+        for backend, model in models.items()
+    }
+    for backend, rate in throughput.items():
+        print(f"   {backend:<5} {rate:8.1f} texts/s")
+    print(f"   onnx speedup: {throughput['onnx'] / throughput['torch']:.1f}x")
+    print()
+
+    print("=" * 60)
+    if differences.max() > args.tolerance:
+        print(f"✗ Similarities differ by up to {differences.max():.4f} (tolerance {args.tolerance})")
+        return 1
+    print(f"✓ ONNX backend within tolerance ({args.tolerance})")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
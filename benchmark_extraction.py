@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the Grokipedia HTML extraction backends
+Times per-page parsing over saved HTML fixtures (no network needed); pages
+saved with --save are also checked for agreement by test_extraction.py
+
+Usage:
+    python benchmark_extraction.py                      # run over saved fixtures
+    python benchmark_extraction.py --save "Black Hole"  # save pages as fixtures first
+"""
+
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+
+from backend.extraction import EXTRACTORS
+
+FIXTURES_DIR = os.path.join('data', 'fixtures', 'grokipedia')
+
+
+def save_fixtures(topics, fixtures_dir):
+    """Download Grokipedia pages into the fixtures directory"""
+    from backend.http_client import http_client
+    from backend.scraper import ContentScraper
+
+    scraper = ContentScraper()
+    os.makedirs(fixtures_dir, exist_ok=True)
+
+    for topic in topics:
+        slug = scraper._grokipedia_slugs(topic)[0]
+        response = http_client.get(f"https://grokipedia.com/page/{slug}", timeout=scraper.timeout)
+        if response.status_code != 200:
+            print(f"✗ {topic}: HTTP {response.status_code}")
+            continue
+        path = os.path.join(fixtures_dir, f"{slug}.html")
+        with open(path, 'wb') as f:
+            f.write(response.content)
+        print(f"✓ Saved {path} ({len(response.content) // 1024} KB)")
+
+
+def synthetic_page(paragraphs=400):
+    """Build a long article page shaped like Grokipedia's layout"""
+    body = ''.join(
+        f"<h2>Section {i}</h2><p>Paragraph {i} with <a href='#'>a link</a> and "
+        f"<b>some emphasis</b> about the topic. {'Filler text. ' * 20}</p>"
+        for i in range(paragraphs)
+    )
+    # Next.js pages end with their render payload in inline scripts
+    payload = '[\\"$\\",\\"div\\",null,{}],' * 20000
+    return (
+        "<html><head><meta charset='utf-8'><title>Synthetic</title><script>var x = 1;</script>"
+        "<style>p { margin: 0; }</style></head><body><header>Site header</header>"
+        "<nav><a href='/'>Home</a></nav><h1 class='page-title'>Synthetic</h1>"
+        f"<article>{body}<script>track();</script></article><footer>Footer</footer>"
+        f"<script>self.__next_f.push([1,\"{payload}\"])</script></body></html>"
+    ).encode('utf-8')
+
+
+def load_fixtures(fixtures_dir):
+    """Load saved fixtures, or a synthetic page if none are saved"""
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(fixtures_dir, '*.html'))):
+        with open(path, 'rb') as f:
+            pages[os.path.basename(path)] = f.read()
+
+    if not pages:
+        print(f"⚠ No fixtures in {fixtures_dir}, using a synthetic page")
+        print("  Save real pages with: python benchmark_extraction.py --save \"Topic\"")
+        pages['synthetic.html'] = synthetic_page()
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help='directory of saved Grokipedia HTML pages')
+    parser.add_argument('--repeat', type=int, default=20, help='timed runs per page and backend')
+    parser.add_argument('--save', nargs='+', metavar='TOPIC', help='download these topics as fixtures first')
+    args = parser.parse_args()
+
+    if args.save:
+        save_fixtures(args.save, args.fixtures)
+
+    pages = load_fixtures(args.fixtures)
+
+    extractors = {}
+    for name, extractor_class in EXTRACTORS.items():
+        try:
+            extractors[name] = extractor_class()
+        except ImportError as e:
+            print(f"⚠ Skipping {name} backend: {e}")
+
+    print("=" * 60)
+    print("Grokipedia Extraction Benchmark")
+    print("=" * 60)
+    print()
+
+    totals = {name: 0.0 for name in extractors}
+    for page_name, html in pages.items():
+        print(f"📄 {page_name} ({len(html) // 1024} KB)")
+        outputs = {}
+
+        for name, extractor in extractors.items():
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                outputs[name] = extractor.extract(html, page_name)
+                timings.append(time.perf_counter() - start)
+
+            median = statistics.median(timings)
+            totals[name] += median
+            print(f"   {name:<5} median {median * 1000:8.2f} ms   min {min(timings) * 1000:8.2f} ms")
+
+        # Backends should agree on the extracted text
+        if len({content for _, content in outputs.values()}) > 1:
+            print("   ⚠ Backends produced different text for this page")
+        print()
+
+    print("=" * 60)
+    for name, total in totals.items():
+        print(f"{name:<5} {total / len(pages) * 1000:8.2f} ms per page")
+    if 'soup' in totals and 'lxml' in totals and totals['lxml'] > 0:
+        print(f"lxml speedup: {totals['soup'] / totals['lxml']:.1f}x")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,6 +7,14 @@ load_dotenv()
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 PINECONE_INDEX_NAME = "wikipedia-grokipedia"
 PINECONE_ENVIRONMENT = "gcp-starter"
+# Where embeddings are stored: 'local' (memory-mapped index on disk) or
+# 'pinecone' (remote, needs PINECONE_API_KEY; falls back to local)
+VECTOR_STORE = os.getenv("VECTOR_STORE", "pinecone" if PINECONE_API_KEY else "local")
+VECTOR_STORE_DIR = os.getenv("VECTOR_STORE_DIR", "data/cache/vectors")
+# Vector writes are buffered and sent in batches (always flushed at scan end)
+VECTOR_UPSERT_BATCH_SIZE = int(os.getenv("VECTOR_UPSERT_BATCH_SIZE", 100))  # vectors/ids per request
+VECTOR_FLUSH_INTERVAL = float(os.getenv("VECTOR_FLUSH_INTERVAL", 5.0))  # seconds a write may wait
+VECTOR_FLUSH_WORKERS = int(os.getenv("VECTOR_FLUSH_WORKERS", 4))  # concurrent requests
 
 # LOCAL DKG NODE Configuration (Running on your machine)
 DKG_ENDPOINT = os.getenv("DKG_ENDPOINT", "http://localhost:8900")
@@ -26,3 +34,105 @@ CEREBRAS_TOP_P = 0.95
 # Flask Configuration
 FLASK_DEBUG = os.getenv("FLASK_DEBUG", "True") == "True"
 FLASK_PORT = int(os.getenv("FLASK_PORT", 5000))
+
+# Scraper Configuration
+# Per-host caps on simultaneous requests during a scan
+FETCH_HOST_LIMITS = {
+    "wikipedia.org": int(os.getenv("FETCH_WIKIPEDIA_CONCURRENCY", 8)),
+    "grokipedia.com": int(os.getenv("FETCH_GROKIPEDIA_CONCURRENCY", 4)),
+}
+FETCH_MAX_WORKERS = int(os.getenv("FETCH_MAX_WORKERS", sum(FETCH_HOST_LIMITS.values())))
+# Titles per MediaWiki query (API maximum for non-bot clients is 50)
+WIKIPEDIA_BATCH_SIZE = 50
+
+# Content Cache Configuration
+CONTENT_CACHE_DIR = os.getenv("CONTENT_CACHE_DIR", "data/cache/content")
+CONTENT_CACHE_TTL = int(os.getenv("CONTENT_CACHE_TTL", 6 * 3600))  # seconds before revalidation
+CONTENT_CACHE_MAX_BYTES = int(os.getenv("CONTENT_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+
+# Topic Resolution Index Configuration
+RESOLUTION_INDEX_PATH = os.getenv("RESOLUTION_INDEX_PATH", "data/cache/resolution.json")
+RESOLUTION_NEGATIVE_TTL = int(os.getenv("RESOLUTION_NEGATIVE_TTL", 24 * 3600))  # seconds to remember misses
+GROKIPEDIA_MAX_SLUGS = int(os.getenv("GROKIPEDIA_MAX_SLUGS", 2))  # slugs tried per unresolved topic
+
+# HTML extraction backend for Grokipedia pages: "lxml" (fast) or "soup"
+GROKIPEDIA_EXTRACTOR = os.getenv("GROKIPEDIA_EXTRACTOR", "lxml")
+
+# Outbound HTTP Configuration (shared by scraper and DKG publisher)
+HTTP_USER_AGENT = "TrustGraph/1.0 (Wikipedia vs Grokipedia comparison)"
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 16))  # keep-alive connections per host
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", 3))
+HTTP_BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", 0.5))  # seconds, doubled per retry
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", 30))
+# Token-bucket limits per host: (requests per second, burst size)
+HTTP_RATE_LIMITS = {
+    "wikipedia.org": (float(os.getenv("WIKIPEDIA_RATE_LIMIT", 20)), 20),
+    "grokipedia.com": (float(os.getenv("GROKIPEDIA_RATE_LIMIT", 5)), 5),
+}
+
+# Scan Configuration
+# Reuse comparison/AI/DKG stages for topics whose content hasn't changed
+INCREMENTAL_SCAN = os.getenv("INCREMENTAL_SCAN", "True") == "True"
+SCAN_RESULTS_DIR = os.getenv("SCAN_RESULTS_DIR", "data/cache/scans")
+# Topic catalog: a JSON list or a JSONL file with one topic per line
+TOPICS_PATH = os.getenv("TOPICS_PATH", "data/topics.json")
+# Topics whose comparisons share one batched embedding pass during a scan
+SCAN_BATCH_SIZE = int(os.getenv("SCAN_BATCH_SIZE", 32))
+
+# Embedding Configuration
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", 32))  # texts per model call
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+# Inference backend: 'torch' (Sentence-Transformers, fp32) or 'onnx'
+# (int8-quantized ONNX Runtime export, exported on first use)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+EMBEDDING_ONNX_DIR = os.getenv("EMBEDDING_ONNX_DIR", "data/models/all-MiniLM-L6-v2-onnx-int8")
+EMBEDDING_ONNX_THREADS = int(os.getenv("EMBEDDING_ONNX_THREADS", 0))  # 0 = ONNX Runtime default
+
+# Embedding cache: memory-mapped vectors keyed by normalized text + model
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "True") == "True"
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", "data/cache/embeddings")
+EMBEDDING_CACHE_CAPACITY = int(os.getenv("EMBEDDING_CACHE_CAPACITY", 100000))  # vectors (files grow to ~150 MB)
+# Worker processes to spread embedding batches over (0 = embed in-process);
+# each loads its own model copy and uses EMBEDDING_WORKER_THREADS threads
+EMBEDDING_WORKERS = int(os.getenv("EMBEDDING_WORKERS", 0))
+EMBEDDING_WORKER_THREADS = int(os.getenv("EMBEDDING_WORKER_THREADS", 0))  # 0 = cores / workers
+# Load the embedding model in the background at startup (otherwise on first use)
+EMBEDDING_WARM_UP = os.getenv("EMBEDDING_WARM_UP", "True") == "True"
+
+# Comparison Configuration
+# 'document': one embedding per article (the model reads only the first ~256
+# tokens); 'chunked': embed every passage and align them across sources
+COMPARISON_MODE = os.getenv("COMPARISON_MODE", "document")
+CHUNK_WORDS = int(os.getenv("CHUNK_WORDS", 150))  # words per passage (fits the model's 256 tokens)
+CHUNK_OVERLAP_WORDS = int(os.getenv("CHUNK_OVERLAP_WORDS", 30))  # overlap when splitting long paragraphs
+WORST_PASSAGES = int(os.getenv("WORST_PASSAGES", 3))  # least-aligned passages reported per source
+# Keyword model: document frequencies over every scanned article, with terms
+# hashed into a fixed feature space (no vocabulary to fit)
+KEYWORD_MODEL_PATH = os.getenv("KEYWORD_MODEL_PATH", "data/cache/keywords.npz")
+KEYWORD_HASH_FEATURES = int(os.getenv("KEYWORD_HASH_FEATURES", 2 ** 20))
+KEYWORD_TOP_K = int(os.getenv("KEYWORD_TOP_K", 10))  # top TF-IDF terms compared per article
+# Sentence alignment: report sentences with no close match in the other
+# article as located 'claim' discrepancies (embeds every sentence)
+SENTENCE_ALIGNMENT = os.getenv("SENTENCE_ALIGNMENT", "False") == "True"
+ALIGNMENT_THRESHOLD = float(os.getenv("ALIGNMENT_THRESHOLD", 0.5))  # best-match cosine below this is a claim
+ALIGNMENT_TOP_K = int(os.getenv("ALIGNMENT_TOP_K", 3))  # matches recorded per claim
+ALIGNMENT_MAX_CLAIMS = int(os.getenv("ALIGNMENT_MAX_CLAIMS", 10))  # claims reported per topic
+ALIGNMENT_MIN_WORDS = int(os.getenv("ALIGNMENT_MIN_WORDS", 4))  # shorter fragments are skipped
+# Near-duplicate detection: MinHash signatures of passage word shingles,
+# matched with banded LSH, sort Grokipedia passages into copied from
+# Wikipedia, paraphrased, or novel
+NEAR_DUPLICATES = os.getenv("NEAR_DUPLICATES", "True") == "True"
+MINHASH_STORE_PATH = os.getenv("MINHASH_STORE_PATH", "data/cache/minhash.npz")
+COPY_THRESHOLD = float(os.getenv("COPY_THRESHOLD", 0.7))  # estimated shingle Jaccard at or above this is copied
+PARAPHRASE_THRESHOLD = float(os.getenv("PARAPHRASE_THRESHOLD", 0.2))  # below this (or no LSH candidate) is novel
+# Section diff: pair sections of both articles by heading title and report
+# added, removed and rewritten sections (replaces the line-break count rule)
+SECTION_DIFF = os.getenv("SECTION_DIFF", "True") == "True"
+SECTION_MATCH_THRESHOLD = float(os.getenv("SECTION_MATCH_THRESHOLD", 0.5))  # title trigram similarity needed to pair
+REWRITE_THRESHOLD = float(os.getenv("REWRITE_THRESHOLD", 0.5))  # paired sections sharing less text are rewritten
+# Worker processes for the CPU-bound part of comparison (term counting,
+# MinHash signatures, section diffs); 0 = run it in the scan thread
+COMPARISON_WORKERS = int(os.getenv("COMPARISON_WORKERS", 0))
+
+# Startup
+COLD_START_BUDGET_SECONDS = float(os.getenv("COLD_START_BUDGET_SECONDS", 3.0))  # import app + create_app(), model excluded
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test that the HTML extraction backends agree
+Runs both extractors over the saved Grokipedia HTML fixtures (and any page
+saved with `python benchmark_extraction.py --save`) and over pages with
+tag-like text inside scripts and comments, and checks they produce the
+same title and content
+
+Run directly (`python test_extraction.py`) or through pytest.
+"""
+
+import glob
+import os
+import sys
+
+from backend.extraction import LxmlExtractor, SoupExtractor
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'fixtures', 'grokipedia')
+
+# Opening tags in raw text must not be taken for the content container
+RAW_TEXT_PAGES = {
+    'script': "<script>var s='<article>fake</article>';</script><article><p>é real</p></article>",
+    'comment': "<!-- <div class=\"content\">old</div> --><div class=\"content\"><p>é real</p></div>",
+    'style': "<style>/* <main>fake</main> */</style><h1>Title</h1><main><p>é real</p></main>",
+    'title': "<script>document.write('<h1 class=\"page-title\">fake</h1>')</script>"
+             "<h1 class=\"page-title\">Real</h1><article><p>é real</p></article>",
+}
+
+
+def load_fixtures():
+    """Saved fixture pages by file name"""
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.html'))):
+        with open(path, 'rb') as f:
+            pages[os.path.basename(path)] = f.read()
+    return pages
+
+
+def assert_agree(pages):
+    soup, lxml = SoupExtractor(), LxmlExtractor()
+    for name, html in pages.items():
+        expected = soup.extract(html, name)
+        assert lxml.extract(html, name) == expected, f"extractors disagree on {name}"
+        assert expected[1], f"no content extracted from {name}"
+
+
+def test_fixtures_agree():
+    pages = load_fixtures()
+    assert pages, f"no fixtures in {FIXTURES_DIR}"
+    assert_agree(pages)
+
+
+def test_raw_text_is_not_markup():
+    pages = {}
+    for name, body in RAW_TEXT_PAGES.items():
+        html = f"<html><head><meta charset='utf-8'></head><body>{body}</body></html>"
+        pages[f"{name} (str)"] = html
+        pages[f"{name} (bytes)"] = html.encode('utf-8')
+    assert_agree(pages)
+    assert LxmlExtractor().extract(pages['script (bytes)'], 'topic') == ('topic', 'é real')
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("HTML Extraction Test")
+    print("=" * 60)
+    failed = False
+    for test in (test_fixtures_agree, test_raw_text_is_not_markup):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            print(f"✗ {test.__name__}: {e}")
+            failed = True
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test the keyword discrepancy rule
+Checks that a rewritten copy of an article (reordered, trimmed, extended)
+does not get a keyword discrepancy, and that an unrelated article does
+
+Run directly (`python test_keywords.py`) or through pytest.
+"""
+
+import glob
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from backend.comparison import keyword_overlap, rule_discrepancies
+from backend.extraction import SoupExtractor
+from backend.keyword_model import KeywordModel
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'fixtures', 'grokipedia')
+
+
+def fixture_articles():
+    """Article text of each saved Grokipedia fixture, by file name"""
+    extractor = SoupExtractor()
+    articles = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.html'))):
+        with open(path, 'rb') as f:
+            articles[os.path.basename(path)] = extractor.extract(f.read(), path)[1]
+    return articles
+
+
+def rewrite(text):
+    """Near-identical article: paragraphs reversed, every third trimmed by a fifth, one added"""
+    paragraphs = [line for line in text.split('\n') if line.strip()]
+    rewritten = [
+        ' '.join(line.split()[:len(line.split()) * 4 // 5]) if i % 3 == 0 else line
+        for i, line in enumerate(reversed(paragraphs))
+    ]
+    return '\n'.join(rewritten + ['Later research extended these results to further cases.'])
+
+
+def keyword_flags(pairs):
+    """Whether each (wiki, grok) text pair gets a keyword discrepancy"""
+    with tempfile.TemporaryDirectory() as tmp:
+        model = KeywordModel(path=os.path.join(tmp, 'keywords.npz'))
+        # Document frequencies come from every article scanned, not just this batch
+        model.transform(list(fixture_articles().values()))
+        keywords = model.paired_keywords([text for pair in pairs for text in pair])
+
+    stats = {key: np.zeros(len(pairs), dtype=np.int64) for key in ('wiki_length', 'grok_length', 'wiki_lines', 'grok_lines')}
+    found = rule_discrepancies(stats, keyword_overlap(keywords), structural=False)
+    return [any(d['type'] == 'keyword' for d in discrepancies) for discrepancies in found]
+
+
+def test_rewritten_articles_share_keywords():
+    articles = list(fixture_articles().values())
+    assert len(articles) >= 2, f"need two fixtures in {FIXTURES_DIR}"
+    flags = keyword_flags([(text, rewrite(text)) for text in articles])
+    assert not any(flags), f"near-identical articles flagged: {flags}"
+
+
+def test_unrelated_articles_are_flagged():
+    articles = list(fixture_articles().values())
+    assert len(articles) >= 2, f"need two fixtures in {FIXTURES_DIR}"
+    pairs = [(text, rewrite(articles[(i + 1) % len(articles)])) for i, text in enumerate(articles)]
+    flags = keyword_flags(pairs)
+    assert all(flags), f"unrelated articles not flagged: {flags}"
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("Keyword Discrepancy Test")
+    print("=" * 60)
+    failed = False
+    for test in (test_rewritten_articles_share_keywords, test_unrelated_articles_are_flagged):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            print(f"✗ {test.__name__}: {e}")
+            failed = True
+    sys.exit(1 if failed else 0)
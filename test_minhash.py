@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test banded LSH candidate generation
+Checks that the sort-based band join finds exactly the passage pairs that
+share a bucket in at least one band, as comparing every pair would
+
+Run directly (`python test_minhash.py`) or through pytest.
+"""
+
+import sys
+
+import numpy as np
+
+from backend.minhash import NUM_PERM, band_index, band_keys, best_matches, candidate_pairs
+
+
+def random_signatures(rng, count):
+    # Few distinct values, so many pairs share a band by chance
+    return rng.integers(0, 4, (count, NUM_PERM), dtype=np.uint32)
+
+
+def test_candidate_pairs_match_all_pairs():
+    rng = np.random.default_rng(0)
+    queries, indexed = random_signatures(rng, 40), random_signatures(rng, 70)
+    queries[:5] = indexed[:5]
+
+    shared = (band_keys(queries)[:, None, :] == band_keys(indexed)[None, :, :]).any(axis=2)
+    rows, cols = candidate_pairs(queries, band_index(indexed))
+    assert len(rows) == int(shared.sum()), "pairs missing or repeated"
+    assert shared[rows, cols].all(), "pairs without a shared bucket"
+
+
+def test_best_matches_finds_copies():
+    rng = np.random.default_rng(1)
+    candidates = rng.integers(0, 1 << 32, (50, NUM_PERM), dtype=np.uint32)
+    queries = np.concatenate([candidates[[7, 3]], rng.integers(0, 1 << 32, (1, NUM_PERM), dtype=np.uint32)])
+
+    scores, indices = best_matches(queries, candidates)
+    assert indices.tolist() == [7, 3, -1]
+    assert scores.tolist() == [1.0, 1.0, 0.0]
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("MinHash LSH Test")
+    print("=" * 60)
+    failed = False
+    for test in (test_candidate_pairs_match_all_pairs, test_best_matches_finds_copies):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            print(f"✗ {test.__name__}: {e}")
+            failed = True
+    sys.exit(1 if failed else 0)
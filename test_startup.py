@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Cold-start regression test for the Flask app
+
+Imports app.py and runs create_app() (which builds every manager) in a
+fresh interpreter with `python -X importtime`, prints the slowest modules
+by cumulative import time, and fails if startup takes longer than
+COLD_START_BUDGET_SECONDS. The embedding model is loaded after startup and
+is not counted; warm-up is disabled for the measurement.
+
+Run directly (`python test_startup.py`) or through pytest.
+"""
+
+import os
+import subprocess
+import sys
+
+import config
+
+TOP_MODULES = 15
+
+
+def measure_cold_start():
+    """
+    Start the app in a subprocess and collect -X importtime output
+
+    Returns:
+        (total_seconds, modules) where total_seconds is the app's own
+        time-to-ready and modules is a list of (cumulative_seconds,
+        module_name) sorted slowest first
+    """
+    env = dict(os.environ, EMBEDDING_WARM_UP='False', PYTHONDONTWRITEBYTECODE='1')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         'import app; app.create_app(); print(app.startup_timer.ready_seconds)'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env, capture_output=True, text=True, timeout=120
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Starting app failed:\n{result.stderr[-2000:]}")
+
+    modules = []
+    total = float(result.stdout.split()[-1])
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        seconds = int(cumulative) / 1e6
+        modules.append((seconds, name.rstrip()))
+
+    modules.sort(reverse=True)
+    return total, modules
+
+
+def print_report(total, modules):
+    """Print the startup timing report"""
+    print("=" * 60)
+    print("Cold Start Report")
+    print("=" * 60)
+    print(f"{'cumulative':>12}  module")
+    for seconds, name in modules[:TOP_MODULES]:
+        print(f"{seconds:>11.3f}s  {name.strip()}")
+    print()
+    print(f"Total: {total:.2f}s (budget {config.COLD_START_BUDGET_SECONDS:.2f}s)")
+
+
+def test_cold_start_budget():
+    """Fail if importing the app exceeds the cold-start budget"""
+    total, modules = measure_cold_start()
+    slowest = ', '.join(name.strip() for _, name in modules[1:6])
+    assert total <= config.COLD_START_BUDGET_SECONDS, (
+        f"Cold start took {total:.2f}s, over the {config.COLD_START_BUDGET_SECONDS:.2f}s budget "
+        f"(slowest imports: {slowest})"
+    )
+
+
+if __name__ == '__main__':
+    total, modules = measure_cold_start()
+    print_report(total, modules)
+    if total > config.COLD_START_BUDGET_SECONDS:
+        print("✗ Cold start is over budget")
+        sys.exit(1)
+    print("✓ Cold start is within budget")
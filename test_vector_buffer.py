@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test for buffered vector store I/O
+Runs a simulated scan against a local fake index with network-like latency
+
+Checks that writes are batched (N/100 upserts instead of 2N), that
+buffered writes are readable before they are sent, that multi-id fetches
+are batched, and that everything is stored after a flush.
+
+Run directly (`python test_vector_buffer.py`) or through pytest.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from backend.vector_buffer import VectorWriteBuffer
+from backend.vector_store import LocalVectorStore
+
+TOPICS = 500
+LATENCY = 0.02  # seconds per simulated round trip
+
+
+class FakeRemoteIndex:
+    """Local vector store that counts requests and sleeps like a network call"""
+
+    def __init__(self, store_dir, latency=LATENCY):
+        self.store = LocalVectorStore(store_dir)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.upserts = 0
+        self.fetches = 0
+
+    def upsert(self, vectors):
+        time.sleep(self.latency)
+        with self.lock:
+            self.upserts += 1
+        return self.store.upsert(vectors)
+
+    def fetch(self, ids):
+        time.sleep(self.latency)
+        with self.lock:
+            self.fetches += 1
+        return self.store.fetch(ids)
+
+
+def simulate_scan(buffer, topics):
+    """Store a Wikipedia and a Grokipedia vector per topic, like a scan does"""
+    rng = np.random.RandomState(0)
+    vectors = {}
+    for i in range(topics):
+        for source in ('wikipedia', 'grokipedia'):
+            vector_id = f"Topic {i}_{source}"
+            vectors[vector_id] = rng.randn(384).astype(np.float32)
+            buffer.add(vector_id, vectors[vector_id].tolist(), {'topic': f"Topic {i}", 'source': source})
+    return vectors
+
+
+def test_buffered_writes_and_fetches():
+    with tempfile.TemporaryDirectory() as store_dir:
+        index = FakeRemoteIndex(store_dir)
+        buffer = VectorWriteBuffer(index, batch_size=100, flush_interval=0, max_workers=4)
+
+        start = time.perf_counter()
+        vectors = simulate_scan(buffer, TOPICS)
+
+        # Read-your-writes: the last vector may still be buffered
+        last_id = f"Topic {TOPICS - 1}_grokipedia"
+        assert np.allclose(buffer.fetch_many([last_id])[last_id]['values'], vectors[last_id])
+
+        assert buffer.flush() == 0
+        elapsed = time.perf_counter() - start
+
+        # 2N vectors in batches of 100 instead of 2N single-vector upserts
+        assert index.upserts == 2 * TOPICS // 100, index.upserts
+        assert index.store.describe_index_stats()['total_vector_count'] == 2 * TOPICS
+
+        # Batched multi-id fetch: 2N ids in 2N/100 requests
+        found = buffer.fetch_many(list(vectors))
+        assert len(found) == 2 * TOPICS
+        assert index.fetches == 2 * TOPICS // 100, index.fetches
+        assert all(np.allclose(found[vector_id]['values'], vector) for vector_id, vector in vectors.items())
+
+        # Unbuffered baseline: one round trip per vector
+        unbuffered = 2 * TOPICS * LATENCY
+        print(f"  {index.upserts} upserts + {index.fetches} fetches for {2 * TOPICS} vectors")
+        print(f"  buffered write time {elapsed:.2f}s vs ~{unbuffered:.1f}s one vector per request")
+
+
+def test_failed_upserts_are_retried():
+    with tempfile.TemporaryDirectory() as store_dir:
+        index = FakeRemoteIndex(store_dir, latency=0)
+        failures = [1]
+        upsert = index.upsert
+
+        def flaky_upsert(vectors):
+            if failures[0]:
+                failures[0] -= 1
+                raise ConnectionError("simulated outage")
+            return upsert(vectors)
+
+        index.upsert = flaky_upsert
+        # Nothing is sent before flush(), so the failed first attempt is
+        # always the one flush() waits for
+        buffer = VectorWriteBuffer(index, batch_size=100, flush_interval=0, max_workers=2)
+        simulate_scan(buffer, 5)
+        assert index.upserts == 0
+
+        assert buffer.flush() == 10  # first attempt failed, vectors kept
+        assert buffer.flush() == 0
+        assert index.store.describe_index_stats()['total_vector_count'] == 10
+
+
+def test_time_based_flush():
+    with tempfile.TemporaryDirectory() as store_dir:
+        index = FakeRemoteIndex(store_dir, latency=0)
+        buffer = VectorWriteBuffer(index, batch_size=100, flush_interval=0.1, max_workers=2)
+        simulate_scan(buffer, 1)
+        assert index.upserts == 0
+        time.sleep(0.5)
+        assert index.upserts == 1
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("Vector Write Buffer Test")
+    print("=" * 60)
+    failed = False
+    for test in (test_buffered_writes_and_fetches, test_failed_upserts_are_retried, test_time_based_flush):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            print(f"✗ {test.__name__}: {e}")
+            failed = True
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test bulk Wikipedia fetching against recorded MediaWiki responses
+Replays data/fixtures/wikipedia/bulk_query.json through
+ContentScraper.fetch_wikipedia_bulk() and checks title normalization,
+redirects, the disambiguation -> search fallback, missing pages, extract
+continuation (excontinue) and the number of API requests made
+
+Run directly (`python test_wikipedia_bulk.py`) or through pytest.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+import backend.scraper as scraper_module
+from backend.content_cache import ContentCache
+from backend.resolution_index import ResolutionIndex
+from backend.scraper import ContentScraper
+
+RECORDING = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'fixtures', 'wikipedia', 'bulk_query.json')
+
+
+class RecordedResponse:
+    def __init__(self, data):
+        self.data = data
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class ReplayClient:
+    """Stands in for http_client, answering MediaWiki queries from the recording"""
+
+    def __init__(self, recorded):
+        self.recorded = recorded
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        params = {key: value for key, value in params.items() if key not in ('action', 'format', 'formatversion')}
+        self.requests.append(params)
+        for exchange in self.recorded:
+            if exchange['params'] == params:
+                return RecordedResponse(exchange['response'])
+        raise AssertionError(f"unrecorded request: {params}")
+
+
+class DisambiguationError(Exception):
+    def __init__(self, title, options):
+        super().__init__(title)
+        self.options = options
+
+
+def recorded_wikipedia(recording):
+    """Stands in for the wikipedia package, answering search and page lookups from the recording"""
+    def page(title, auto_suggest=True):
+        if title in recording['disambiguation']:
+            raise DisambiguationError(title, recording['disambiguation'][title])
+        return SimpleNamespace(**recording['pages'][title])
+
+    return SimpleNamespace(
+        search=lambda query, results=10: recording['search'][query][:results],
+        page=page,
+        exceptions=SimpleNamespace(DisambiguationError=DisambiguationError, PageError=LookupError)
+    )
+
+
+def fetch_recorded():
+    """Run fetch_wikipedia_bulk() over the recording; returns (results, replay client, scraper)"""
+    with open(RECORDING, encoding='utf-8') as f:
+        recording = json.load(f)
+
+    scraper = ContentScraper()
+    scraper._wikipedia = recorded_wikipedia(recording)
+    client = ReplayClient(recording['requests'])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper.cache = ContentCache(cache_dir=os.path.join(tmp, 'content'))
+        scraper.resolutions = ResolutionIndex(path=os.path.join(tmp, 'resolution.json'))
+        original, scraper_module.http_client = scraper_module.http_client, client
+        try:
+            results = scraper.fetch_wikipedia_bulk(recording['topics'])
+        finally:
+            scraper_module.http_client = original
+    return results, client, scraper
+
+
+def test_titles_resolve_in_one_query():
+    results, client, scraper = fetch_recorded()
+
+    # Normalized title and redirect both resolve in the single title query
+    assert results['machine learning']['title'] == 'Machine learning'
+    assert results['AI']['title'] == 'Artificial intelligence'
+    assert results['AI']['url'] == 'https://en.wikipedia.org/wiki/Artificial_intelligence'
+    assert results['AI']['revid'] == 1250871144
+    assert scraper.resolutions.get('wikipedia', 'AI')['value'] == 'Artificial intelligence'
+    assert sum('titles' in params for params in client.requests) == 1
+
+
+def test_extracts_follow_continuation():
+    results, client, _ = fetch_recorded()
+
+    # One full extract per response: the second arrives through excontinue
+    assert results['machine learning']['content'].startswith('Machine learning (ML)')
+    assert results['AI']['content'].startswith('Artificial intelligence (AI)')
+    assert [params.get('excontinue') for params in client.requests if 'pageids' in params] == [None, 1]
+
+
+def test_unresolved_titles_fall_back_to_search():
+    results, client, scraper = fetch_recorded()
+
+    # Disambiguation page -> search -> first hit is itself ambiguous -> first option
+    assert results['Mercury']['title'] == 'Mercury (planet)'
+    assert scraper.resolutions.get('wikipedia', 'Mercury')['value'] == 'Mercury (planet)'
+    # Missing page with no search hits is remembered as not found
+    assert results['Qwxyzzy gadget'] is None
+    assert scraper.resolutions.get('wikipedia', 'Qwxyzzy gadget')['value'] is None
+    # 1 title query + 1 extract request per downloaded article
+    assert len(client.requests) == 3
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("Wikipedia Bulk Fetch Test")
+    print("=" * 60)
+    failed = False
+    for test in (test_titles_resolve_in_one_query, test_extracts_follow_continuation, test_unresolved_titles_fall_back_to_search):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            print(f"✗ {test.__name__}: {e}")
+            failed = True
+    sys.exit(1 if failed else 0)
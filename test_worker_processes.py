@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test that worker processes never rebuild the Flask app
+
+Worker pools use the spawn start method, which re-imports the launching
+script in every worker. When the app is launched with `python app.py`,
+that script is app.py, so it must build nothing at import time. Each test
+starts a pool from a driver that stands in for app.py as the main script
+and checks, inside a worker, that the app module was not imported, that
+create_app() never ran, and that no embedding model or nested pool was
+started.
+
+Run directly (`python test_worker_processes.py`) or through pytest.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Evaluated inside a worker; True if the worker is clean
+PROBE = (
+    "'app' not in __import__('sys').modules"
+    " and getattr(__import__('sys').modules.get('__mp_main__'), 'pipeline', None) is None"
+    " and not __import__('multiprocessing').active_children()"
+)
+
+DRIVER = """
+import os
+import __main__
+
+# Spawned workers re-import this script; make it app.py, as under `python app.py`
+__main__.__file__ = os.path.abspath('app.py')
+
+from {module} import {pool_class}
+
+pool = {pool_class}({args})
+try:
+    print(pool._get_executor().submit(eval, {probe!r}).result())
+    print(pool._get_executor().submit(eval, {model_probe!r}).result())
+finally:
+    pool.shutdown()
+"""
+
+
+def run_worker_probe(module, pool_class, args='1', model_probe='True'):
+    """Start a pool in a fresh interpreter and return the worker's probe results"""
+    driver = DRIVER.format(module=module, pool_class=pool_class, args=args, probe=PROBE, model_probe=model_probe)
+    env = dict(os.environ, EMBEDDING_WARM_UP='True', PYTHONDONTWRITEBYTECODE='1')
+    result = subprocess.run(
+        [sys.executable, '-c', driver],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=300
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return result.stdout.split()[-2:]
+
+
+def test_comparison_workers_do_not_start_the_app():
+    clean, no_model = run_worker_probe(
+        'backend.comparison_pool', 'ComparisonWorkerPool',
+        model_probe="'sentence_transformers' not in __import__('sys').modules"
+    )
+    assert clean == 'True', "comparison worker ran app setup"
+    assert no_model == 'True', "comparison worker loaded an embedding model"
+
+
+def test_embedding_workers_do_not_start_the_app():
+    if importlib.util.find_spec('sentence_transformers') is None:
+        print("  (skipped: sentence-transformers not installed)")
+        return
+    clean, _ = run_worker_probe('backend.embedding_pool', 'EmbeddingWorkerPool', args='1, 1')
+    assert clean == 'True', "embedding worker ran app setup"
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("Worker Process Test")
+    print("=" * 60)
+    failed = False
+    for test in (test_comparison_workers_do_not_start_the_app, test_embedding_workers_do_not_start_the_app):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            print(f"✗ {test.__name__}: {e}")
+            failed = True
+    sys.exit(1 if failed else 0)